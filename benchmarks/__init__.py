@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Benchmarks measure the checked-out source, so `python -m benchmarks.<name>` works from the
+# repository root without installing the package
+SRC_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
@@ -0,0 +1,102 @@
+"""
+Measures cold import time of dillagent packages, each in a fresh interpreter, and checks that
+provider SDKs are not imported until a backend is used.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --repeat 10 --max-ms 500 --json imports.json
+
+Exits with status 1 when a module imports a forbidden package or its median import time is
+above --max-ms, so it can guard against regressions in CI.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+from . import SRC_PATH
+
+DEFAULT_MODULES = [
+    "dillagent.llm",
+    "dillagent.agents",
+    "dillagent.workflows",
+    "dillagent.agents.agents",
+    "dillagent.agents.executors",
+    "dillagent.workflows.graphs.executors",
+    "dillagent.workflows.signalFlows.executors",
+]
+
+# Only needed once a provider backend is constructed or a tool runs in a process pool
+DEFAULT_FORBIDDEN = ["openai", "anthropic", "httpx", "multiprocessing"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def probe(module: str) -> Dict[str, Any]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_PATH, env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def measure(module: str, repeat: int, forbidden: List[str], max_ms: Optional[float]) -> Dict[str, Any]:
+    # The first run writes the bytecode caches and is not timed
+    loaded = set(probe(module)["modules"])
+    timings = [probe(module)["seconds"] * 1000 for _ in range(repeat)]
+    leaked = [name for name in forbidden if name in loaded]
+    median_ms = statistics.median(timings)
+    failures = [f"imports {name}" for name in leaked]
+    if max_ms is not None and median_ms > max_ms:
+        failures.append(f"median {median_ms:.1f} ms > {max_ms:.1f} ms")
+    return {
+        "module": module,
+        "median_ms": median_ms,
+        "min_ms": min(timings),
+        "modules_loaded": len(loaded),
+        "forbidden_loaded": leaked,
+        "failures": failures,
+    }
+
+
+def print_table(results: List[Dict[str, Any]]):
+    header = f"{'module':<42} {'median ms':>10} {'min ms':>8} {'modules':>8}  status"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        status = "; ".join(r["failures"]) or "ok"
+        print(f"{r['module']:<42} {r['median_ms']:>10.1f} {r['min_ms']:>8.1f} {r['modules_loaded']:>8}  {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold import time of dillagent packages.")
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed imports per module.")
+    parser.add_argument("--forbidden", nargs="*", default=DEFAULT_FORBIDDEN, help="Packages that must not be imported.")
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail when a median import time is above this.")
+    parser.add_argument("--json", default=None, help="Write the results to this file.")
+    args = parser.parse_args()
+
+    results = [measure(module, args.repeat, args.forbidden, args.max_ms) for module in args.modules]
+    print_table(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    if any(r["failures"] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
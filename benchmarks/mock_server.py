@@ -0,0 +1,293 @@
+"""
+Local stand-in for an OpenAI-compatible server, used by the benchmarks.
+
+Serves POST /v1/chat/completions (streaming and not), POST /v1/completions and GET /v1/models
+with configurable latency, token generation rate and error injection. It listens on
+http://localhost:1234/v1 by default, the default `LLMConfig.path`.
+
+    python -m benchmarks.mock_server --latency lognormal:0.2:0.5 --tokens-per-second 80
+"""
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import random
+import socket
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+Responder = Callable[[Dict], str]
+
+DEFAULT_REPLY = '{"action": "Final Answer", "action_input": "ok"}'
+
+
+def default_responder(body: Dict) -> str:
+    """
+    Replies with a final answer, except to PlannerAgentGraphExecutor planner inputs, which get
+    every available agent scheduled (and never terminate, so runs use all iterations).
+    """
+    messages = body.get("messages") or []
+    last = messages[-1]["content"] if messages else body.get("prompt", "")
+    if isinstance(last, str) and "available_agents" in last:
+        try:
+            planner_input = json.loads(last)
+        except json.JSONDecodeError:
+            return DEFAULT_REPLY
+        names = [agent.split(":")[0] for agent in planner_input.get("available_agents", [])]
+        return json.dumps({
+            "next_executors": names,
+            **{f"{name}_input": "continue" for name in names},
+            "terminate": False,
+        })
+    return DEFAULT_REPLY
+
+
+def parse_latency(spec: str) -> Tuple:
+    """
+    Parses "fixed:S", "uniform:LOW:HIGH" or "lognormal:MEDIAN:SIGMA" (seconds).
+    """
+    kind, *params = spec.split(":")
+    values = tuple(float(p) for p in params)
+    expected = {"fixed": 1, "uniform": 2, "lognormal": 2}
+    if kind not in expected or len(values) != expected[kind]:
+        raise ValueError(f"Invalid latency '{spec}'. Use fixed:S, uniform:LOW:HIGH or lognormal:MEDIAN:SIGMA.")
+    return (kind,) + values
+
+
+def sample_latency(spec: Tuple, rng: random.Random) -> float:
+    kind = spec[0]
+    if kind == "fixed":
+        return spec[1]
+    if kind == "uniform":
+        return rng.uniform(spec[1], spec[2])
+    return spec[1] * math.exp(rng.gauss(0, spec[2]))
+
+
+class MockLLMServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 1234, latency: Tuple = ("fixed", 0.0), tokens_per_second: Optional[float] = None, error_rate: float = 0.0, error_status: int = 429, retry_after: Optional[float] = None, responder: Responder = default_responder, seed: Optional[int] = None):
+        """
+        Parameters:
+        - latency: Time to first token, as returned by parse_latency.
+        - tokens_per_second: Generation speed; replies take len(reply) / 4 tokens. None is instant.
+        - error_rate: Fraction of requests answered with error_status instead of a completion.
+        - retry_after: Retry-After header sent with injected errors.
+        - responder: Builds the reply text from the request body. Must be a module-level
+          function when the server runs in a separate process.
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.responder = responder
+        self.rng = random.Random(seed)
+        self.requests = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    async def serve(self, ready: Optional[asyncio.Event] = None):
+        server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        if ready is not None:
+            ready.set()
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                method, path, _ = request_line.split(" ", 2)
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        key, value = line.split(":", 1)
+                        headers[key.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+                await self._respond(method, path, body, writer)
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, method: str, path: str, raw_body: bytes, writer: asyncio.StreamWriter):
+        self.requests += 1
+        if method == "GET" and path.endswith("/models"):
+            return self._send_json(writer, 200, {"object": "list", "data": [{"id": "mock-model", "object": "model"}]})
+        if method != "POST" or not path.endswith(("/chat/completions", "/completions")):
+            return self._send_json(writer, 404, {"error": {"message": f"Unknown route {method} {path}"}})
+
+        body = json.loads(raw_body or b"{}")
+        await asyncio.sleep(sample_latency(self.latency, self.rng))
+        if self.error_rate and self.rng.random() < self.error_rate:
+            headers = {"retry-after": str(self.retry_after)} if self.retry_after is not None else {}
+            return self._send_json(writer, self.error_status, {"error": {"message": "Injected error", "type": "mock"}}, headers)
+
+        if path.endswith("/chat/completions"):
+            text = self.responder(body)
+            if body.get("stream"):
+                return await self._stream_chat(writer, body, text)
+            await self._generate(text)
+            return self._send_json(writer, 200, self._chat_completion(body, text))
+
+        prompts = body.get("prompt")
+        prompts = prompts if isinstance(prompts, list) else [prompts]
+        texts = [self.responder({**body, "prompt": prompt}) for prompt in prompts]
+        # A batched completion generates its prompts in parallel
+        await self._generate(max(texts, key=len))
+        return self._send_json(writer, 200, {
+            "id": f"cmpl-{self.requests}",
+            "object": "text_completion",
+            "created": int(time.time()),
+            "model": body.get("model", "mock-model"),
+            "choices": [{"index": i, "text": text, "finish_reason": "stop", "logprobs": None} for i, text in enumerate(texts)],
+            "usage": self._usage(" ".join(str(p) for p in prompts), "".join(texts)),
+        })
+
+    async def _generate(self, text: str):
+        if self.tokens_per_second:
+            await asyncio.sleep(self._tokens(text) / self.tokens_per_second)
+
+    async def _stream_chat(self, writer: asyncio.StreamWriter, body: Dict, text: str):
+        writer.write(
+            b"HTTP/1.1 200 OK\r\ncontent-type: text/event-stream\r\ntransfer-encoding: chunked\r\n\r\n"
+        )
+        # Roughly one token per chunk
+        for start in range(0, len(text), 4):
+            chunk = {
+                "id": f"chatcmpl-{self.requests}",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": body.get("model", "mock-model"),
+                "choices": [{"index": 0, "delta": {"content": text[start:start + 4]}, "finish_reason": None}],
+            }
+            self._write_chunk(writer, f"data: {json.dumps(chunk)}\n\n".encode())
+            await writer.drain()
+            if self.tokens_per_second:
+                await asyncio.sleep(1 / self.tokens_per_second)
+        self._write_chunk(writer, b"data: [DONE]\n\n")
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    def _write_chunk(self, writer: asyncio.StreamWriter, data: bytes):
+        writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+
+    def _chat_completion(self, body: Dict, text: str) -> Dict:
+        return {
+            "id": f"chatcmpl-{self.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "mock-model"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+            "usage": self._usage(json.dumps(body.get("messages", [])), text),
+        }
+
+    def _usage(self, prompt: str, completion: str) -> Dict:
+        prompt_tokens = self._tokens(prompt)
+        completion_tokens = self._tokens(completion)
+        return {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens, "total_tokens": prompt_tokens + completion_tokens}
+
+    @staticmethod
+    def _tokens(text: str) -> int:
+        return math.ceil(len(text) / 4)
+
+    def _send_json(self, writer: asyncio.StreamWriter, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(payload).encode()
+        extra = "".join(f"{key}: {value}\r\n" for key, value in (headers or {}).items())
+        writer.write(
+            f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+            f"content-type: application/json\r\ncontent-length: {len(data)}\r\n{extra}\r\n".encode() + data
+        )
+
+
+def _serve(kwargs: Dict):
+    asyncio.run(MockLLMServer(**kwargs).serve())
+
+
+class BackgroundServer:
+    """
+    Runs a MockLLMServer in a separate process, so it doesn't compete with the benchmarked code
+    for the event loop or the GIL.
+
+        with BackgroundServer(port=0, latency=("fixed", 0.05)) as server:
+            LLMConfig(path=server.base_url)
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Parameters: those of MockLLMServer. port=0 picks a free port.
+        """
+        if not kwargs.get("port"):
+            kwargs["port"] = _free_port(kwargs.get("host", "127.0.0.1"))
+        self.kwargs = kwargs
+        self.host = kwargs.get("host", "127.0.0.1")
+        self.port = kwargs["port"]
+        self._process: Optional[multiprocessing.Process] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    def start(self, timeout: float = 10.0):
+        self._process = multiprocessing.get_context("spawn").Process(target=_serve, args=(self.kwargs,), daemon=True)
+        self._process.start()
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                socket.create_connection((self.host, self.port), timeout=0.1).close()
+                return
+            except OSError:
+                if time.monotonic() > deadline or not self._process.is_alive():
+                    self.stop()
+                    raise RuntimeError(f"Mock server did not start on {self.base_url}.")
+                time.sleep(0.05)
+
+    def stop(self):
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+    def __enter__(self) -> "BackgroundServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def _free_port(host: str) -> int:
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible mock server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1234)
+    parser.add_argument("--latency", default="fixed:0", help="fixed:S, uniform:LOW:HIGH or lognormal:MEDIAN:SIGMA")
+    parser.add_argument("--tokens-per-second", type=float, default=None)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=429)
+    parser.add_argument("--retry-after", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    server = MockLLMServer(
+        args.host, args.port, parse_latency(args.latency), args.tokens_per_second,
+        args.error_rate, args.error_status, args.retry_after, seed=args.seed,
+    )
+    print(f"Serving on {server.base_url}")
+    asyncio.run(server.serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Runs benchmark scenarios against a local mock server and reports throughput, latency
+percentiles and memory.
+
+    python -m benchmarks.run
+    python -m benchmarks.run --scenarios wide_graph planner_graph --requests 200 --concurrency 32 \\
+        --latency lognormal:0.2:0.5 --tokens-per-second 100 --json results.json
+"""
+import argparse
+import asyncio
+import gc
+import json
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+from dillagent.llm import ClientPool
+from .mock_server import BackgroundServer, parse_latency
+from .scenarios import SCENARIOS, make_config, scenario_names
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def max_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and kilobytes on Linux
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+async def run_scenario(name: str, base_url: str, requests: int, concurrency: int, size: Optional[int], trace_memory: bool) -> Dict[str, Any]:
+    builder, default_size, calls_per_operation = SCENARIOS[name]
+    size = size or default_size
+    pool = ClientPool(max_connections=max(concurrency * 4, 100))
+    operation = builder(make_config(base_url, pool), size)
+    # Warm up connections and lazily built state before measuring
+    await operation()
+
+    gc.collect()
+    if trace_memory:
+        tracemalloc.start()
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def timed():
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await operation()
+            except Exception:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(timed() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    peak_traced = None
+    if trace_memory:
+        peak_traced = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+    await pool.aclose()
+
+    return {
+        "scenario": name,
+        "size": size,
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "seconds": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "llm_calls_per_second": len(latencies) * calls_per_operation(size) / elapsed if elapsed else 0.0,
+        "p50": percentile(latencies, 0.50),
+        "p99": percentile(latencies, 0.99),
+        "mean": statistics.fmean(latencies) if latencies else 0.0,
+        "max_rss_mb": max_rss_mb(),
+        "peak_traced_mb": peak_traced,
+    }
+
+
+def print_table(results: List[Dict[str, Any]]):
+    header = f"{'scenario':<15}{'size':>6}{'ok/s':>10}{'llm/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}{'rss MB':>9}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['scenario']:<15}{r['size']:>6}{r['throughput']:>10.1f}{r['llm_calls_per_second']:>10.1f}"
+            f"{r['p50'] * 1000:>10.1f}{r['p99'] * 1000:>10.1f}{r['errors']:>8}{r['max_rss_mb']:>9.1f}"
+        )
+
+
+async def run_all(args, base_url: str) -> List[Dict[str, Any]]:
+    results = []
+    for name in args.scenarios:
+        results.append(await run_scenario(name, base_url, args.requests, args.concurrency, args.size, args.trace_memory))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="dillagent benchmarks against a local mock server.")
+    parser.add_argument("--scenarios", nargs="+", choices=scenario_names(), default=scenario_names())
+    parser.add_argument("--requests", type=int, default=100, help="Operations per scenario.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Operations in flight at once.")
+    parser.add_argument("--size", type=int, default=None, help="Scenario size (graph width/depth, planner iterations, fan-out).")
+    parser.add_argument("--latency", default="fixed:0.02", help="fixed:S, uniform:LOW:HIGH or lognormal:MEDIAN:SIGMA")
+    parser.add_argument("--tokens-per-second", type=float, default=None)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=429)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--server", default=None, help="Use an already running server at this base URL.")
+    parser.add_argument("--trace-memory", action="store_true", help="Also report the tracemalloc peak (slower).")
+    parser.add_argument("--json", default=None, help="Write the results to this file.")
+    args = parser.parse_args()
+
+    if args.server:
+        results = asyncio.run(run_all(args, args.server))
+    else:
+        server = BackgroundServer(
+            port=0,
+            latency=parse_latency(args.latency),
+            tokens_per_second=args.tokens_per_second,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            seed=args.seed,
+        )
+        with server:
+            results = asyncio.run(run_all(args, server.base_url))
+
+    print_table(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
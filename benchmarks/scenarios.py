@@ -0,0 +1,135 @@
+"""
+Benchmark scenarios. Each scenario builds its objects once against the mock server and returns
+an `operation` coroutine function; the runner times many concurrent operations.
+"""
+from typing import Any, Awaitable, Callable, Dict, List
+from dillagent.agents.agents import StarterAgent
+from dillagent.agents.executors import BaseAgentExecutor
+from dillagent.dependencies.parsers.intermediate import JsonParser
+from dillagent.dependencies.prompts import MultiInputToolsSysPrompt
+from dillagent.dependencies.prompts.MultiAgentSupervisorSysPrompt import MultiAgentSupervisorSysPrompt
+from dillagent.llm import ClientPool, ConversationScope, LLMConfig, OpenAILLM
+from dillagent.models import DescribedModel, Field
+from dillagent.tools import tool
+from dillagent.workflows.graphs.executors import BaseAgentGraphExecutor, PlannerAgentGraphExecutor
+from dillagent.workflows.graphs.graphs import BaseAgentGraph
+from dillagent.workflows.signalFlows.executors import BaseSignalFlowExecutor
+from dillagent.workflows.signalFlows.signalFlows import BaseSignal, BaseSignalFlow
+
+Operation = Callable[[], Awaitable[Any]]
+
+
+class NoopSchema(DescribedModel):
+    query: str = Field(..., description="Anything.")
+
+
+@tool("Noop", "Does nothing.", NoopSchema)
+def noop(query: str):
+    return query
+
+
+class DataflowGraphExecutor(BaseAgentGraphExecutor):
+    async def run(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.run_iteration(input_data)
+
+
+def _executor(config: LLMConfig, name: str) -> BaseAgentExecutor:
+    agent = StarterAgent(OpenAILLM(config), [noop], JsonParser(), MultiInputToolsSysPrompt(f"You are {name}."), f"{name} agent", name=name)
+    return BaseAgentExecutor(agent)
+
+
+def starter_agent(config: LLMConfig, size: int) -> Operation:
+    executor = _executor(config, "Starter")
+
+    async def operation():
+        # Concurrent operations share the agent, so each keeps its own history
+        with ConversationScope():
+            return await executor.agent.run(prompt="Benchmark request")
+
+    return operation
+
+
+def wide_graph(config: LLMConfig, size: int) -> Operation:
+    """
+    One input agent fanning out to `size` agents that all feed one output agent.
+    """
+    graph = BaseAgentGraph()
+    source, sink = _executor(config, "Source"), _executor(config, "Sink")
+    for i in range(size):
+        middle = _executor(config, f"Worker{i}")
+        graph.add_edge(source, middle)
+        graph.add_edge(middle, sink)
+    executor = DataflowGraphExecutor(graph)
+
+    async def operation():
+        return (await executor.run_batch([{"Source_input": "Benchmark request"}]))[0]
+
+    return operation
+
+
+def deep_graph(config: LLMConfig, size: int) -> Operation:
+    """
+    A chain of `size` agents.
+    """
+    graph = BaseAgentGraph()
+    previous = _executor(config, "Step0")
+    for i in range(1, size):
+        current = _executor(config, f"Step{i}")
+        graph.add_edge(previous, current)
+        previous = current
+    executor = DataflowGraphExecutor(graph)
+
+    async def operation():
+        return (await executor.run_batch([{"Step0_input": "Benchmark request"}]))[0]
+
+    return operation
+
+
+def planner_graph(config: LLMConfig, size: int) -> Operation:
+    """
+    A planner scheduling a two-layer graph for `size` iterations.
+    """
+    planner_agent = StarterAgent(OpenAILLM(config), [], JsonParser(), MultiAgentSupervisorSysPrompt("You are the planner."), "planner", name="PlannerAgent")
+    graph = BaseAgentGraph()
+    graph.add_edge(_executor(config, "Research"), _executor(config, "Writer"))
+    executor = PlannerAgentGraphExecutor(graph, BaseAgentExecutor(planner_agent))
+
+    async def operation():
+        return (await executor.run_batch([{"PlannerAgent_input": "Benchmark request"}], max_iterations=size))[0]
+
+    return operation
+
+
+def signal_fanout(config: LLMConfig, size: int) -> Operation:
+    """
+    One signal triggering `size` flows, each of whose outputs triggers a collector flow.
+    """
+    flows = [BaseSignalFlow(f"Fan{i}", _executor(config, f"Fan{i}"), ["start"]) for i in range(size)]
+    collector = BaseSignalFlow("Collector", _executor(config, "Collector"), [f"Fan{i}.output" for i in range(size)])
+
+    async def operation():
+        signal_executor = BaseSignalFlowExecutor(num_workers=min(size, 64))
+        for flow in flows + [collector]:
+            signal_executor.register(flow)
+        with ConversationScope():
+            await signal_executor.run([BaseSignal.spawn("start", {"Fan_input": "Benchmark request"})])
+
+    return operation
+
+
+# name -> (builder, default size, LLM calls per operation)
+SCENARIOS: Dict[str, Any] = {
+    "starter_agent": (starter_agent, 1, lambda size: 1),
+    "wide_graph": (wide_graph, 16, lambda size: size + 2),
+    "deep_graph": (deep_graph, 16, lambda size: size),
+    "planner_graph": (planner_graph, 3, lambda size: 4 * size),
+    "signal_fanout": (signal_fanout, 32, lambda size: 2 * size),
+}
+
+
+def make_config(base_url: str, pool: ClientPool) -> LLMConfig:
+    return LLMConfig(model="mock-model", path=base_url, client_pool=pool)
+
+
+def scenario_names() -> List[str]:
+    return list(SCENARIOS)
@@ -0,0 +1,27 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agents import BaseAgent, StarterAgent
+    from .executors import BaseAgentExecutor, ReActAgentExecutor
+
+# Agents pull in pydantic and the tool machinery, so they are only imported on first access
+_LAZY = {
+    "BaseAgent": ".agents",
+    "StarterAgent": ".agents",
+    "BaseAgentExecutor": ".executors",
+    "ReActAgentExecutor": ".executors",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
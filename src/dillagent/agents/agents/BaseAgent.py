@@ -1,19 +1,38 @@
 from ...dependencies.prompts.BaseSysPrompt import BaseSysPrompt
 from ...dependencies.parsers.intermediate.BaseIntermediateParser import BaseIntermediateParser
-from typing import List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional
 from ...llm.LLM import LLM
 from abc import ABC, abstractmethod
 
+if TYPE_CHECKING:
+    from ...tools.Tool import Tool
+
 class BaseAgent(ABC):
     def __init__(self, llm: LLM, tools: List, intermediate_parser: BaseIntermediateParser, sys_prompt: BaseSysPrompt = None, name: str = "Base Agent"):
         self.llm = llm
         self.tools = tools
+        self.tool_registry = self._build_tool_registry(tools)
         self.sys_prompt = sys_prompt
         self.sys_prompt.generate_prompt(tools)
         self.llm.add_sys_prompt(self.sys_prompt.prompt_str)
         self.name = name
         self.intermediate_parser = intermediate_parser
 
+    def _build_tool_registry(self, tools: List) -> Dict[str, "Tool"]:
+        registry = {}
+        for tool in tools:
+            if tool.name in registry:
+                raise ValueError(f"Duplicate tool name '{tool.name}' registered on agent.")
+            registry[tool.name] = tool
+        return registry
+
     @abstractmethod
     async def run(self, *, prompt: Optional[str] = None, inputs: Optional[dict] = None) -> dict:
         pass
+
+    async def astream(self, *, prompt: Optional[str] = None, inputs: Optional[dict] = None) -> AsyncIterator[dict]:
+        """
+        Streaming variant of run yielding event dicts. Agents without token streaming
+        yield a single {"type": "output", "output": dict} event.
+        """
+        yield {"type": "output", "output": await self.run(prompt=prompt, inputs=inputs)}
@@ -1,13 +1,18 @@
-import asyncio
-from ...tools import Tool
 from .BaseAgent import BaseAgent
 from ...dependencies.prompts.BaseSysPrompt import BaseSysPrompt
 from ...dependencies.parsers.intermediate.BaseIntermediateParser import BaseIntermediateParser
-from typing import List, Optional
+from ...dependencies.policies.error.BaseErrorPolicy import BaseErrorPolicy
+from ...dependencies.policies.error.Deadline import Deadline
+from typing import AsyncIterator, List, Optional
 from ...llm.LLM import LLM
+from ...llm.ConversationScope import ConversationScope
+import asyncio
+
+# Queued after the last delta of a stream
+_STREAM_END = object()
 
 class StarterAgent(BaseAgent):
-    def __init__(self, llm: LLM, tools: List, intermediate_parser: BaseIntermediateParser, sys_prompt: BaseSysPrompt, input_description: str, name: str = "Starter Agent", logging_enabled=False, error_policy=None):
+    def __init__(self, llm: LLM, tools: List, intermediate_parser: BaseIntermediateParser, sys_prompt: BaseSysPrompt, input_description: str, name: str = "Starter Agent", logging_enabled=False, error_policy: Optional[BaseErrorPolicy] = None, tool_error_policy: Optional[BaseErrorPolicy] = None, fallback_llm: Optional[LLM] = None):
         """
         Initialize the BaseAgent with a list of tools and an optional initial prompt.
 
@@ -17,6 +22,10 @@ class StarterAgent(BaseAgent):
         - intermediate_parsser: The IntermediateParser instance to associate with this agent.
         - input_description: A description of what the input to this agent should be.
         - name: The agent's name to be used at runtime.
+        - error_policy: Policy (timeouts, retries, hedging) applied to LLM calls.
+        - tool_error_policy: Policy applied to tool calls. Tools don't inherit error_policy, since
+          retrying or hedging a tool with side effects would run it more than once.
+        - fallback_llm: LLM used when the primary LLM still fails under error_policy.
 
         Returns:
         None
@@ -25,6 +34,10 @@ class StarterAgent(BaseAgent):
         self.input_description = input_description
         self.logging_enabled = logging_enabled
         self.error_policy = error_policy
+        self.tool_error_policy = tool_error_policy
+        self.fallback_llm = fallback_llm
+        if fallback_llm is not None:
+            fallback_llm.add_sys_prompt(self.sys_prompt.prompt_str)
 
     async def run(self, *, prompt: Optional[str] = None, inputs: Optional[dict] = None):
         """
@@ -43,36 +56,134 @@ class StarterAgent(BaseAgent):
             formatted_prompt = inputs.get(f'{self.name}_input', '')
             if self.logging_enabled: print(self.llm.messages)
             if self.logging_enabled: print(formatted_prompt)
-            output = await self.llm.run(formatted_prompt)
+            output = await self._call_llm(formatted_prompt)
             if self.logging_enabled: print(output)
             return self.intermediate_parser.parse_values(output)
         
         # Otherwise, use the direct prompt
         elif prompt:
-            output = await self.llm.run(prompt)
+            output = await self._call_llm(prompt)
             return self.intermediate_parser.parse_values(output)
         
         # Handle the case where neither is provided
         else:
             raise ValueError("Either prompt or inputs must be provided")
         
+    async def _call_llm(self, prompt: str) -> str:
+        policy = self._policy(self.error_policy)
+        if policy is None:
+            return await self.llm.run(prompt)
+
+        fallback = None
+        if self.fallback_llm is not None:
+            fallback = lambda: self._isolated_call(self.fallback_llm, prompt)
+        # Attempts may be retried or raced against each other, so each one writes to its own
+        # copy of the history and only the winning attempt's history is kept
+        output, scope = await policy.execute(lambda: self._isolated_call(self.llm, prompt), fallback)
+        scope.commit()
+        return output
+
+    def _policy(self, policy: Optional[BaseErrorPolicy]) -> Optional[BaseErrorPolicy]:
+        # Without a policy, calls still have to respect an active Deadline
+        if policy is None and Deadline.remaining() is not None:
+            return BaseErrorPolicy()
+        return policy
+
+    async def _isolated_call(self, llm: LLM, prompt: str):
+        with ConversationScope() as scope:
+            return await llm.run(prompt), scope
+
+    async def astream(self, *, prompt: Optional[str] = None, inputs: Optional[dict] = None) -> AsyncIterator[dict]:
+        """
+        Streaming variant of run.
+
+        Yields events as the LLM generates:
+        - {"type": "token", "delta": str} for each text delta.
+        - {"type": "field", "name": str, "value": Any} as soon as the parser completes a field.
+        - {"type": "output", "output": dict} once with the fully parsed output.
+
+        Under an error policy (or an active Deadline), retries, hedging and the fallback LLM apply
+        until the first delta arrives; from then on the stream is committed to that attempt, and
+        the rest of it is only bounded by the Deadline.
+        """
+        if inputs:
+            prompt = inputs.get(f'{self.name}_input', '')
+            if self.logging_enabled: print(self.llm.messages)
+            if self.logging_enabled: print(prompt)
+        elif not prompt:
+            raise ValueError("Either prompt or inputs must be provided")
+
+        stream_parser = self.intermediate_parser.create_stream_parser()
+        async for delta in self._stream_llm(prompt):
+            yield {"type": "token", "delta": delta}
+            for name, value in stream_parser.feed(delta).items():
+                yield {"type": "field", "name": name, "value": value}
+
+        output = stream_parser.close()
+        if self.logging_enabled: print(output)
+        yield {"type": "output", "output": output}
+
+    async def _stream_llm(self, prompt: str) -> AsyncIterator[str]:
+        policy = self._policy(self.error_policy)
+        if policy is None:
+            async for delta in self.llm.astream(prompt):
+                yield delta
+            return
+
+        fallback = None
+        if self.fallback_llm is not None:
+            fallback = lambda: self._open_stream(self.fallback_llm, prompt)
+        first, deltas, pump, scope = await policy.execute(lambda: self._open_stream(self.llm, prompt), fallback)
+        try:
+            delta = first
+            while delta is not _STREAM_END:
+                yield delta
+                delta = await asyncio.wait_for(deltas.get(), Deadline.remaining())
+                if isinstance(delta, BaseException):
+                    raise delta
+            scope.commit()
+        finally:
+            pump.cancel()
+
+    async def _open_stream(self, llm: LLM, prompt: str):
+        """
+        Starts streaming from `llm` in its own ConversationScope and waits for the first delta,
+        so the error policy can time out, retry or hedge the attempt until then. Returns the first
+        delta, a queue receiving the rest, the task filling it and the scope.
+        """
+        deltas: asyncio.Queue = asyncio.Queue()
+
+        async def pump():
+            try:
+                async for delta in llm.astream(prompt):
+                    deltas.put_nowait(delta)
+                deltas.put_nowait(_STREAM_END)
+            except Exception as e:
+                deltas.put_nowait(e)
+
+        with ConversationScope() as scope:
+            task = asyncio.ensure_future(pump())
+        try:
+            first = await deltas.get()
+        except BaseException:
+            task.cancel()
+            raise
+        if isinstance(first, BaseException):
+            raise first
+        return first, deltas, task, scope
+
     async def use_tool(self, response, to_call, to_input):
-        for tool in self.tools:
-            if to_call == tool.name:
-                if isinstance(to_input, dict):
-                    if asyncio.iscoroutinefunction(tool.func):
-                        return await tool.func(**to_input)
-                    else:
-                        return tool.func(**to_input)
-                elif isinstance(to_input, list):
-                    raise ValueError("LLM produced list of parameters - invalid format. Must be a dict or single value.")
-                else:
-                    if asyncio.iscoroutinefunction(tool.func):
-                        return await tool.func(to_input)
-                    else:
-                        return tool.func(to_input)
-
-        raise KeyError(f"Tool '{to_call}' not found among registered tools.")
+        tool = self.tool_registry.get(to_call)
+        if tool is None:
+            raise KeyError(f"Tool '{to_call}' not found among registered tools.")
+        if isinstance(to_input, list):
+            raise ValueError("LLM produced list of parameters - invalid format. Must be a dict or single value.")
+
+        args, kwargs = tool.validate_input(to_input)
+        policy = self._policy(self.tool_error_policy)
+        if policy is None:
+            return await tool.arun(*args, **kwargs)
+        return await policy.execute(lambda: tool.arun(*args, **kwargs))
     
     def describe(self):
         return self.input_description
\ No newline at end of file
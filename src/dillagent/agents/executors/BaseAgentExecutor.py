@@ -1,4 +1,5 @@
-from typing import Dict, Any
+import asyncio
+from typing import AsyncIterator, Dict, Any, Optional
 from ...agents.agents.BaseAgent import BaseAgent
 
 class BaseAgentExecutor:
@@ -9,45 +10,112 @@ class BaseAgentExecutor:
         tool_name_key: str = "action",        # e.g., "tool", "action"
         tool_input_key: str = "action_input", # e.g., "tool_args"
         tool_output_key: str = None,           # e.g., "result", "observation", etc.
-        logging_enabled: bool = False
+        logging_enabled: bool = False,
+        early_tool_dispatch: bool = False
     ):
+        """
+        Parameters:
+        - early_tool_dispatch: In astream, start the tool as soon as its name and input fields are
+          complete instead of once the whole output parsed. The call may then run for an output
+          that later fails to parse, so only enable it for tools without side effects.
+        """
         self.agent = agent
         self.tool_indicator_key = tool_indicator_key
         self.tool_name_key = tool_name_key
         self.tool_input_key = tool_input_key
         self.tool_output_key = tool_output_key
         self.logging_enabled = logging_enabled
+        self.early_tool_dispatch = early_tool_dispatch
 
     async def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         output = await self.agent.run(inputs=inputs)
         if self.logging_enabled: print(output)
 
         # Check if tool usage is requested -> NEED TO CHANGE TO BOOLEAN
-        if self.tool_indicator_key and output.get(self.tool_indicator_key, False):
-            tool_name = output.get(self.tool_name_key)
-            tool_input = output.get(self.tool_input_key)
-
-            if not tool_name or tool_input is None:
-                raise ValueError(
-                    f"Tool call triggered but '{self.tool_name_key}' or '{self.tool_input_key}' is missing."
-                )
-
-            #Currently an agent shouldn't HAVE TO use a tool
-            if not hasattr(self.agent, "use_tool"):
-                raise NotImplementedError("Agent does not implement use_tool()")
-
-            observation = await self.agent.use_tool(
-                response=output,
-                to_call=tool_name,
-                to_input=tool_input
+        if self._requests_tool(output):
+            observation = await self._use_tool(output)
+            return self._merge_observation(output, observation)
+ 
+        return output
+
+    async def astream(self, inputs: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of run. Re-yields the agent's events, then the tool's observation if one
+        is requested. With early_tool_dispatch the tool starts as soon as its name and input fields
+        are complete, while the model may still be generating; if the parsed output then asks for
+        a different call, the early one is cancelled and the call is made again. The last event
+        is {"type": "output", "output": dict} with the same value run would return.
+        """
+        fields: Dict[str, Any] = {}
+        tool_task: Optional[asyncio.Task] = None
+        output = None
+        try:
+            async for event in self.agent.astream(inputs=inputs):
+                if event["type"] == "output":
+                    output = event["output"]
+                    continue
+                yield event
+                if event["type"] == "field":
+                    fields[event["name"]] = event["value"]
+                    if self.early_tool_dispatch and tool_task is None and self._tool_fields_ready(fields):
+                        tool_task = asyncio.ensure_future(self._use_tool(dict(fields)))
+
+            if self.logging_enabled: print(output)
+            if tool_task is not None and not self._same_tool_call(fields, output):
+                tool_task.cancel()
+                tool_task = None
+            if tool_task is None and self._requests_tool(output):
+                tool_task = asyncio.ensure_future(self._use_tool(output))
+            if tool_task is not None:
+                observation = await tool_task
+                yield {"type": "observation", "observation": observation}
+                output = self._merge_observation(output, observation)
+        finally:
+            if tool_task is not None and not tool_task.done():
+                tool_task.cancel()
+
+        yield {"type": "output", "output": output}
+
+    def _requests_tool(self, output: Dict[str, Any]) -> bool:
+        return bool(self.tool_indicator_key and output.get(self.tool_indicator_key, False))
+
+    def _tool_fields_ready(self, fields: Dict[str, Any]) -> bool:
+        return (
+            self._requests_tool(fields)
+            and self.tool_name_key in fields
+            and self.tool_input_key in fields
+        )
+
+    def _same_tool_call(self, fields: Dict[str, Any], output: Dict[str, Any]) -> bool:
+        return (
+            self._requests_tool(output)
+            and fields.get(self.tool_name_key) == output.get(self.tool_name_key)
+            and fields.get(self.tool_input_key) == output.get(self.tool_input_key)
+        )
+
+    async def _use_tool(self, output: Dict[str, Any]):
+        tool_name = output.get(self.tool_name_key)
+        tool_input = output.get(self.tool_input_key)
+
+        if not tool_name or tool_input is None:
+            raise ValueError(
+                f"Tool call triggered but '{self.tool_name_key}' or '{self.tool_input_key}' is missing."
             )
 
-            if self.tool_output_key:
-                return {
-                    self.tool_output_key: observation,
-                    **output
-                }
-            else:
-                return output
- 
-        return output
\ No newline at end of file
+        #Currently an agent shouldn't HAVE TO use a tool
+        if not hasattr(self.agent, "use_tool"):
+            raise NotImplementedError("Agent does not implement use_tool()")
+
+        return await self.agent.use_tool(
+            response=output,
+            to_call=tool_name,
+            to_input=tool_input
+        )
+
+    def _merge_observation(self, output: Dict[str, Any], observation) -> Dict[str, Any]:
+        if self.tool_output_key:
+            return {
+                self.tool_output_key: observation,
+                **output
+            }
+        return output
@@ -0,0 +1,162 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
+from ...agents.agents.BaseAgent import BaseAgent
+from .BaseAgentExecutor import BaseAgentExecutor
+
+class ReActAgentExecutor(BaseAgentExecutor):
+    """
+    Iterative executor: LLM -> tools -> observation -> LLM ... until the agent gives a final answer.
+
+    Each turn the agent may return one action ({"action": ..., "action_input": ...}) or several
+    independent ones under `actions_key`; these run concurrently and all their observations are
+    sent back in a single message. Use it with `MultiInputToolsSysPrompt(header, parallel_actions=True)`,
+    passing it the same keys and final answer action.
+
+    The returned output is the agent's final answer turn. If a step or token limit stops the loop
+    first, the last turn is returned with a "stop_reason" key ("max_steps" or "max_tokens").
+    """
+
+    def __init__(
+        self,
+        agent: BaseAgent,
+        tool_indicator_key: str = None,
+        tool_name_key: str = "action",
+        tool_input_key: str = "action_input",
+        tool_output_key: str = None,
+        logging_enabled: bool = False,
+        actions_key: str = "actions",
+        final_answer_action: str = "Final Answer",
+        max_steps: int = 8,
+        max_tokens: Optional[int] = None,
+        max_parallel_tools: Optional[int] = None
+    ):
+        """
+        Parameters:
+        - actions_key: Key holding a list of actions to run concurrently.
+        - final_answer_action: Action name that ends the loop.
+        - max_steps: Maximum number of LLM turns per run.
+        - max_tokens: Maximum prompt + completion tokens spent by the agent's LLM per run, or None.
+        - max_parallel_tools: Maximum number of tool calls running at once, or None for no limit.
+
+        The other parameters are the same as BaseAgentExecutor's. When tool_output_key is set, the
+        observations of the last tool step are returned under it.
+        """
+        super().__init__(agent, tool_indicator_key, tool_name_key, tool_input_key, tool_output_key, logging_enabled)
+        if max_steps < 1:
+            raise ValueError("max_steps must be at least 1.")
+        self.actions_key = actions_key
+        self.final_answer_action = final_answer_action
+        self.max_steps = max_steps
+        self.max_tokens = max_tokens
+        self.max_parallel_tools = max_parallel_tools
+
+    async def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        output = await self.agent.run(inputs=inputs)
+        steps = 1
+        tokens = self._last_turn_tokens()
+        observations = None
+        while True:
+            if self.logging_enabled: print(output)
+            actions = self._get_actions(output)
+            if not actions:
+                return self._finish(output, observations)
+            stop_reason = self._stop_reason(steps, tokens)
+            if stop_reason:
+                return self._finish(output, observations, stop_reason)
+
+            observations = await self._run_actions(actions)
+            output = await self.agent.run(prompt=self._observation_prompt(actions, observations))
+            steps += 1
+            tokens += self._last_turn_tokens()
+
+    async def astream(self, inputs: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of run. Re-yields every turn's events tagged with "step", then one
+        {"type": "observation", "step": n, "observation": [...]} event per tool step. The last
+        event is {"type": "output", "output": dict} with the same value run would return.
+        """
+        turn_kwargs: Dict[str, Any] = {"inputs": inputs}
+        steps = 0
+        tokens = 0
+        observations = None
+        while True:
+            output = None
+            async for event in self.agent.astream(**turn_kwargs):
+                if event["type"] == "output":
+                    output = event["output"]
+                    continue
+                yield {**event, "step": steps}
+            steps += 1
+            tokens += self._last_turn_tokens()
+
+            if self.logging_enabled: print(output)
+            actions = self._get_actions(output)
+            stop_reason = self._stop_reason(steps, tokens) if actions else None
+            if not actions or stop_reason:
+                yield {"type": "output", "output": self._finish(output, observations, stop_reason)}
+                return
+
+            observations = await self._run_actions(actions)
+            yield {"type": "observation", "step": steps - 1, "observation": observations}
+            turn_kwargs = {"prompt": self._observation_prompt(actions, observations)}
+
+    def _requests_tool(self, output: Dict[str, Any]) -> bool:
+        if self.tool_indicator_key:
+            return super()._requests_tool(output)
+        tool_name = output.get(self.tool_name_key)
+        return bool(tool_name) and tool_name != self.final_answer_action
+
+    def _get_actions(self, output: Dict[str, Any]) -> List[Dict[str, Any]]:
+        actions = output.get(self.actions_key)
+        if isinstance(actions, dict):
+            actions = [actions]
+        if isinstance(actions, list):
+            return [action for action in actions if isinstance(action, dict) and self._requests_tool(action)]
+        if self._requests_tool(output):
+            return [output]
+        return []
+
+    def _stop_reason(self, steps: int, tokens: int) -> Optional[str]:
+        if steps >= self.max_steps:
+            return "max_steps"
+        if self.max_tokens is not None and tokens >= self.max_tokens:
+            return "max_tokens"
+        return None
+
+    def _last_turn_tokens(self) -> int:
+        usage = getattr(self.agent.llm, "last_usage", None) or {}
+        return (usage.get("prompt_tokens") or 0) + (usage.get("completion_tokens") or 0)
+
+    async def _run_actions(self, actions: List[Dict[str, Any]]) -> List[Any]:
+        semaphore = asyncio.Semaphore(self.max_parallel_tools) if self.max_parallel_tools else None
+
+        async def run_action(action):
+            try:
+                if semaphore is None:
+                    return await self._use_tool(action)
+                async with semaphore:
+                    return await self._use_tool(action)
+            except Exception as e:
+                # Reported back to the model so it can correct the call
+                return f"Error: {e}"
+
+        return await asyncio.gather(*(run_action(action) for action in actions))
+
+    def _observation_prompt(self, actions: List[Dict[str, Any]], observations: List[Any]) -> str:
+        results = [
+            {
+                self.tool_name_key: action.get(self.tool_name_key),
+                self.tool_input_key: action.get(self.tool_input_key),
+                "observation": observation,
+            }
+            for action, observation in zip(actions, observations)
+        ]
+        return "Observation: " + json.dumps(results, ensure_ascii=False, default=str)
+
+    def _finish(self, output: Dict[str, Any], observations: Optional[List[Any]], stop_reason: Optional[str] = None) -> Dict[str, Any]:
+        if observations is not None:
+            output = self._merge_observation(output, observations)
+        if stop_reason:
+            output = {**output, "stop_reason": stop_reason}
+        return output
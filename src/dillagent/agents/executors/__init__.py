@@ -1 +1,2 @@
 from .BaseAgentExecutor import BaseAgentExecutor
+from .ReActAgentExecutor import ReActAgentExecutor
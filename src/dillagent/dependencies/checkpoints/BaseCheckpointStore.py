@@ -0,0 +1,107 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+
+class BaseCheckpointStore(ABC):
+    """
+    Persists run checkpoints (JSON-serializable dicts) by run id.
+
+    `save_nowait` hands the checkpoint to a background thread that serializes and writes it, so
+    the event loop isn't blocked; the caller must not modify the checkpoint afterwards. If a run
+    checkpoints faster than the store can write, only its latest checkpoint is written. Call
+    `flush` to wait for pending writes; it raises the error of any write that failed since the
+    last flush. Values that aren't JSON serializable are stored as their `str()`, so a run
+    doesn't fail on a checkpoint, but `load` returns them as strings.
+
+    Subclasses implement the blocking `_write`, `_read`, `_delete` and `_list_runs`.
+    """
+
+    def __init__(self):
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._writers: Dict[str, asyncio.Task] = {}
+        # run id -> first write error not yet raised by flush
+        self._errors: Dict[str, BaseException] = {}
+
+    def save_nowait(self, run_id: str, checkpoint: Dict[str, Any]):
+        self._pending[run_id] = checkpoint
+        writer = self._writers.get(run_id)
+        if writer is None or writer.done():
+            if writer is not None:
+                self._keep_error(run_id, writer)
+            self._writers[run_id] = asyncio.ensure_future(self._drain(run_id))
+
+    async def save(self, run_id: str, checkpoint: Dict[str, Any]):
+        self.save_nowait(run_id, checkpoint)
+        await self.flush(run_id)
+
+    async def _drain(self, run_id: str):
+        while run_id in self._pending:
+            await asyncio.to_thread(self._serialize_and_write, run_id, self._pending.pop(run_id))
+
+    def _serialize_and_write(self, run_id: str, checkpoint: Dict[str, Any]):
+        self._write(run_id, self._serialize(checkpoint))
+
+    @staticmethod
+    def _serialize(checkpoint: Dict[str, Any]) -> str:
+        return json.dumps(checkpoint, separators=(",", ":"), default=str)
+
+    def _keep_error(self, run_id: str, writer: asyncio.Task):
+        if not writer.cancelled() and writer.exception() is not None:
+            self._errors.setdefault(run_id, writer.exception())
+
+    async def flush(self, run_id: Optional[str] = None):
+        """
+        Waits until pending checkpoints (of `run_id`, or of every run) are written, then raises
+        the first error of their writes, if any.
+        """
+        writers = [self._writers.get(run_id)] if run_id is not None else list(self._writers.values())
+        writers = [writer for writer in writers if writer is not None]
+        if writers:
+            await asyncio.gather(*writers, return_exceptions=True)
+        for key, writer in list(self._writers.items()):
+            if writer.done():
+                del self._writers[key]
+                self._keep_error(key, writer)
+
+        if run_id is not None:
+            error = self._errors.pop(run_id, None)
+        else:
+            errors, self._errors = list(self._errors.values()), {}
+            error = errors[0] if errors else None
+        if error is not None:
+            raise error
+
+    async def load(self, run_id: str) -> Optional[Dict[str, Any]]:
+        pending = self._pending.get(run_id)
+        if pending is not None:
+            data = await asyncio.to_thread(self._serialize, pending)
+        else:
+            await self.flush(run_id)
+            data = await asyncio.to_thread(self._read, run_id)
+        return json.loads(data) if data is not None else None
+
+    async def delete(self, run_id: str):
+        await self.flush(run_id)
+        await asyncio.to_thread(self._delete, run_id)
+
+    async def list_runs(self) -> List[str]:
+        await self.flush()
+        return await asyncio.to_thread(self._list_runs)
+
+    @abstractmethod
+    def _write(self, run_id: str, data: str):
+        pass
+
+    @abstractmethod
+    def _read(self, run_id: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def _delete(self, run_id: str):
+        pass
+
+    @abstractmethod
+    def _list_runs(self) -> List[str]:
+        pass
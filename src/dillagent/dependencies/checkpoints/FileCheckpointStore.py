@@ -0,0 +1,54 @@
+import os
+import re
+from typing import List, Optional
+from .BaseCheckpointStore import BaseCheckpointStore
+
+
+class FileCheckpointStore(BaseCheckpointStore):
+    """
+    Keeps one JSON file per run in a directory. Files are replaced atomically, so a crash
+    mid-write leaves the previous checkpoint intact.
+    """
+
+    SUFFIX = ".json"
+
+    def __init__(self, directory: str):
+        """
+        Parameters:
+        - directory: Directory holding the checkpoint files. Created if missing.
+        """
+        super().__init__()
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, run_id: str) -> str:
+        if not re.fullmatch(r"[\w.-]+", run_id) or run_id.startswith("."):
+            raise ValueError(f"Invalid run id '{run_id}'. Use letters, digits, '_', '-' or '.'.")
+        return os.path.join(self.directory, run_id + self.SUFFIX)
+
+    def _write(self, run_id: str, data: str):
+        path = self._path(run_id)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _read(self, run_id: str) -> Optional[str]:
+        try:
+            with open(self._path(run_id), encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _delete(self, run_id: str):
+        try:
+            os.remove(self._path(run_id))
+        except FileNotFoundError:
+            pass
+
+    def _list_runs(self) -> List[str]:
+        return sorted(
+            name[:-len(self.SUFFIX)] for name in os.listdir(self.directory) if name.endswith(self.SUFFIX)
+        )
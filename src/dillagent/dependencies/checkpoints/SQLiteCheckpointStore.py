@@ -0,0 +1,52 @@
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+from .BaseCheckpointStore import BaseCheckpointStore
+
+
+class SQLiteCheckpointStore(BaseCheckpointStore):
+    """
+    Keeps checkpoints in a SQLite table, one row per run.
+    """
+
+    def __init__(self, path: str):
+        """
+        Parameters:
+        - path: SQLite database file. Created if missing.
+        """
+        super().__init__()
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db_lock = threading.Lock()
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints (run_id TEXT PRIMARY KEY, updated REAL, data TEXT)"
+        )
+        self._db.commit()
+
+    def _write(self, run_id: str, data: str):
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO checkpoints (run_id, updated, data) VALUES (?, ?, ?)",
+                (run_id, time.time(), data)
+            )
+            self._db.commit()
+
+    def _read(self, run_id: str) -> Optional[str]:
+        with self._db_lock:
+            row = self._db.execute("SELECT data FROM checkpoints WHERE run_id = ?", (run_id,)).fetchone()
+        return row[0] if row is not None else None
+
+    def _delete(self, run_id: str):
+        with self._db_lock:
+            self._db.execute("DELETE FROM checkpoints WHERE run_id = ?", (run_id,))
+            self._db.commit()
+
+    def _list_runs(self) -> List[str]:
+        with self._db_lock:
+            rows = self._db.execute("SELECT run_id FROM checkpoints ORDER BY updated").fetchall()
+        return [row[0] for row in rows]
+
+    def close(self):
+        with self._db_lock:
+            self._db.close()
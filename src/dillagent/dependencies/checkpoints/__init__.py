@@ -0,0 +1,3 @@
+from .BaseCheckpointStore import BaseCheckpointStore
+from .FileCheckpointStore import FileCheckpointStore
+from .SQLiteCheckpointStore import SQLiteCheckpointStore
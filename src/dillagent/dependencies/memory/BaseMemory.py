@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple
+
+
+class BaseMemory(ABC):
+    """
+    Decides which part of an LLM's message history is kept and sent on the next call.
+    Leading system messages are always pinned and never trimmed.
+    """
+
+    @abstractmethod
+    async def compact(self, messages: List[Dict]) -> List[Dict]:
+        """
+        Returns the history to keep, given the full current history (latest prompt last).
+        """
+        pass
+
+    def _split_pinned(self, messages: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        index = 0
+        while index < len(messages) and messages[index].get("role") == "system":
+            index += 1
+        return messages[:index], messages[index:]
+
+    def _align_to_user(self, messages: List[Dict]) -> List[Dict]:
+        # Never start the window on an assistant reply; some providers reject that.
+        # The latest message is always kept.
+        index = 0
+        while index < len(messages) - 1 and messages[index].get("role") != "user":
+            index += 1
+        return messages[index:]
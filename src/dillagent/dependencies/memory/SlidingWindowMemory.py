@@ -0,0 +1,19 @@
+from typing import Dict, List
+from .BaseMemory import BaseMemory
+
+
+class SlidingWindowMemory(BaseMemory):
+    def __init__(self, max_messages: int):
+        """
+        Parameters:
+        - max_messages: Maximum number of non-system messages kept in history.
+        """
+        if max_messages < 1:
+            raise ValueError("max_messages must be at least 1.")
+        self.max_messages = max_messages
+
+    async def compact(self, messages: List[Dict]) -> List[Dict]:
+        pinned, history = self._split_pinned(messages)
+        if len(history) <= self.max_messages:
+            return messages
+        return pinned + self._align_to_user(history[-self.max_messages:])
@@ -0,0 +1,51 @@
+from typing import Awaitable, Callable, Dict, List, Optional
+from .TokenBudgetMemory import TokenBudgetMemory
+from .TokenCounter import TokenCounter
+
+
+class SummarizingMemory(TokenBudgetMemory):
+    """
+    Token budget memory that folds trimmed messages into a rolling summary instead of dropping them.
+    The summary is kept as a pinned system message right after the system prompt.
+    """
+
+    SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+    def __init__(self, max_tokens: int, summarizer: Callable[[str], Awaitable[str]], token_counter: Optional[TokenCounter] = None, keep_ratio: float = 0.5):
+        """
+        Parameters:
+        - max_tokens: Token budget that triggers summarization when exceeded.
+        - summarizer: Async callable taking a summarization prompt and returning the summary text,
+          e.g. the `run` method of a dedicated LLM.
+        - token_counter: TokenCounter used to measure messages.
+        - keep_ratio: Fraction of the budget left for verbatim recent messages after summarizing.
+        """
+        super().__init__(max_tokens, token_counter)
+        self.summarizer = summarizer
+        self.keep_ratio = keep_ratio
+
+    async def compact(self, messages: List[Dict]) -> List[Dict]:
+        if self.token_counter.count_messages(messages) <= self.max_tokens:
+            return messages
+
+        pinned, history = self._split_pinned(messages)
+        previous_summary = None
+        if pinned and pinned[-1]["content"].startswith(self.SUMMARY_PREFIX):
+            previous_summary = pinned.pop()["content"][len(self.SUMMARY_PREFIX):]
+
+        budget = int(self.max_tokens * self.keep_ratio) - self.token_counter.count_messages(pinned)
+        kept, dropped = self._trim(history, budget)
+        if not dropped:
+            return messages
+
+        summary = await self.summarizer(self._build_summary_prompt(previous_summary, dropped))
+        return pinned + [{"role": "system", "content": self.SUMMARY_PREFIX + summary}] + kept
+
+    def _build_summary_prompt(self, previous_summary: Optional[str], dropped: List[Dict]) -> str:
+        prompt = "Summarize the following conversation concisely, keeping every fact needed to continue it.\n\n"
+        if previous_summary:
+            prompt += f"Existing summary:\n{previous_summary}\n\n"
+        prompt += "New messages:\n"
+        for message in dropped:
+            prompt += f"{message['role']}: {message['content']}\n"
+        return prompt
@@ -0,0 +1,35 @@
+from typing import Dict, List, Optional, Tuple
+from .BaseMemory import BaseMemory
+from .TokenCounter import TokenCounter
+
+
+class TokenBudgetMemory(BaseMemory):
+    def __init__(self, max_tokens: int, token_counter: Optional[TokenCounter] = None):
+        """
+        Parameters:
+        - max_tokens: Token budget for the whole history, pinned system messages included.
+        - token_counter: TokenCounter used to measure messages. Defaults to the character estimate.
+        """
+        self.max_tokens = max_tokens
+        self.token_counter = token_counter or TokenCounter()
+
+    async def compact(self, messages: List[Dict]) -> List[Dict]:
+        pinned, history = self._split_pinned(messages)
+        kept, _ = self._trim(history, self.max_tokens - self.token_counter.count_messages(pinned))
+        return pinned + kept
+
+    def _trim(self, history: List[Dict], budget: int) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Splits history into (kept, dropped) so that kept is the longest suffix that fits the budget.
+        """
+        used = 0
+        start = len(history)
+        while start > 0:
+            cost = self.token_counter.count_message(history[start - 1])
+            # The latest message is kept even if it alone exceeds the budget
+            if used + cost > budget and start < len(history):
+                break
+            used += cost
+            start -= 1
+        kept = self._align_to_user(history[start:])
+        return kept, history[:len(history) - len(kept)]
@@ -0,0 +1,54 @@
+import math
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+
+class TokenCounter:
+    """
+    Counts tokens locally so memory trimming and usage estimates don't need a round trip
+    to the provider. Falls back to a ~4 characters per token estimate when no tokenizer is given.
+
+    The estimate is the default on purpose: the tokenizer depends on the model, and loading one
+    by name may download it, which LLM construction shouldn't do implicitly. Trimming and TPM
+    estimates are therefore approximate unless a counter built with a tokenizer (e.g.
+    `TokenCounter.from_pretrained(...)` or a tokenizer.json path) is passed as the LLM's or
+    memory's `token_counter`. Providers' reported usage is used whenever it is available.
+    """
+
+    def __init__(self, tokenizer=None, message_overhead: int = 4, cache_size: int = 4096):
+        """
+        Parameters:
+        - tokenizer: A `tokenizers.Tokenizer`, a path to a tokenizer.json file, or None for the estimate.
+        - message_overhead: Tokens added per chat message for role/formatting markers.
+        - cache_size: Number of distinct strings whose counts are memoized.
+        """
+        if isinstance(tokenizer, str):
+            from tokenizers import Tokenizer
+            tokenizer = Tokenizer.from_file(tokenizer)
+        self.tokenizer = tokenizer
+        self.message_overhead = message_overhead
+        self._count = lru_cache(maxsize=cache_size)(self._count_uncached)
+
+    @classmethod
+    def from_pretrained(cls, identifier: str, **kwargs) -> "TokenCounter":
+        from tokenizers import Tokenizer
+        return cls(Tokenizer.from_pretrained(identifier), **kwargs)
+
+    def _count_uncached(self, text: str) -> int:
+        if self.tokenizer is None:
+            return math.ceil(len(text) / 4)
+        return len(self.tokenizer.encode(text, add_special_tokens=False).ids)
+
+    def count(self, text: Optional[str]) -> int:
+        if not text:
+            return 0
+        return self._count(text)
+
+    def count_message(self, message: Dict) -> int:
+        content = message.get("content")
+        if not isinstance(content, str):
+            content = str(content)
+        return self.count(content) + self.message_overhead
+
+    def count_messages(self, messages: List[Dict]) -> int:
+        return sum(self.count_message(message) for message in messages)
@@ -0,0 +1,5 @@
+from .BaseMemory import BaseMemory
+from .TokenCounter import TokenCounter
+from .SlidingWindowMemory import SlidingWindowMemory
+from .TokenBudgetMemory import TokenBudgetMemory
+from .SummarizingMemory import SummarizingMemory
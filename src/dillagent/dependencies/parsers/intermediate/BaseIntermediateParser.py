@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from .BaseStreamParser import BaseStreamParser
+from .BufferedStreamParser import BufferedStreamParser
 
 class BaseIntermediateParser(ABC):
     def __init__(self, state_keys=None):
@@ -11,6 +13,13 @@ class BaseIntermediateParser(ABC):
         """
         pass
 
+    def create_stream_parser(self) -> BaseStreamParser:
+        """
+        Returns a parser for a single streamed response. Subclasses that can parse
+        incrementally override this; the default buffers and calls parse_values on close.
+        """
+        return BufferedStreamParser(self)
+
     def create_state_dict(self) -> dict:
         if not self.state_keys:
             raise KeyError("No state keys defined for this parser.")
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+
+class BaseStreamParser(ABC):
+    """
+    Stateful parser fed with LLM output chunks as they arrive.
+    Created per response through BaseIntermediateParser.create_stream_parser().
+    """
+
+    def __init__(self):
+        self.fields = {}
+        self.complete = False
+
+    @abstractmethod
+    def feed(self, chunk: str) -> dict:
+        """
+        Consumes the next chunk and returns the fields completed by it (possibly empty).
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> dict:
+        """
+        Signals the end of the response and returns the full parsed result.
+        """
+        pass
@@ -0,0 +1,22 @@
+from .BaseStreamParser import BaseStreamParser
+
+
+class BufferedStreamParser(BaseStreamParser):
+    """
+    Fallback stream parser for parsers without incremental support: buffers the
+    chunks and parses everything on close.
+    """
+
+    def __init__(self, parser):
+        super().__init__()
+        self.parser = parser
+        self._chunks = []
+
+    def feed(self, chunk: str) -> dict:
+        self._chunks.append(chunk)
+        return {}
+
+    def close(self) -> dict:
+        self.fields = self.parser.parse_values("".join(self._chunks))
+        self.complete = True
+        return self.fields
@@ -1,5 +1,6 @@
 import json
 from .BaseIntermediateParser import BaseIntermediateParser
+from .JsonStreamParser import JsonStreamParser
 
 class JsonParser(BaseIntermediateParser):
     def __init__(self, state_keys=None):
@@ -23,3 +24,6 @@ class JsonParser(BaseIntermediateParser):
         result = parsed
 
         return result
+
+    def create_stream_parser(self) -> JsonStreamParser:
+        return JsonStreamParser(self)
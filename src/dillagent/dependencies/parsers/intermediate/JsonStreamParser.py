@@ -0,0 +1,80 @@
+import json
+from .BaseStreamParser import BaseStreamParser
+
+
+class JsonStreamParser(BaseStreamParser):
+    """
+    Incrementally scans streamed LLM output for the first JSON object and emits each
+    top-level field as soon as its value is complete.
+    """
+
+    def __init__(self, parser):
+        super().__init__()
+        self.parser = parser
+        self._text = []
+        self._member = []
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._failed = False
+
+    def feed(self, chunk: str) -> dict:
+        self._text.append(chunk)
+        if self.complete or self._failed:
+            return {}
+
+        new_fields = {}
+        member = self._member
+        for char in chunk:
+            if not self._started:
+                if char == '{':
+                    self._started = True
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                member.append(char)
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+
+            # A comma or the closing brace at the top level ends the current member
+            if (self._depth == 1 and char == ',') or self._depth == 0:
+                self._emit_member(new_fields)
+                if self._depth == 0:
+                    self.complete = True
+                    break
+            else:
+                member.append(char)
+
+        self.fields.update(new_fields)
+        return new_fields
+
+    def _emit_member(self, new_fields: dict):
+        text = "".join(self._member).strip()
+        self._member.clear()
+        if not text:
+            return
+        try:
+            new_fields.update(json.loads("{" + text + "}"))
+        except json.JSONDecodeError:
+            # Leave it to the full parse on close
+            self._failed = True
+
+    def close(self) -> dict:
+        if not self.complete or self._failed:
+            self.fields = self.parser.parse_values("".join(self._text))
+            self.complete = True
+        return self.fields
@@ -1,2 +1,5 @@
 from .BaseIntermediateParser import BaseIntermediateParser
 from .JsonParser import JsonParser
+from .BaseStreamParser import BaseStreamParser
+from .BufferedStreamParser import BufferedStreamParser
+from .JsonStreamParser import JsonStreamParser
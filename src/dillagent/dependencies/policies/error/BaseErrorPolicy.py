@@ -1,6 +1,61 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+from .Deadline import Deadline
+
+
 class BaseErrorPolicy():
-    def __init__(self, policy):
+    """
+    Runs a call once, bounded by a per-call timeout and the active Deadline, and falls back to
+    an alternative call if it fails. Subclasses add retries and hedging.
+    """
+
+    def __init__(self, policy=None, timeout: Optional[float] = None):
+        """
+        Parameters:
+        - policy: Free-form value kept for custom policies; returned by get_policy.
+        - timeout: Seconds allowed per attempt, or None to rely on the Deadline only.
+        """
         self.policy = policy
+        self.timeout = timeout
     
     def get_policy(self):
-        return self.policy
\ No newline at end of file
+        return self.policy
+
+    async def execute(self, call: Callable[[], Awaitable[Any]], fallback: Optional[Callable[[], Awaitable[Any]]] = None) -> Any:
+        """
+        Runs `call()` under this policy. If it still fails (including timeouts) and `fallback` is
+        given, returns `fallback()` instead, as long as the deadline allows.
+        """
+        try:
+            return await self._run(call)
+        except Exception:
+            if fallback is None or self._remaining_timeout() == 0:
+                raise
+            return await self._with_timeout(fallback, self._remaining_timeout())
+
+    async def _run(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        return await self._attempt(call)
+
+    async def _attempt(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        return await self._with_timeout(call, self._attempt_timeout())
+
+    async def _with_timeout(self, call: Callable[[], Awaitable[Any]], timeout: Optional[float]) -> Any:
+        if timeout is None:
+            return await call()
+        if timeout <= 0:
+            raise asyncio.TimeoutError("Deadline exceeded before the call could start.")
+        return await asyncio.wait_for(call(), timeout)
+
+    def _remaining_timeout(self) -> Optional[float]:
+        remaining = Deadline.remaining()
+        if remaining is None:
+            return None
+        return max(remaining, 0)
+
+    def _attempt_timeout(self) -> Optional[float]:
+        remaining = self._remaining_timeout()
+        if remaining is None:
+            return self.timeout
+        if self.timeout is None:
+            return remaining
+        return min(self.timeout, remaining)
@@ -0,0 +1,45 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+_active_deadline: ContextVar[Optional[float]] = ContextVar("dillagent_deadline", default=None)
+
+
+class Deadline:
+    """
+    Sets an absolute deadline for everything run inside it, including asyncio tasks spawned
+    from it. Nested deadlines can only shorten the remaining time. Error policies bound
+    every call by the remaining time and fail fast once it has passed.
+
+    Usage:
+        with Deadline(30):
+            await graph_executor.run(...)
+    """
+
+    def __init__(self, seconds: Optional[float]):
+        self.seconds = seconds
+        self._token = None
+
+    @staticmethod
+    def remaining() -> Optional[float]:
+        """
+        Seconds left before the active deadline, or None when no deadline is set.
+        """
+        deadline = _active_deadline.get()
+        if deadline is None:
+            return None
+        return deadline - time.monotonic()
+
+    def __enter__(self) -> "Deadline":
+        if self.seconds is not None:
+            deadline = time.monotonic() + self.seconds
+            current = _active_deadline.get()
+            if current is not None:
+                deadline = min(deadline, current)
+            self._token = _active_deadline.set(deadline)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._token is not None:
+            _active_deadline.reset(self._token)
+            self._token = None
@@ -0,0 +1,90 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Optional, Tuple, Type
+from .RetryPolicy import RetryPolicy
+from ....tracing.Tracer import Tracer
+
+
+class HedgedRequestPolicy(RetryPolicy):
+    """
+    Retry policy that also hedges slow attempts: if an attempt hasn't finished after the hedge
+    delay, a duplicate is started and whichever succeeds first wins (the other is cancelled).
+
+    The hedge delay is `hedge_after` if given, otherwise the `percentile` of recently observed
+    latencies once `min_samples` calls have completed. Only use it for idempotent calls.
+    """
+
+    def __init__(self, hedge_after: Optional[float] = None, percentile: float = 0.95, max_hedges: int = 1, min_samples: int = 20, window: int = 200, max_retries: int = 2, base_delay: float = 0.5, max_delay: float = 30.0, jitter: float = 1.0, retry_on: Tuple[Type[BaseException], ...] = (Exception,), timeout: Optional[float] = None, policy=None):
+        """
+        Parameters:
+        - hedge_after: Fixed hedge delay in seconds, or None to derive it from observed latencies.
+        - percentile: Latency percentile used as the hedge delay.
+        - max_hedges: Maximum duplicates started per attempt.
+        - min_samples: Observed latencies required before percentile hedging starts.
+        - window: Number of recent latencies kept.
+        Remaining parameters are as for RetryPolicy.
+        """
+        super().__init__(max_retries, base_delay, max_delay, jitter, retry_on, timeout, policy)
+        self.hedge_after = hedge_after
+        self.percentile = percentile
+        self.max_hedges = max_hedges
+        self.min_samples = min_samples
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.hedges_started = 0
+        self.hedges_won = 0
+
+    def hedge_delay(self) -> Optional[float]:
+        if self.hedge_after is not None:
+            return self.hedge_after
+        if len(self.latencies) < self.min_samples:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile))]
+
+    async def _attempt(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        timeout = self._attempt_timeout()
+        if timeout is not None and timeout <= 0:
+            raise asyncio.TimeoutError("Deadline exceeded before the call could start.")
+        end = None if timeout is None else time.monotonic() + timeout
+        delay = self.hedge_delay()
+
+        started = time.monotonic()
+        primary = asyncio.ensure_future(call())
+        tasks = [primary]
+        hedged = 0
+        last_error: Optional[BaseException] = None
+        try:
+            while tasks:
+                wait = None if end is None else max(end - time.monotonic(), 0)
+                can_hedge = delay is not None and hedged < self.max_hedges and last_error is None
+                if can_hedge:
+                    next_hedge = max(started + delay * (hedged + 1) - time.monotonic(), 0)
+                    wait = next_hedge if wait is None else min(wait, next_hedge)
+
+                done, _ = await asyncio.wait(tasks, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tasks.remove(task)
+                    if task.exception() is None:
+                        self.latencies.append(time.monotonic() - started)
+                        if task is not primary:
+                            self.hedges_won += 1
+                        return task.result()
+                    last_error = task.exception()
+
+                if done:
+                    continue
+                if end is not None and time.monotonic() >= end:
+                    raise asyncio.TimeoutError("Call timed out.")
+                if can_hedge:
+                    hedged += 1
+                    self.hedges_started += 1
+                    span = Tracer.current_span()
+                    if span is not None:
+                        span.increment("hedges")
+                    tasks.append(asyncio.ensure_future(call()))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        raise last_error
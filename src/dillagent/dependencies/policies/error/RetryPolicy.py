@@ -0,0 +1,47 @@
+import asyncio
+import random
+from typing import Any, Awaitable, Callable, Optional, Tuple, Type
+from .BaseErrorPolicy import BaseErrorPolicy
+from ....tracing.Tracer import Tracer
+
+
+class RetryPolicy(BaseErrorPolicy):
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.5, max_delay: float = 30.0, jitter: float = 1.0, retry_on: Tuple[Type[BaseException], ...] = (Exception,), timeout: Optional[float] = None, policy=None):
+        """
+        Parameters:
+        - max_retries: Retries after the first attempt.
+        - base_delay: Delay before the first retry; doubled for each further retry.
+        - max_delay: Upper bound for a single delay.
+        - jitter: Fraction of the delay randomized ("full jitter" at 1.0) to spread retries out.
+        - retry_on: Exception types that are retried. Anything else is raised immediately.
+        - timeout: Seconds allowed per attempt.
+        """
+        super().__init__(policy, timeout)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_on = retry_on
+
+    async def _run(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        attempt = 0
+        while True:
+            try:
+                return await self._attempt(call)
+            except self.retry_on:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._delay(attempt)
+                remaining = self._remaining_timeout()
+                # No point sleeping past the deadline
+                if remaining is not None and delay >= remaining:
+                    raise
+                span = Tracer.current_span()
+                if span is not None:
+                    span.increment("retries")
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def _delay(self, attempt: int) -> float:
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * (1 - self.jitter * random.random())
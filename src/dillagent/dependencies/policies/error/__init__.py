@@ -1 +1,4 @@
-from .BaseErrorPolicy import BaseErrorPolicy
\ No newline at end of file
+from .BaseErrorPolicy import BaseErrorPolicy
+from .Deadline import Deadline
+from .RetryPolicy import RetryPolicy
+from .HedgedRequestPolicy import HedgedRequestPolicy
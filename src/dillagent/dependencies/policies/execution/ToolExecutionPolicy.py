@@ -0,0 +1,94 @@
+import asyncio
+import functools
+import importlib
+import weakref
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+_process_pool: Optional["ProcessPoolExecutor"] = None
+
+
+def _get_process_pool() -> "ProcessPoolExecutor":
+    global _process_pool
+    if _process_pool is None:
+        # Imported here since it pulls in multiprocessing, which only 'process' mode needs
+        from concurrent.futures import ProcessPoolExecutor
+        _process_pool = ProcessPoolExecutor()
+    return _process_pool
+
+
+def _call_by_reference(module_name: str, qualname: str, args: tuple, kwargs: dict):
+    # Functions wrapped by @tool are shadowed by their Tool object at module level and cannot
+    # be pickled directly, so the worker process looks them up by name instead.
+    target = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    if not callable(target):
+        target = target.func
+    return target(*args, **kwargs)
+
+
+class ToolExecutionPolicy:
+    """
+    Describes where and how a tool function runs.
+
+    Modes:
+    - 'inline': called directly on the event loop (only suitable for fast functions).
+    - 'thread': synchronous functions run in a thread pool so they don't block other agents.
+    - 'process': synchronous functions run in a process pool, for CPU-heavy work.
+      The function must be importable at module level.
+
+    Coroutine functions are always awaited on the event loop; the mode only applies to sync functions.
+    """
+
+    VALID_MODES = {'inline', 'thread', 'process'}
+
+    def __init__(self, mode: str = 'thread', max_concurrency: Optional[int] = None, timeout: Optional[float] = None, executor: Optional[Executor] = None):
+        """
+        Parameters:
+        - mode: One of 'inline', 'thread' or 'process'.
+        - max_concurrency: Maximum number of simultaneous calls of the tool, or None for no limit.
+        - timeout: Seconds before a call raises asyncio.TimeoutError, or None to wait forever.
+          Threads and processes cannot be interrupted, so a timed out call keeps running in the background.
+        - executor: Executor to use instead of the shared default thread/process pool.
+        """
+        if mode not in self.VALID_MODES:
+            raise ValueError(f"Invalid execution mode '{mode}'. It should be one of {sorted(self.VALID_MODES)}.")
+        self.mode = mode
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.executor = executor
+        # One semaphore per event loop, since a semaphore binds to the loop it is first used on
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        if self.max_concurrency is None:
+            return await self._run_with_timeout(func, args, kwargs)
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        async with semaphore:
+            return await self._run_with_timeout(func, args, kwargs)
+
+    async def _run_with_timeout(self, func: Callable, args: tuple, kwargs: dict) -> Any:
+        if self.timeout is None:
+            return await self._dispatch(func, args, kwargs)
+        return await asyncio.wait_for(self._dispatch(func, args, kwargs), self.timeout)
+
+    async def _dispatch(self, func: Callable, args: tuple, kwargs: dict) -> Any:
+        if asyncio.iscoroutinefunction(func):
+            return await func(*args, **kwargs)
+        if self.mode == 'inline':
+            return func(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        if self.mode == 'thread':
+            return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+        call = functools.partial(_call_by_reference, func.__module__, func.__qualname__, args, kwargs)
+        return await loop.run_in_executor(self.executor or _get_process_pool(), call)
@@ -0,0 +1 @@
+from .ToolExecutionPolicy import ToolExecutionPolicy
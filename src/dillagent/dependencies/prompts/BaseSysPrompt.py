@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from ...tools.Tool import Tool
 from typing import List
 
 
@@ -1,25 +1,54 @@
-from typing import List
+from typing import TYPE_CHECKING, Dict, List, Tuple
 from .BaseSysPrompt import BaseSysPrompt
-from ...tools.Tool import Tool
+
+if TYPE_CHECKING:
+    from ...tools.Tool import Tool
 
 
 class MultiInputToolsSysPrompt(BaseSysPrompt):
-    def __init__(self, header):
+    def __init__(self, header, parallel_actions: bool = False, final_answer_action: str = "Final Answer", actions_key: str = "actions", tool_name_key: str = "action", tool_input_key: str = "action_input"):
+        """
+        Parameters:
+        - header: Text placed before the tool descriptions.
+        - parallel_actions: Lets the model return several independent actions per turn under
+          `actions_key` and finish with a final answer action, as ReActAgentExecutor expects.
+          By default the model is asked for exactly one action.
+        - final_answer_action: Action name the model uses to give its final answer.
+        - actions_key, tool_name_key, tool_input_key: Keys of the JSON the model is asked for.
+          They must match the executor's keys of the same name.
+        """
         self.header = header
+        self.parallel_actions = parallel_actions
+        self.final_answer_action = final_answer_action
+        self.actions_key = actions_key
+        self.tool_name_key = tool_name_key
+        self.tool_input_key = tool_input_key
         self.prompt_str = None
+        self._rendered: Dict[Tuple["Tool", ...], str] = {}
 
     def get_tool_names(self, tools):
         res = ""
         for i in range(len(tools)):
             if i != len(tools)-1:
-                res += f"'{tools[i].name}, '"
+                res += f"'{tools[i].name}', "
             else:
                 res += f"'{tools[i].name}'"
+        return res
 
-    def generate_prompt(self, tools: List[Tool]):
+    def generate_prompt(self, tools: List["Tool"]):
         if (len(tools) < 1):
             raise ValueError(
                 "Must provide at least 1 valid tool for this type of prompt")
+        # Memoized per tool set: providers only reuse a cached prompt prefix when it is
+        # byte-identical across calls
+        key = tuple(tools)
+        prompt = self._rendered.get(key)
+        if prompt is None:
+            prompt = self._rendered[key] = self._render(tools)
+        self.prompt_str = prompt
+        return prompt
+
+    def _render(self, tools: List["Tool"]) -> str:
         prompt = f'''{self.header}
         
 You have access to the following tools:
@@ -28,16 +57,24 @@ You have access to the following tools:
         for tool in tools:
             prompt += tool.describe_tool() + "\n"
 
-        prompt += f'''Use a json blob to specify a tool by providing an action key (tool name) and an action_input key (tool input).
+        prompt += f'''Use a json blob to specify a tool by providing an {self.tool_name_key} key (tool name) and an {self.tool_input_key} key (tool input).
 
-Valid "action" values: {self.get_tool_names(tools)}
+'''
+        if self.parallel_actions:
+            prompt += self._parallel_actions_format(tools)
+        else:
+            prompt += self._single_action_format(tools)
+        return prompt
+
+    def _single_action_format(self, tools: List["Tool"]) -> str:
+        return f'''Valid "{self.tool_name_key}" values: {self.get_tool_names(tools)}
 
 Provide only ONE action per $JSON_BLOB, as shown:
 
 ```
 {{
-  "action": $TOOL_NAME,
-  "action_input": $INPUT
+  "{self.tool_name_key}": $TOOL_NAME,
+  "{self.tool_input_key}": $INPUT
 }}
 ```
 
@@ -45,5 +82,38 @@ Begin! ALWAYS respond with a valid json blob of a single action.
 
 Use tools if necessary. Format is Action:```$JSON_BLOB```then Observation'''
 
-        self.prompt_str = prompt
-        return prompt
+    def _parallel_actions_format(self, tools: List["Tool"]) -> str:
+        return f'''Valid "{self.tool_name_key}" values: {self.get_tool_names(tools)} or '{self.final_answer_action}'
+
+When several actions don't depend on each other's results, request them together in one $JSON_BLOB; they are run at the same time:
+
+```
+{{
+  "{self.actions_key}": [
+    {{"{self.tool_name_key}": $TOOL_NAME, "{self.tool_input_key}": $INPUT}},
+    {{"{self.tool_name_key}": $TOOL_NAME, "{self.tool_input_key}": $INPUT}}
+  ]
+}}
+```
+
+A single action can also be given on its own:
+
+```
+{{
+  "{self.tool_name_key}": $TOOL_NAME,
+  "{self.tool_input_key}": $INPUT
+}}
+```
+
+After each turn you receive an Observation with the result of every action. Once you know the answer, respond with:
+
+```
+{{
+  "{self.tool_name_key}": "{self.final_answer_action}",
+  "{self.tool_input_key}": $ANSWER
+}}
+```
+
+Begin! ALWAYS respond with a valid json blob.
+
+Format is Action:```$JSON_BLOB```then Observation'''
@@ -1,38 +1,170 @@
 from .LLMConfig import LLMConfig
 from .LLM import LLM
-import anthropic
+from ..dependencies.memory.BaseMemory import BaseMemory
+from ..dependencies.memory.TokenCounter import TokenCounter
+from anthropic import AsyncAnthropic, __version__ as anthropic_version
+from typing import AsyncIterator, Optional
+import re
 
 
 class AnthropicLLM(LLM):
-    def __init__(self, config: LLMConfig, messages=None):
-        super().__init__(config, messages)
+    DEFAULT_BASE_URL = "https://api.anthropic.com"
+    DEFAULT_MAX_TOKENS = 1000
+
+    CACHE_CONTROL = {"type": "ephemeral"}
+    # First anthropic SDK release accepting cache_control blocks in messages.create
+    MIN_PROMPT_CACHING_SDK = (0, 40)
+
+    def __init__(self, config: LLMConfig, messages=None, memory: Optional[BaseMemory] = None, token_counter: Optional[TokenCounter] = None, prompt_caching: bool = False):
+        """
+        Parameters:
+        - prompt_caching: Marks the system prompt and the latest message as cache breakpoints
+          (`cache_control`), so later calls reuse the cached conversation prefix. Cache writes are
+          billed at a premium, so this pays off for agents called repeatedly with the same prompt.
+          Requires anthropic>=0.40; older SDKs raise a ValueError.
+        """
+        if config.batch_dispatcher is not None:
+            raise ValueError("AnthropicLLM doesn't support batch_dispatcher. It only works with OpenAILLM.")
+        if prompt_caching and self._sdk_version() < self.MIN_PROMPT_CACHING_SDK:
+            raise ValueError(
+                f"prompt_caching requires anthropic>={'.'.join(map(str, self.MIN_PROMPT_CACHING_SDK))}, "
+                f"but {anthropic_version} is installed."
+            )
+        super().__init__(config, messages, memory, token_counter)
         self.sys_prompt = None
+        self.prompt_caching = prompt_caching
 
     async def run(self, prompt):
         if self.config.type == 'API':
-            response = self._call_api(prompt)
+            with self._llm_span():
+                response = await self._call_api(prompt)
             return response
 
         else:
             raise ValueError(
-                "OpenAILLM only works with type: 'API'. Consider using CustomLLM class for other use cases.")
+                "AnthropicLLM only works with type: 'API'. Consider using CustomLLM class for other use cases.")
 
-    def _call_api(self, prompt):
+    async def _call_api(self, prompt):
         self.add_messages([{"role": "user", "content": prompt}])
-        client = anthropic.Anthropic(
-            api_key=self.config.api_key,
+        await self._compact_messages()
+        client = self._get_client()
+        request = self._build_request()
+        rate_limit_messages = self._rate_limit_messages(request)
+        if self.prompt_caching:
+            request = self._add_cache_breakpoints(request)
+        message = await self._rate_limited(
+            lambda: client.messages.create(**request),
+            rate_limit_messages,
+            lambda message: self._prompt_tokens(message.usage)[0] + message.usage.output_tokens
         )
-        message = client.messages.create(
-            model="claude-3-sonnet-20240229",
-            max_tokens=1000,
-            messages=self.messages,
-            temperature=0,
-            system=self.sys_prompt
+        text = "".join(block.text for block in message.content if block.type == "text")
+        prompt_tokens, cached_prompt_tokens = self._prompt_tokens(message.usage)
+        self._record_usage(prompt_tokens, message.usage.output_tokens, cached_prompt_tokens=cached_prompt_tokens)
+        # The messages API requires alternating roles, so the reply has to be kept in history
+        self.add_messages([{"role": "assistant", "content": text}])
+        return text
+
+    async def astream(self, prompt) -> AsyncIterator[str]:
+        if self.config.type != 'API':
+            raise ValueError(
+                "AnthropicLLM only works with type: 'API'. Consider using CustomLLM class for other use cases.")
+        # Not activated: the caller runs between yields
+        with self._llm_span(activate=False) as span:
+            self.add_messages([{"role": "user", "content": prompt}])
+            await self._compact_messages()
+            client = self._get_client()
+            request = self._build_request()
+            rate_limit_messages = self._rate_limit_messages(request)
+            if self.prompt_caching:
+                request = self._add_cache_breakpoints(request)
+            stream = await self._rate_limited(
+                lambda: client.messages.create(**request, stream=True),
+                rate_limit_messages,
+                span=span
+            )
+            chunks = []
+            prompt_tokens = completion_tokens = cached_prompt_tokens = None
+            async for event in stream:
+                if event.type == "message_start":
+                    prompt_tokens, cached_prompt_tokens = self._prompt_tokens(event.message.usage)
+                elif event.type == "content_block_delta" and event.delta.type == "text_delta":
+                    chunks.append(event.delta.text)
+                    yield event.delta.text
+                elif event.type == "message_delta":
+                    completion_tokens = event.usage.output_tokens
+            text = "".join(chunks)
+            self._record_usage(prompt_tokens, completion_tokens, self.messages, text, cached_prompt_tokens)
+            self._trace_usage(span)
+            self.add_messages([{"role": "assistant", "content": text}])
+
+    def _rate_limit_messages(self, request: dict):
+        # The system prompt counts towards the token budget too
+        return [{"role": "system", "content": request.get("system", "")}] + request["messages"]
+
+    def _build_request(self) -> dict:
+        # Anthropic takes system content as a separate parameter, so pinned system messages
+        # (e.g. a memory summary) are folded into it
+        system_parts = [self.sys_prompt] if self.sys_prompt else []
+        system_parts += [m["content"] for m in self.messages if m["role"] == "system"]
+        request = {
+            "model": self.config.model,
+            "max_tokens": self.config.max_tokens if self.config.max_tokens > 0 else self.DEFAULT_MAX_TOKENS,
+            "messages": [m for m in self.messages if m["role"] != "system"],
+            "temperature": self.config.temperature,
+        }
+        if system_parts:
+            request["system"] = "\n\n".join(system_parts)
+        return request
+
+    def _add_cache_breakpoints(self, request: dict) -> dict:
+        # Breakpoints go on the system prompt and on the latest message; the next call sends the
+        # same prefix and reads it back from the cache. History itself is not modified.
+        request = dict(request)
+        if "system" in request:
+            request["system"] = [{"type": "text", "text": request["system"], "cache_control": self.CACHE_CONTROL}]
+        if request["messages"]:
+            last = dict(request["messages"][-1])
+            content = last["content"]
+            if isinstance(content, str):
+                content = [{"type": "text", "text": content}]
+            content = [dict(block) for block in content]
+            content[-1]["cache_control"] = self.CACHE_CONTROL
+            last["content"] = content
+            request["messages"] = request["messages"][:-1] + [last]
+        return request
+
+    @staticmethod
+    def _sdk_version():
+        return tuple(int(part) for part in re.match(r"(\d+)\.(\d+)", anthropic_version).groups())
+
+    @staticmethod
+    def _prompt_tokens(usage):
+        """
+        Returns (prompt_tokens, cached_prompt_tokens). Anthropic's input_tokens excludes tokens
+        read from or written to the prompt cache, so they are added back for a comparable total.
+        """
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        return usage.input_tokens + cache_read + cache_write, cache_read
+
+    def _get_client(self) -> AsyncAnthropic:
+        # LLMConfig defaults to a local OpenAI-compatible server, which Anthropic cannot talk to
+        base_url = self.config.path if self.config.path != LLMConfig.DEFAULT_PATH else self.DEFAULT_BASE_URL
+        # With rate limits configured the RateLimiter retries throttled calls itself and
+        # must see every 429, so the SDK's own retries are turned off
+        options = {"max_retries": 0} if self.config.has_rate_limits() else {}
+        return self.client_pool.get_client(
+            ("anthropic", bool(options)),
+            base_url,
+            self.config.api_key,
+            lambda http_client: AsyncAnthropic(base_url=base_url, api_key=self.config.api_key, http_client=http_client, **options)
         )
-        return message
 
     def add_messages(self, messages):
         self.messages.extend(messages)
 
     def add_sys_prompt(self, sys_prompt):
         self.sys_prompt = sys_prompt
+
+    def clear_messages(self):
+        self.messages = []
@@ -0,0 +1,146 @@
+import asyncio
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+# (content, prompt_tokens, completion_tokens); token counts are None when the server doesn't report them
+BatchResult = Tuple[str, Optional[int], Optional[int]]
+
+
+def render_plain_prompt(messages: List[Dict]) -> str:
+    """
+    Minimal chat-to-text rendering used by 'completions' mode when no prompt_renderer is given.
+    Prefer passing the model's own chat template.
+    """
+    lines = [f"{message['role']}: {message['content']}" for message in messages]
+    lines.append("assistant:")
+    return "\n".join(lines)
+
+
+class BatchDispatcher:
+    """
+    Coalesces concurrent prompts for the same endpoint and model into batches.
+
+    Requests are collected until `max_batch_size` is reached or `max_wait` seconds have passed
+    since the first one, then submitted together:
+    - 'chat' mode is not batching at the API level: it only holds the requests back briefly and
+      then sends them as separate, concurrent chat completions over the pooled connection. This
+      only helps servers that batch continuously (vLLM, llama.cpp, ...) and can merge a burst of
+      requests; otherwise it just adds up to `max_wait` of latency.
+    - 'completions' mode sends one `/completions` request with a list of prompts, which self-hosted
+      OpenAI-compatible servers execute as a single batch. Chat histories are turned into prompts
+      with `prompt_renderer`.
+
+    Enable it by setting `LLMConfig(batch_dispatcher=...)`; several LLMs may share one dispatcher.
+    Only OpenAILLM (and OpenAI-compatible servers) supports it, since batches are sent with the
+    OpenAI client. Call `aclose` before shutting down so queued batches are sent.
+    """
+
+    VALID_MODES = {'chat', 'completions'}
+
+    def __init__(self, max_batch_size: int = 16, max_wait: float = 0.01, mode: str = 'chat', prompt_renderer: Optional[Callable[[List[Dict]], str]] = None):
+        """
+        Parameters:
+        - max_batch_size: Number of requests that triggers an immediate submission.
+        - max_wait: Seconds to wait for more requests after the first one of a batch arrives.
+        - mode: 'chat' or 'completions'.
+        - prompt_renderer: Turns a chat history into a prompt string in 'completions' mode.
+        """
+        if mode not in self.VALID_MODES:
+            raise ValueError(f"Invalid batch mode '{mode}'. It should be one of {sorted(self.VALID_MODES)}.")
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.mode = mode
+        self.prompt_renderer = prompt_renderer or render_plain_prompt
+        self.batches_sent = 0
+        self.requests_sent = 0
+        self._pending: Dict[Tuple, List[Tuple[List[Dict], object, asyncio.Future]]] = {}
+        self._timers: Dict[Tuple, asyncio.TimerHandle] = {}
+        # Batches being sent; referenced here so the event loop doesn't drop the tasks
+        self._sending: Set[asyncio.Task] = set()
+
+    async def submit(self, llm, messages: List[Dict]) -> BatchResult:
+        config = llm.config
+        # A batch is sent with its first LLM's client and settings, so only identical ones share it
+        key = (type(llm), config.path, config.api_key, config.model, config.temperature, config.max_tokens)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self._pending.setdefault(key, [])
+        # Snapshot the history; the caller's list may change before the batch is sent
+        batch.append((list(messages), llm, future))
+        if len(batch) >= self.max_batch_size:
+            self._flush(key)
+        elif len(batch) == 1:
+            self._timers[key] = loop.call_later(self.max_wait, self._flush, key)
+
+        return await future
+
+    def _flush(self, key: Tuple):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if batch:
+            task = asyncio.ensure_future(self._send(batch))
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+
+    async def aclose(self):
+        """
+        Sends the batches still collecting requests and waits until every batch is sent.
+        """
+        for key in list(self._pending):
+            self._flush(key)
+        if self._sending:
+            await asyncio.gather(*self._sending)
+
+    async def _send(self, batch: List[Tuple[List[Dict], object, asyncio.Future]]):
+        self.batches_sent += 1
+        self.requests_sent += len(batch)
+        llm = batch[0][1]
+        histories = [messages for messages, _, _ in batch]
+        try:
+            if self.mode == 'completions':
+                results = await self._send_completions(llm, histories)
+            else:
+                results = await self._send_chat(llm, histories)
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _send_chat(self, llm, histories: List[List[Dict]]) -> List:
+        client = llm._get_client()
+
+        async def complete(messages):
+            completion = await client.chat.completions.create(model=llm.config.model, messages=messages)
+            usage = completion.usage
+            return (
+                completion.choices[0].message.content,
+                usage.prompt_tokens if usage else None,
+                usage.completion_tokens if usage else None,
+            )
+
+        return await asyncio.gather(*(complete(messages) for messages in histories), return_exceptions=True)
+
+    async def _send_completions(self, llm, histories: List[List[Dict]]) -> List[BatchResult]:
+        client = llm._get_client()
+        kwargs = {}
+        if llm.config.max_tokens and llm.config.max_tokens > 0:
+            kwargs["max_tokens"] = llm.config.max_tokens
+        completion = await client.completions.create(
+            model=llm.config.model,
+            prompt=[self.prompt_renderer(messages) for messages in histories],
+            temperature=llm.config.temperature,
+            **kwargs
+        )
+        texts = [""] * len(histories)
+        for choice in completion.choices:
+            texts[choice.index] = choice.text
+        # Usage is only reported for the whole batch
+        return [(text, None, None) for text in texts]
@@ -0,0 +1,155 @@
+import asyncio
+import hashlib
+import json
+from typing import AsyncIterator, Optional, Tuple
+from .LLM import LLM
+from .DelegatingLLM import DelegatingLLM
+from .ResponseCache import ResponseCache
+from ..tracing.Tracer import Tracer
+
+
+class CachedLLM(DelegatingLLM):
+    """
+    Wraps any LLM and serves repeated requests from a ResponseCache.
+
+    Drop-in for agents: pass `CachedLLM(llm)` wherever `llm` was used. A cache hit leaves the
+    wrapped LLM's conversation in the same state a real call would have. Identical requests made
+    concurrently are sent once; the others wait for its response. That includes the attempts of a
+    HedgedRequestPolicy, so wrap the policy around an uncached LLM if hedging should apply.
+    """
+
+    def __init__(self, llm: LLM, cache: Optional[ResponseCache] = None, max_temperature: float = 0):
+        """
+        Parameters:
+        - llm: The LLM instance to wrap.
+        - cache: The ResponseCache to use. Several CachedLLMs may share one cache.
+        - max_temperature: Requests with a higher temperature are non-deterministic and bypass the cache.
+        """
+        super().__init__(llm)
+        self.cache = cache or ResponseCache()
+        self.max_temperature = max_temperature
+
+    async def run(self, prompt):
+        if self._bypass():
+            return await self.llm.run(prompt)
+
+        with Tracer.start_span(self.config.model, "llm", backend=type(self).__name__) as span:
+            key = self._cache_key(prompt)
+            shared = await self._wait_for_identical_request(key)
+            if shared is not None:
+                self._trace_hit(span, True)
+                return await self._replay_hit(prompt, *shared)
+
+            future = self._start_request(key)
+            result = None
+            try:
+                cached = await self.cache.get(key)
+                self._trace_hit(span, cached is not None)
+                if cached is not None:
+                    result = cached
+                    return await self._replay_hit(prompt, *cached)
+
+                response = await self.llm.run(prompt)
+                result = (response, self._records_reply(response))
+                await self.cache.set(key, *result)
+                return response
+            finally:
+                self._end_request(key, future, result)
+
+    async def astream(self, prompt) -> AsyncIterator[str]:
+        if self._bypass():
+            async for delta in self.llm.astream(prompt):
+                yield delta
+            return
+
+        with Tracer.start_span(self.config.model, "llm", activate=False, backend=type(self).__name__) as span:
+            key = self._cache_key(prompt)
+            shared = await self._wait_for_identical_request(key)
+            if shared is not None:
+                self._trace_hit(span, True)
+                yield await self._replay_hit(prompt, *shared)
+                return
+
+            future = self._start_request(key)
+            result = None
+            try:
+                cached = await self.cache.get(key)
+                self._trace_hit(span, cached is not None)
+                if cached is not None:
+                    result = cached
+                    yield await self._replay_hit(prompt, *cached)
+                    return
+
+                chunks = []
+                async for delta in self.llm.astream(prompt):
+                    chunks.append(delta)
+                    yield delta
+                response = "".join(chunks)
+                result = (response, self._records_reply(response))
+                await self.cache.set(key, *result)
+            finally:
+                self._end_request(key, future, result)
+
+    def _bypass(self) -> bool:
+        if (self.config.temperature or 0) > self.max_temperature:
+            self.cache.bypasses += 1
+            return True
+        return False
+
+    @staticmethod
+    def _trace_hit(span, hit: bool):
+        if span is not None:
+            span.set(cache_hit=hit)
+
+    async def _wait_for_identical_request(self, key: str) -> Optional[Tuple[str, bool]]:
+        """
+        Waits for an identical request that is already being made (single-flight) and returns
+        its (response, record_reply). Returns None when there is none, or once it failed.
+        """
+        while True:
+            future = self.cache.in_flight.get(key)
+            if future is None:
+                return None
+            # Shielded so a cancelled waiter doesn't cancel the request it waits for
+            result = await asyncio.shield(future)
+            if result is not None:
+                self.cache.coalesced += 1
+                return result
+
+    def _start_request(self, key: str) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self.cache.in_flight[key] = future
+        return future
+
+    def _end_request(self, key: str, future: asyncio.Future, result: Optional[Tuple[str, bool]]):
+        if self.cache.in_flight.get(key) is future:
+            del self.cache.in_flight[key]
+        # None lets waiters of a failed request make their own
+        future.set_result(result)
+
+    async def _replay_hit(self, prompt, response: str, record_reply: bool) -> str:
+        # Same steps as a real call: prompt, memory compaction, then the reply if the backend keeps it
+        self.llm.add_messages([{"role": "user", "content": prompt}])
+        await self.llm._compact_messages()
+        if record_reply:
+            self.llm.add_messages([{"role": "assistant", "content": response}])
+        self.llm.last_usage = {"prompt_tokens": 0, "completion_tokens": 0, "cached_prompt_tokens": 0}
+        return response
+
+    def _cache_key(self, prompt) -> str:
+        payload = json.dumps(
+            {
+                "backend": type(self.llm).__name__,
+                "path": self.config.path,
+                "model": self.config.model,
+                "temperature": self.config.temperature,
+                "max_tokens": self.config.max_tokens,
+                "system": getattr(self.llm, "sys_prompt", None),
+                "messages": self.llm.messages,
+                "prompt": prompt,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
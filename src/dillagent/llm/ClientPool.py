@@ -0,0 +1,100 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional, Tuple
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class ClientPool:
+    """
+    Registry of long-lived async HTTP clients shared between LLM instances.
+
+    Clients are keyed by (provider, base_url, api_key) so every LLM pointing at the same
+    endpoint with the same credentials reuses one connection pool instead of opening a
+    new one for every call. Connections belong to the event loop that opened them, so each
+    running loop gets its own clients, and clients of closed loops are dropped.
+    """
+
+    _default: Optional["ClientPool"] = None
+
+    def __init__(self, max_connections: int = 100, max_keepalive_connections: int = 20, keepalive_expiry: float = 30.0, http2: bool = False, timeout: float = 600.0):
+        """
+        Parameters:
+        - max_connections: Maximum number of concurrent connections per client.
+        - max_keepalive_connections: Maximum number of idle connections kept open per client.
+        - keepalive_expiry: Seconds an idle connection is kept alive before being closed.
+        - http2: Whether to negotiate HTTP/2 (requires the `h2` package).
+        - timeout: Default request timeout in seconds.
+        """
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.timeout = timeout
+        # Keys start with the running loop (None outside of one)
+        self._http_clients: Dict[Tuple[Optional[asyncio.AbstractEventLoop], str, str], "httpx.AsyncClient"] = {}
+        self._clients: Dict[Tuple[Optional[asyncio.AbstractEventLoop], Hashable, str, str], Tuple["httpx.AsyncClient", Any]] = {}
+
+    @classmethod
+    def default(cls) -> "ClientPool":
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def get_http_client(self, base_url: str, api_key: str) -> "httpx.AsyncClient":
+        key = (self._running_loop(), base_url, api_key)
+        client = self._http_clients.get(key)
+        if client is None or client.is_closed:
+            import httpx
+            self._drop_closed_loops()
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                http2=self.http2,
+                timeout=self.timeout,
+            )
+            self._http_clients[key] = client
+        return client
+
+    def get_client(self, provider: Hashable, base_url: str, api_key: str, factory: Callable[["httpx.AsyncClient"], Any]) -> Any:
+        """
+        Returns the SDK client registered for (provider, base_url, api_key), building it with
+        `factory(http_client)` on first use.
+        """
+        key = (self._running_loop(), provider, base_url, api_key)
+        http_client = self.get_http_client(base_url, api_key)
+        entry = self._clients.get(key)
+        # Rebuild the SDK client if its underlying connection pool was closed and replaced
+        if entry is None or entry[0] is not http_client:
+            entry = (http_client, factory(http_client))
+            self._clients[key] = entry
+        return entry[1]
+
+    @staticmethod
+    def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def _drop_closed_loops(self):
+        # Their connections can't be used or closed any more, only released
+        for key in [key for key in self._http_clients if key[0] is not None and key[0].is_closed()]:
+            del self._http_clients[key]
+        for key in [key for key in self._clients if key[0] is not None and key[0].is_closed()]:
+            del self._clients[key]
+
+    async def aclose(self):
+        """
+        Closes the clients of the running loop and drops those of closed loops.
+        """
+        loop = self._running_loop()
+        self._drop_closed_loops()
+        http_clients = [client for key, client in self._http_clients.items() if key[0] in (loop, None)]
+        self._http_clients = {key: client for key, client in self._http_clients.items() if key[0] not in (loop, None)}
+        self._clients = {key: entry for key, entry in self._clients.items() if key[0] not in (loop, None)}
+        for client in http_clients:
+            await client.aclose()
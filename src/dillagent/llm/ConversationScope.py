@@ -0,0 +1,80 @@
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+_active_scope: ContextVar[Optional["ConversationScope"]] = ContextVar("dillagent_conversation_scope", default=None)
+
+
+class ConversationScope:
+    """
+    Isolates LLM conversation histories for one logical request.
+
+    While a scope is active (including in asyncio tasks created inside it), every LLM reads and
+    writes a private copy of its message history, seeded from the history it had when first used
+    in the scope (typically just the system prompt). The LLM's own history is left untouched
+    unless the scope is committed. `last_usage` is scoped the same way, so concurrent
+    conversations each see the usage of their own last call.
+
+    Usage:
+        with ConversationScope():
+            await graph_executor.run(...)
+    """
+
+    def __init__(self):
+        self.histories: Dict[object, List[Dict]] = {}
+        self.usage: Dict[object, Dict[str, int]] = {}
+        self.parent: Optional["ConversationScope"] = None
+        self._token = None
+
+    @staticmethod
+    def current() -> Optional["ConversationScope"]:
+        return _active_scope.get()
+
+    def history_for(self, llm) -> Optional[List[Dict]]:
+        """
+        Returns the history `llm` has in this scope or the closest enclosing one, or None.
+        """
+        scope = self
+        while scope is not None:
+            history = scope.histories.get(llm)
+            if history is not None:
+                return history
+            scope = scope.parent
+        return None
+
+    def usage_for(self, llm) -> Optional[Dict[str, int]]:
+        """
+        Returns the last usage `llm` recorded in this scope or the closest enclosing one, or None.
+        """
+        scope = self
+        while scope is not None:
+            usage = scope.usage.get(llm)
+            if usage is not None:
+                return usage
+            scope = scope.parent
+        return None
+
+    def commit(self):
+        """
+        Publishes the histories and usage written in this scope to the enclosing scope, or to the
+        LLMs themselves at the top level. Used to keep the result of one of several isolated attempts.
+        """
+        for llm, history in self.histories.items():
+            if self.parent is not None:
+                self.parent.histories[llm] = history
+            else:
+                llm._messages = history
+        for llm, usage in self.usage.items():
+            if self.parent is not None:
+                self.parent.usage[llm] = usage
+            else:
+                llm._last_usage = usage
+
+    def __enter__(self) -> "ConversationScope":
+        # Scopes nest: histories are seeded from the enclosing scope
+        self.parent = _active_scope.get()
+        self._token = _active_scope.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _active_scope.reset(self._token)
+        self._token = None
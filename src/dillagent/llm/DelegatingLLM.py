@@ -0,0 +1,70 @@
+from .LLM import LLM
+
+
+class DelegatingLLM(LLM):
+    """
+    Base class for LLMs that wrap another LLM and add behaviour around its calls, e.g. CachedLLM
+    and RecordingLLM. History, config, usage and any other attribute are delegated to the
+    wrapped LLM, so a wrapper can be passed wherever the wrapped LLM was used. Subclasses
+    override `run` and `astream`.
+    """
+
+    def __init__(self, llm: LLM):
+        """
+        Parameters:
+        - llm: The LLM instance to wrap.
+        """
+        # LLM.__init__ is intentionally not called; all state lives on the wrapped LLM
+        self.llm = llm
+
+    def __getattr__(self, name):
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+    @property
+    def messages(self):
+        return self.llm.messages
+
+    @messages.setter
+    def messages(self, messages):
+        self.llm.messages = messages
+
+    @property
+    def config(self):
+        return self.llm.config
+
+    @property
+    def last_usage(self):
+        return self.llm.last_usage
+
+    @last_usage.setter
+    def last_usage(self, usage):
+        self.llm.last_usage = usage
+
+    async def run(self, prompt):
+        return await self.llm.run(prompt)
+
+    async def astream(self, prompt):
+        async for delta in self.llm.astream(prompt):
+            yield delta
+
+    def _call_api(self, prompt):
+        return self.llm._call_api(prompt)
+
+    def add_messages(self, messages):
+        self.llm.add_messages(messages)
+
+    def add_sys_prompt(self, sys_prompt):
+        self.llm.add_sys_prompt(sys_prompt)
+
+    def get_rate_limiter(self):
+        return self.llm.get_rate_limiter()
+
+    def _records_reply(self, response: str) -> bool:
+        """
+        Whether the wrapped backend kept `response` in its history, which replays of it have
+        to reproduce.
+        """
+        last = self.llm.messages[-1] if self.llm.messages else {}
+        return last.get("role") == "assistant" and last.get("content") == response
@@ -1,19 +1,83 @@
 from .LLMConfig import LLMConfig
+from .ClientPool import ClientPool
+from .ConversationScope import ConversationScope
+from .RateLimiter import RateLimiter
+from ..dependencies.memory.BaseMemory import BaseMemory
+from ..dependencies.memory.TokenCounter import TokenCounter
+from ..tracing.Span import Span
+from ..tracing.Tracer import Tracer
+import time
 from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
 
 
 class LLM(ABC):
-    def __init__(self, config: LLMConfig, messages=None):
+    def __init__(self, config: LLMConfig, messages=None, memory: Optional[BaseMemory] = None, token_counter: Optional[TokenCounter] = None):
         if not messages:
-            self.messages = []
+            messages = []
         self.config = config
         self.messages = messages
+        self.memory = memory
+        self.token_counter = token_counter or getattr(memory, "token_counter", None) or TokenCounter()
+        # cached_prompt_tokens: part of prompt_tokens served from the provider's prompt prefix cache
+        self._last_usage = {"prompt_tokens": 0, "completion_tokens": 0, "cached_prompt_tokens": 0}
+        self.total_usage = {"prompt_tokens": 0, "completion_tokens": 0, "cached_prompt_tokens": 0}
+
+    @property
+    def messages(self):
+        scope = ConversationScope.current()
+        if scope is None:
+            return self._messages
+        messages = scope.histories.get(self)
+        if messages is None:
+            inherited = scope.parent.history_for(self) if scope.parent is not None else None
+            messages = scope.histories[self] = list(inherited if inherited is not None else self._messages)
+        return messages
+
+    @messages.setter
+    def messages(self, messages):
+        scope = ConversationScope.current()
+        if scope is None:
+            self._messages = messages
+        else:
+            scope.histories[self] = messages
+
+    @property
+    def last_usage(self):
+        """
+        Usage of the last call, per ConversationScope like the message history.
+        """
+        scope = ConversationScope.current()
+        if scope is not None:
+            usage = scope.usage_for(self)
+            if usage is not None:
+                return usage
+        return self._last_usage
+
+    @last_usage.setter
+    def last_usage(self, usage):
+        scope = ConversationScope.current()
+        if scope is None:
+            self._last_usage = usage
+        else:
+            scope.usage[self] = usage
+
+    @property
+    def client_pool(self) -> ClientPool:
+        return self.config.client_pool or ClientPool.default()
 
     @abstractmethod
     def run(self, prompt):
         # Should return string response
         pass
 
+    async def astream(self, prompt) -> AsyncIterator[str]:
+        """
+        Yields the response as text deltas. Backends without streaming support yield
+        the whole response as a single delta.
+        """
+        yield await self.run(prompt)
+
     @abstractmethod
     def _call_api(self, prompt):
         pass
@@ -25,3 +89,80 @@ class LLM(ABC):
     @abstractmethod
     def add_sys_prompt(self, sys_prompt):
         pass
+
+    def get_rate_limiter(self) -> Optional[RateLimiter]:
+        if not self.config.has_rate_limits():
+            return None
+        return RateLimiter.shared(
+            (type(self).__name__, self.config.path, self.config.model),
+            requests_per_minute=self.config.requests_per_minute,
+            tokens_per_minute=self.config.tokens_per_minute,
+            max_concurrency=self.config.max_concurrent_requests,
+        )
+
+    def _llm_span(self, activate: bool = True):
+        """
+        Tracing span for one model call; see Tracer.start_span.
+        """
+        return Tracer.start_span(self.config.model, "llm", activate, backend=type(self).__name__)
+
+    async def _rate_limited(self, call: Callable[[], Awaitable[Any]], prompt_messages=None, actual_tokens: Optional[Callable[[Any], Optional[int]]] = None, span: Optional[Span] = None) -> Any:
+        """
+        Runs one API request through the endpoint's shared RateLimiter, if limits are configured.
+        Limiter queueing time and retries are recorded on `span`, or on the current LLM span.
+        """
+        limiter = self.get_rate_limiter()
+        if limiter is None:
+            return await call()
+        estimated_tokens = self.token_counter.count_messages(prompt_messages or [])
+        if self.config.max_tokens and self.config.max_tokens > 0:
+            estimated_tokens += self.config.max_tokens
+
+        span = span or Tracer.current_span()
+        if span is None or span.kind != "llm":
+            return await limiter.run(call, estimated_tokens, actual_tokens)
+
+        # Time spent waiting on the limiter before the first request, and throttled retries
+        queued_since = time.monotonic()
+        attempts = 0
+
+        def timed_call():
+            nonlocal attempts
+            if not attempts:
+                span.set(queue_time=time.monotonic() - queued_since)
+            attempts += 1
+            return call()
+
+        try:
+            return await limiter.run(timed_call, estimated_tokens, actual_tokens)
+        finally:
+            if attempts > 1:
+                span.increment("retries", attempts - 1)
+
+    async def _compact_messages(self):
+        if self.memory is not None:
+            self.messages = await self.memory.compact(self.messages)
+
+    def _record_usage(self, prompt_tokens: Optional[int], completion_tokens: Optional[int], prompt_messages=None, completion: Optional[str] = None, cached_prompt_tokens: Optional[int] = None):
+        # Fall back to local estimates when the provider doesn't report usage (common for local servers)
+        if prompt_tokens is None:
+            prompt_tokens = self.token_counter.count_messages(prompt_messages or [])
+        if completion_tokens is None:
+            completion_tokens = self.token_counter.count(completion)
+        cached_prompt_tokens = cached_prompt_tokens or 0
+        self.last_usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens, "cached_prompt_tokens": cached_prompt_tokens}
+        self.total_usage["prompt_tokens"] += prompt_tokens
+        self.total_usage["completion_tokens"] += completion_tokens
+        self.total_usage["cached_prompt_tokens"] += cached_prompt_tokens
+        self._trace_usage(Tracer.current_span())
+
+    def _trace_usage(self, span: Optional[Span]):
+        if span is not None and span.kind == "llm":
+            span.set(**self.last_usage)
+
+    def prefix_cache_hit_rate(self) -> float:
+        """
+        Fraction of all prompt tokens sent by this LLM that the provider served from its prompt cache.
+        """
+        prompt_tokens = self.total_usage["prompt_tokens"]
+        return self.total_usage["cached_prompt_tokens"] / prompt_tokens if prompt_tokens else 0.0
@@ -1,7 +1,8 @@
 class LLMConfig:
     VALID_TYPES = {'API', 'SCRIPT'}
+    DEFAULT_PATH = "http://localhost:1234/v1"
 
-    def __init__(self, model="local model", api_key="not-needed", config_type='API', path="http://localhost:1234/v1", temperature=0, max_tokens=-1):
+    def __init__(self, model="local model", api_key="not-needed", config_type='API', path=DEFAULT_PATH, temperature=0, max_tokens=-1, client_pool=None, batch_dispatcher=None, requests_per_minute=None, tokens_per_minute=None, max_concurrent_requests=None):
         if config_type not in self.VALID_TYPES:
             raise ValueError(
                 "Invalid config type. It should be 'api' or 'script'.")
@@ -11,3 +12,15 @@ class LLMConfig:
         self.path = path
         self.api_key = api_key
         self.model = model
+        # Shared ClientPool to draw HTTP clients from. None uses ClientPool.default()
+        self.client_pool = client_pool
+        # Optional BatchDispatcher coalescing concurrent non-streaming calls into batches. Only
+        # supported by OpenAILLM
+        self.batch_dispatcher = batch_dispatcher
+        # Limits shared by every LLM using the same endpoint and model. None disables a limit
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrent_requests = max_concurrent_requests
+
+    def has_rate_limits(self) -> bool:
+        return any(limit is not None for limit in (self.requests_per_minute, self.tokens_per_minute, self.max_concurrent_requests))
@@ -1,17 +1,21 @@
 from .LLMConfig import LLMConfig
 from .LLM import LLM
+from ..dependencies.memory.BaseMemory import BaseMemory
+from ..dependencies.memory.TokenCounter import TokenCounter
 from openai import AsyncOpenAI
+from typing import AsyncIterator, Optional
 
 
 class OpenAILLM(LLM):
-    def __init__(self, config: LLMConfig, messages=None):
+    def __init__(self, config: LLMConfig, messages=None, memory: Optional[BaseMemory] = None, token_counter: Optional[TokenCounter] = None):
         if messages is None:
             messages = []
-        super().__init__(config, messages)
+        super().__init__(config, messages, memory, token_counter)
 
     async def run(self, prompt):
         if self.config.type == 'API':
-            response = await self._call_api(prompt)
+            with self._llm_span():
+                response = await self._call_api(prompt)
             return response
         else:
             raise ValueError(
@@ -20,12 +24,91 @@ class OpenAILLM(LLM):
 
     async def _call_api(self, prompt):
         self.add_messages([{"role": "user", "content": prompt}])
-        client = AsyncOpenAI(base_url=self.config.path, api_key=self.config.api_key)
-        completion = await client.chat.completions.create(
-            model=self.config.model,
-            messages=self.messages
+        await self._compact_messages()
+        if self.config.batch_dispatcher is not None:
+            content, prompt_tokens, completion_tokens = await self._rate_limited(
+                lambda: self.config.batch_dispatcher.submit(self, self.messages),
+                self.messages,
+                lambda result: result[1] + result[2] if result[1] is not None and result[2] is not None else None
+            )
+            self._record_usage(prompt_tokens, completion_tokens, self.messages, content)
+            self.add_messages([{"role": "assistant", "content": content}])
+            return content
+
+        client = self._get_client()
+        completion = await self._rate_limited(
+            lambda: client.chat.completions.create(
+                model=self.config.model,
+                messages=self.messages
+            ),
+            self.messages,
+            lambda completion: completion.usage.total_tokens if completion.usage else None
+        )
+        content = completion.choices[0].message.content
+        usage = completion.usage
+        self._record_usage(
+            usage.prompt_tokens if usage else None,
+            usage.completion_tokens if usage else None,
+            self.messages,
+            content,
+            self._cached_tokens(usage)
+        )
+        # Kept in history like AnthropicLLM does, so follow-up prompts can refer to earlier replies
+        self.add_messages([{"role": "assistant", "content": content}])
+        return content
+
+    @staticmethod
+    def _cached_tokens(usage) -> Optional[int]:
+        # Reported as usage.prompt_tokens_details.cached_tokens by OpenAI and by servers with
+        # prefix caching (e.g. vLLM); older SDK versions keep it as an untyped extra field
+        details = getattr(usage, "prompt_tokens_details", None)
+        if isinstance(details, dict):
+            return details.get("cached_tokens")
+        return getattr(details, "cached_tokens", None)
+
+    async def astream(self, prompt) -> AsyncIterator[str]:
+        if self.config.type != 'API':
+            raise ValueError(
+                "OpenAILLM only works with type: 'API'. Consider using CustomLLM class for other use cases."
+            )
+        # Not activated: the caller runs between yields
+        with self._llm_span(activate=False) as span:
+            self.add_messages([{"role": "user", "content": prompt}])
+            await self._compact_messages()
+            client = self._get_client()
+            stream = await self._rate_limited(
+                lambda: client.chat.completions.create(
+                    model=self.config.model,
+                    messages=self.messages,
+                    stream=True
+                ),
+                self.messages,
+                span=span
+            )
+            chunks = []
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    chunks.append(delta)
+                    yield delta
+            # Streamed chunks carry no usage, so it is estimated locally
+            text = "".join(chunks)
+            self._record_usage(None, None, self.messages, text)
+            self._trace_usage(span)
+            self.add_messages([{"role": "assistant", "content": text}])
+
+    def _get_client(self) -> AsyncOpenAI:
+        # With rate limits configured the RateLimiter retries throttled calls itself and
+        # must see every 429, so the SDK's own retries are turned off
+        options = {"max_retries": 0} if self.config.has_rate_limits() else {}
+        return self.client_pool.get_client(
+            ("openai", bool(options)),
+            self.config.path,
+            self.config.api_key,
+            lambda http_client: AsyncOpenAI(base_url=self.config.path, api_key=self.config.api_key, http_client=http_client, **options)
         )
-        return completion.choices[0].message.content
 
     def add_messages(self, messages):
         self.messages.extend(messages)
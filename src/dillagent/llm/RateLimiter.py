@@ -0,0 +1,166 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional
+from .TokenBucket import TokenBucket
+
+
+class RateLimiter:
+    """
+    Request, token and concurrency limiter for one endpoint/model.
+
+    - Requests per minute and tokens per minute are enforced with token buckets. Token usage is
+      charged from an estimate up front and reconciled with the actual usage afterwards.
+    - Concurrency adapts with AIMD: every success raises the limit additively (by ~1 per limit's
+      worth of requests), every 429/5xx halves it. Without `max_concurrency` there is no limit
+      until the first throttle is observed.
+    - `retry-after` headers pause all requests to the endpoint, and throttled calls are retried.
+
+    Limiters are usually obtained with `RateLimiter.shared(key, ...)` so every LLM talking to the
+    same endpoint and model shares one budget. A limiter holds no event loop bound state, so it
+    can be shared by successive `asyncio.run` calls.
+    """
+
+    THROTTLE_STATUS_CODES = {429, 500, 502, 503, 504, 529}
+
+    _shared: Dict[Hashable, "RateLimiter"] = {}
+
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None, max_concurrency: Optional[int] = None, min_concurrency: int = 1, max_retries: int = 3, backoff: float = 1.0):
+        """
+        Parameters:
+        - requests_per_minute: Request budget, or None for no limit.
+        - tokens_per_minute: Prompt + completion token budget, or None for no limit.
+        - max_concurrency: Upper bound for the adaptive concurrency limit, or None for unbounded.
+        - min_concurrency: Lower bound the limit is never decreased below.
+        - max_retries: Retries for throttled (429/5xx) calls before the error is raised.
+        - backoff: Base delay in seconds for exponential backoff when no retry-after is given.
+        """
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.concurrency_limit: Optional[float] = float(max_concurrency) if max_concurrency else None
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.settings = (requests_per_minute, tokens_per_minute, max_concurrency, min_concurrency, max_retries, backoff)
+        self.in_flight = 0
+        self.throttled = 0
+        self._paused_until = 0.0
+        # Futures of calls waiting for a concurrency slot, created on the caller's loop
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @classmethod
+    def shared(cls, key: Hashable, **kwargs) -> "RateLimiter":
+        """
+        Returns the limiter registered under `key`, creating it with `kwargs` on first use.
+        Raises a ValueError if the registered limiter was created with different limits.
+        """
+        limiter = cls._shared.get(key)
+        if limiter is None:
+            limiter = cls._shared[key] = cls(**kwargs)
+        elif limiter.settings != cls(**kwargs).settings:
+            raise ValueError(f"The rate limiter for {key!r} already exists with different limits.")
+        return limiter
+
+    async def run(self, call: Callable[[], Awaitable[Any]], estimated_tokens: int = 0, actual_tokens: Optional[Callable[[Any], Optional[int]]] = None) -> Any:
+        """
+        Runs `call()` within the limits, retrying throttled calls.
+
+        Parameters:
+        - call: Zero-argument coroutine function performing one API request.
+        - estimated_tokens: Tokens charged to the TPM budget before the call.
+        - actual_tokens: Optional function extracting the real token usage from the result.
+        """
+        attempt = 0
+        while True:
+            await self._acquire(estimated_tokens)
+            try:
+                result = await call()
+            except Exception as e:
+                status = getattr(e, "status_code", None)
+                throttled = status in self.THROTTLE_STATUS_CODES
+                self._release(throttled)
+                if not throttled or attempt >= self.max_retries:
+                    raise
+                self._pause(self._retry_after(e), attempt)
+                attempt += 1
+                continue
+            except BaseException:
+                # Cancelled: free the slot without counting it as a success or a throttle
+                self._release_slot()
+                raise
+
+            self._release(False)
+            if actual_tokens is not None and self.token_bucket is not None:
+                actual = actual_tokens(result)
+                if actual is not None:
+                    self.token_bucket.adjust(estimated_tokens - actual)
+            return result
+
+    async def _acquire(self, estimated_tokens: int):
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        while not self._has_capacity():
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if not waiter.done():
+                    waiter.cancel()
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+        self.in_flight += 1
+
+        try:
+            if self.request_bucket is not None:
+                await self.request_bucket.acquire(1)
+            if self.token_bucket is not None and estimated_tokens:
+                await self.token_bucket.acquire(estimated_tokens)
+        except BaseException:
+            self._release_slot()
+            raise
+
+    def _release(self, throttled: bool):
+        if throttled:
+            self.throttled += 1
+            # Multiplicative decrease, starting from the observed concurrency if unbounded so far
+            current = self.concurrency_limit if self.concurrency_limit is not None else self.in_flight
+            self.concurrency_limit = max(float(self.min_concurrency), current / 2)
+        elif self.concurrency_limit is not None:
+            self.concurrency_limit += 1 / self.concurrency_limit
+            if self.max_concurrency is not None:
+                self.concurrency_limit = min(self.concurrency_limit, float(self.max_concurrency))
+        self._release_slot()
+
+    def _release_slot(self):
+        self.in_flight -= 1
+        # Waiters re-check the capacity when woken, so waking all of them can't lose a slot
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _has_capacity(self) -> bool:
+        return self.concurrency_limit is None or self.in_flight < int(self.concurrency_limit)
+
+    def _pause(self, retry_after: Optional[float], attempt: int):
+        delay = retry_after if retry_after is not None else self.backoff * (2 ** attempt)
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    def _retry_after(self, error: Exception) -> Optional[float]:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        try:
+            if "retry-after-ms" in headers:
+                return float(headers["retry-after-ms"]) / 1000
+            if "retry-after" in headers:
+                return float(headers["retry-after"])
+        except ValueError:
+            # HTTP-date form; fall back to exponential backoff
+            return None
+        return None
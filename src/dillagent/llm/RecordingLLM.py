@@ -0,0 +1,43 @@
+import asyncio
+import time
+from typing import AsyncIterator
+from .LLM import LLM
+from .DelegatingLLM import DelegatingLLM
+from .RecordingStore import RecordingStore
+
+
+class RecordingLLM(DelegatingLLM):
+    """
+    Wraps any LLM and records every call (request hash, response, latency and token usage) to a
+    RecordingStore, for later replay with ReplayLLM. Behaves exactly like the wrapped LLM.
+    """
+
+    def __init__(self, llm: LLM, store: RecordingStore):
+        """
+        Parameters:
+        - llm: The LLM instance to wrap.
+        - store: Where calls are recorded. Several RecordingLLMs may share one store.
+        """
+        super().__init__(llm)
+        self.store = store
+
+    async def run(self, prompt):
+        key = RecordingStore.request_key(self.llm, prompt)
+        started = time.monotonic()
+        response = await self.llm.run(prompt)
+        await self._record(key, response, time.monotonic() - started)
+        return response
+
+    async def astream(self, prompt) -> AsyncIterator[str]:
+        key = RecordingStore.request_key(self.llm, prompt)
+        started = time.monotonic()
+        chunks = []
+        async for delta in self.llm.astream(prompt):
+            chunks.append(delta)
+            yield delta
+        await self._record(key, "".join(chunks), time.monotonic() - started)
+
+    async def _record(self, key: str, response: str, latency: float):
+        usage = getattr(self.llm, "last_usage", None) or {}
+        recording = (response, latency, usage.get("prompt_tokens"), usage.get("completion_tokens"), self._records_reply(response))
+        await asyncio.to_thread(self.store.add, key, getattr(self.config, "model", None), recording)
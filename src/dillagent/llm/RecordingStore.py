@@ -0,0 +1,92 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+# (response, latency in seconds, prompt_tokens, completion_tokens, record_reply)
+Recording = Tuple[str, float, Optional[int], Optional[int], bool]
+
+
+class RecordingStore:
+    """
+    On-disk store of recorded LLM calls, written by RecordingLLM and served by ReplayLLM.
+
+    Calls are kept in a SQLite file indexed by request hash. Requests are stored only as their
+    hash and responses are zlib-compressed, which keeps a day of traffic small. A request
+    recorded several times is replayed with each of its recorded responses in turn.
+    """
+
+    def __init__(self, path: str):
+        """
+        Parameters:
+        - path: SQLite file holding the recordings. Created if missing.
+        """
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db_lock = threading.Lock()
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS recordings (id INTEGER PRIMARY KEY, key TEXT, recorded_at REAL, model TEXT, "
+            "latency REAL, response BLOB, prompt_tokens INTEGER, completion_tokens INTEGER, record_reply INTEGER)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS recordings_key ON recordings (key)")
+        self._db.commit()
+        self._cache: Dict[str, List[Recording]] = {}
+
+    @staticmethod
+    def request_key(llm, prompt: str) -> str:
+        """
+        Hash of a request: the system prompt, the conversation history before the call and the
+        prompt. Model and endpoint are left out so traffic can be replayed under other configs.
+        System content is normalized, so recordings from any backend replay on any other.
+        """
+        system = [llm.sys_prompt] if getattr(llm, "sys_prompt", None) else []
+        system += [m["content"] for m in llm.messages if m["role"] == "system"]
+        payload = json.dumps(
+            {
+                "system": system,
+                "messages": [m for m in llm.messages if m["role"] != "system"],
+                "prompt": prompt,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def add(self, key: str, model: Optional[str], recording: Recording):
+        response, latency, prompt_tokens, completion_tokens, record_reply = recording
+        with self._db_lock:
+            self._db.execute(
+                "INSERT INTO recordings (key, recorded_at, model, latency, response, prompt_tokens, completion_tokens, record_reply) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, time.time(), model, latency, zlib.compress(response.encode("utf-8")), prompt_tokens, completion_tokens, int(record_reply))
+            )
+            self._db.commit()
+        self._cache.pop(key, None)
+
+    def get(self, key: str) -> List[Recording]:
+        """
+        Returns every recording of the request, oldest first.
+        """
+        recordings = self._cache.get(key)
+        if recordings is None:
+            with self._db_lock:
+                rows = self._db.execute(
+                    "SELECT response, latency, prompt_tokens, completion_tokens, record_reply FROM recordings WHERE key = ? ORDER BY id",
+                    (key,)
+                ).fetchall()
+            recordings = self._cache[key] = [
+                (zlib.decompress(row[0]).decode("utf-8"), row[1], row[2], row[3], bool(row[4])) for row in rows
+            ]
+        return recordings
+
+    def __len__(self) -> int:
+        with self._db_lock:
+            return self._db.execute("SELECT COUNT(*) FROM recordings").fetchone()[0]
+
+    def close(self):
+        with self._db_lock:
+            self._db.close()
@@ -0,0 +1,82 @@
+import asyncio
+from collections import defaultdict
+from typing import Dict, Optional
+from ..dependencies.memory.BaseMemory import BaseMemory
+from ..dependencies.memory.TokenCounter import TokenCounter
+from .LLM import LLM
+from .LLMConfig import LLMConfig
+from .RecordingStore import RecordingStore
+
+
+class ReplayLLM(LLM):
+    """
+    Serves responses recorded by RecordingLLM instead of calling a model, for offline load
+    testing. Requests are matched by RecordingStore.request_key; a request recorded several
+    times gets its recorded responses in turn.
+
+    With `reproduce_timing`, each call takes its recorded latency divided by `speedup`, so e.g.
+    `speedup=100` replays production traffic at 100x real time while keeping relative timings,
+    which is what graph scheduling depends on.
+    """
+
+    def __init__(self, store: RecordingStore, config: Optional[LLMConfig] = None, reproduce_timing: bool = False, speedup: float = 1.0, default_response: Optional[str] = None, messages=None, memory: Optional[BaseMemory] = None, token_counter: Optional[TokenCounter] = None):
+        """
+        Parameters:
+        - store: RecordingStore to serve responses from.
+        - config: Only used for its model name in traces and usage; defaults to LLMConfig().
+        - reproduce_timing: Wait for the recorded latency (divided by speedup) before answering.
+        - speedup: Factor by which recorded latencies are shortened.
+        - default_response: Returned for requests that weren't recorded. None raises KeyError.
+        - memory: The memory the recorded LLM used. Replayed histories must be compacted the same
+          way, otherwise every request after the first compaction misses.
+        - token_counter: Same as for the recorded LLM.
+        """
+        if speedup <= 0:
+            raise ValueError("speedup must be positive.")
+        super().__init__(config or LLMConfig(), messages, memory, token_counter)
+        self.store = store
+        self.reproduce_timing = reproduce_timing
+        self.speedup = speedup
+        self.default_response = default_response
+        self.misses = 0
+        self._served: Dict[str, int] = defaultdict(int)
+
+    async def run(self, prompt):
+        with self._llm_span():
+            return await self._call_api(prompt)
+
+    async def _call_api(self, prompt):
+        key = RecordingStore.request_key(self, prompt)
+        recordings = await asyncio.to_thread(self.store.get, key)
+        if not recordings:
+            self.misses += 1
+            if self.default_response is None:
+                # History is left untouched so the caller can carry on after a miss
+                raise KeyError(f"No recorded response for request {key}.")
+            await self._add_prompt(prompt)
+            self._record_usage(None, None, self.messages, self.default_response)
+            return self.default_response
+
+        response, latency, prompt_tokens, completion_tokens, record_reply = recordings[self._served[key] % len(recordings)]
+        self._served[key] += 1
+        await self._add_prompt(prompt)
+        if self.reproduce_timing and latency:
+            await asyncio.sleep(latency / self.speedup)
+        self._record_usage(prompt_tokens, completion_tokens, self.messages, response)
+        if record_reply:
+            self.add_messages([{"role": "assistant", "content": response}])
+        return response
+
+    async def _add_prompt(self, prompt):
+        # Same order as the provider backends, so histories match the recorded ones
+        self.add_messages([{"role": "user", "content": prompt}])
+        await self._compact_messages()
+
+    def add_messages(self, messages):
+        self.messages.extend(messages)
+
+    def add_sys_prompt(self, sys_prompt):
+        self.messages.append({"role": "system", "content": sys_prompt})
+
+    def clear_messages(self):
+        self.messages = []
@@ -0,0 +1,127 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """
+    Two-tier cache of LLM responses: an in-memory LRU in front of an optional SQLite file.
+    Entries expire after `ttl` seconds (None keeps them forever); expired rows are deleted from
+    the SQLite file when they are read.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None, path: Optional[str] = None):
+        """
+        Parameters:
+        - max_entries: Maximum number of entries held in memory before the least recently used is evicted.
+        - ttl: Seconds an entry stays valid, or None for no expiry.
+        - path: SQLite file for the persistent tier, or None to keep the cache in memory only.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = path
+        self._entries: "OrderedDict[str, Tuple[float, str, bool]]" = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        # Requests answered by an identical request that was already being made
+        self.coalesced = 0
+        # key -> future of a request being made for it, see CachedLLM
+        self.in_flight: Dict[str, asyncio.Future] = {}
+        self._db = None
+        self._db_lock = threading.Lock()
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, created REAL, response TEXT, record_reply INTEGER)"
+            )
+            self._db.commit()
+
+    async def get(self, key: str) -> Optional[Tuple[str, bool]]:
+        """
+        Returns (response, record_reply) for a live entry, or None on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and self._expired(entry[0]):
+            del self._entries[key]
+            entry = None
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1], entry[2]
+
+        if self._db is not None:
+            entry = await asyncio.to_thread(self._db_get, key)
+            if entry is not None:
+                self._remember(key, entry)
+                self.hits += 1
+                self.disk_hits += 1
+                return entry[1], entry[2]
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, response: str, record_reply: bool):
+        entry = (time.time(), response, record_reply)
+        self._remember(key, entry)
+        if self._db is not None:
+            await asyncio.to_thread(self._db_set, key, entry)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "coalesced": self.coalesced,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._entries),
+        }
+
+    def clear(self):
+        self._entries.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def close(self):
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+            self._db = None
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl is not None and time.time() - created > self.ttl
+
+    def _remember(self, key: str, entry: Tuple[float, str, bool]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _db_get(self, key: str) -> Optional[Tuple[float, str, bool]]:
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT created, response, record_reply FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self._expired(row[0]):
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                row = None
+        if row is None:
+            return None
+        return row[0], row[1], bool(row[2])
+
+    def _db_set(self, key: str, entry: Tuple[float, str, bool]):
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, created, response, record_reply) VALUES (?, ?, ?, ?)",
+                (key, entry[0], entry[1], int(entry[2]))
+            )
+            self._db.commit()
@@ -0,0 +1,37 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at `rate_per_minute`, holding at most one minute of budget.
+    """
+
+    def __init__(self, rate_per_minute: float):
+        self.capacity = float(rate_per_minute)
+        self.tokens = self.capacity
+        self.rate = rate_per_minute / 60.0
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float = 1):
+        # A single request larger than the whole budget waits for a full bucket instead of forever
+        amount = min(amount, self.capacity)
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def adjust(self, delta: float):
+        """
+        Returns (positive) or charges (negative) budget after the fact, e.g. once actual token
+        usage is known. The bucket may go into debt.
+        """
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + delta)
@@ -1,5 +1,42 @@
-from .OpenAILLM import OpenAILLM
+from importlib import import_module
+from typing import TYPE_CHECKING
 from .LLM import LLM
 from .LLMConfig import LLMConfig
-from .CustomLLM import CustomLLM
-from .AnthropicLLM import AnthropicLLM
+from .ClientPool import ClientPool
+from .ResponseCache import ResponseCache
+from .DelegatingLLM import DelegatingLLM
+from .CachedLLM import CachedLLM
+from .ConversationScope import ConversationScope
+from .BatchDispatcher import BatchDispatcher
+from .TokenBucket import TokenBucket
+from .RateLimiter import RateLimiter
+from .RecordingStore import RecordingStore
+from .RecordingLLM import RecordingLLM
+from .ReplayLLM import ReplayLLM
+
+if TYPE_CHECKING:
+    from .OpenAILLM import OpenAILLM
+    from .AnthropicLLM import AnthropicLLM
+    from .CustomLLM import CustomLLM
+
+# Provider backends pull in their SDKs, so they are only imported on first access. Import them
+# from this package: importing e.g. `dillagent.llm.OpenAILLM` directly binds the submodule here
+# under the class name.
+_LAZY = {
+    "OpenAILLM": ".OpenAILLM",
+    "AnthropicLLM": ".AnthropicLLM",
+    "CustomLLM": ".CustomLLM",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
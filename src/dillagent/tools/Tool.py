@@ -1,25 +1,78 @@
+from typing import Optional
+from pydantic import ValidationError
 from ..models.DescribedModel import DescribedModel
+from ..dependencies.policies.execution.ToolExecutionPolicy import ToolExecutionPolicy
+from ..tracing.Tracer import Tracer
 
 
 class Tool:
-    def __init__(self, name, description, schema: DescribedModel, func):
+    def __init__(self, name, description, schema: DescribedModel, func, execution_policy: Optional[ToolExecutionPolicy] = None):
         self.name = name
         self.description = description
         self.schema = schema
         self.func = func
+        self.execution_policy = execution_policy or ToolExecutionPolicy()
+        self._field_names = tuple(schema.model_fields) if schema is not None else ()
+        self._description_text: Optional[str] = None
 
     # Need to potentially reformt as the name confuses llms.
     def describe_tool(self):
-        name = f"{self.name}: "
-        input_info = "\n\tThe input to this tool should be:\n"
-        field_descriptions = self.schema.get_field_descriptions()
-        for field, description in field_descriptions.items():
-            # field_type = self.schema.__annotations__[field].__name__
-            input_info += f"\t{field}: {description}\n"
-        return name + self.description + input_info
+        # Rendered once so the text is byte-identical in every prompt built from this tool
+        if self._description_text is None:
+            name = f"{self.name}: "
+            input_info = "\n\tThe input to this tool should be:\n"
+            field_descriptions = self.schema.get_field_descriptions()
+            for field, description in field_descriptions.items():
+                # field_type = self.schema.__annotations__[field].__name__
+                input_info += f"\t{field}: {description}\n"
+            self._description_text = name + self.description + input_info
+        return self._description_text
 
+    def validate_input(self, to_input):
+        """
+        Validates LLM-provided arguments against the tool schema.
 
-def tool(name, description, schema):
+        Returns the (args, kwargs) to call the tool function with. Raises ValueError if the
+        arguments don't match the schema or include keys the schema doesn't define.
+
+        Tools with a schema receive the validated values: pydantic's coercions are applied (e.g.
+        "3" for an int field becomes 3) and every field is passed, with its default when the
+        LLM left it out.
+        """
+        if self.schema is None:
+            return ((), to_input) if isinstance(to_input, dict) else ((to_input,), {})
+
+        single_value = not isinstance(to_input, dict)
+        if single_value:
+            if len(self._field_names) != 1:
+                raise ValueError(
+                    f"Tool '{self.name}' expects {len(self._field_names)} named arguments but got a single value.")
+            to_input = {self._field_names[0]: to_input}
+
+        unknown = [key for key in to_input if key not in self._field_names]
+        if unknown:
+            raise ValueError(f"Invalid input for tool '{self.name}': unknown arguments {unknown}.")
+
+        try:
+            validated = self.schema.model_validate(to_input)
+        except ValidationError as e:
+            raise ValueError(f"Invalid input for tool '{self.name}': {e}") from e
+
+        kwargs = {field: getattr(validated, field) for field in self._field_names}
+        if single_value:
+            return (kwargs[self._field_names[0]],), {}
+        return (), kwargs
+
+    async def arun(self, *args, **kwargs):
+        """
+        Calls the tool function according to its execution policy.
+        """
+        with Tracer.start_span(self.name, "tool"):
+            return await self.execution_policy.run(self.func, *args, **kwargs)
+
+
+def tool(name, description, schema, execution_policy: Optional[ToolExecutionPolicy] = None, *, mode: str = 'thread', max_concurrency: Optional[int] = None, timeout: Optional[float] = None):
     def decorator(func):
-        return Tool(name, description, schema, func)
+        policy = execution_policy or ToolExecutionPolicy(mode, max_concurrency, timeout)
+        return Tool(name, description, schema, func, policy)
     return decorator
@@ -0,0 +1,70 @@
+import itertools
+import time
+from typing import Any, Dict, Optional
+
+_span_ids = itertools.count(1)
+
+
+class Span:
+    """
+    One timed operation: a graph run, a planner layer, an executor, an LLM call or a tool call.
+
+    Times are wall-clock nanoseconds since the epoch. `trace_id` is the span id of the run's root
+    span, shared by every span of that run.
+    """
+
+    def __init__(self, name: str, kind: str, parent: Optional["Span"] = None, attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.kind = kind
+        self.span_id = next(_span_ids)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.trace_id = parent.trace_id if parent is not None else self.span_id
+        self.attributes: Dict[str, Any] = attributes or {}
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """
+        Wall time in seconds; up to now for a span that hasn't ended.
+        """
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e9
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def increment(self, attribute: str, amount: float = 1):
+        self.attributes[attribute] = self.attributes.get(attribute, 0) + amount
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "trace_id": self.trace_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration": self.duration,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Span":
+        span = cls.__new__(cls)
+        span.name = data["name"]
+        span.kind = data["kind"]
+        span.span_id = data["span_id"]
+        span.parent_id = data["parent_id"]
+        span.trace_id = data["trace_id"]
+        span.attributes = data["attributes"]
+        span.start_ns = data["start_ns"]
+        span.end_ns = data["end_ns"]
+        span.error = data["error"]
+        return span
+
+    def __repr__(self):
+        return f"Span({self.kind}:{self.name}, {self.duration * 1000:.1f}ms)"
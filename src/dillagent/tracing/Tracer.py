@@ -0,0 +1,103 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+from .Span import Span
+from .sinks.BaseSpanSink import BaseSpanSink
+
+_active_tracer: ContextVar[Optional["Tracer"]] = ContextVar("dillagent_tracer", default=None)
+_active_span: ContextVar[Optional[Span]] = ContextVar("dillagent_span", default=None)
+
+
+class Tracer:
+    """
+    Records spans for graph runs, planner layers, executors, LLM calls and tool calls and
+    hands finished spans to its sinks.
+
+    Tracing is off unless a tracer is active, in which case instrumentation costs a single
+    context variable lookup. Activate a tracer for a block (including tasks started in it):
+
+        tracer = Tracer([MemorySpanSink()])
+        with tracer:
+            await graph_executor.run(...)
+
+    or for the whole process with `tracer.install()`.
+    """
+
+    _global: Optional["Tracer"] = None
+
+    def __init__(self, sinks: Optional[List[BaseSpanSink]] = None):
+        """
+        Parameters:
+        - sinks: Receivers of started and finished spans.
+        """
+        self.sinks: List[BaseSpanSink] = list(sinks or [])
+        self._token = None
+
+    @classmethod
+    def current(cls) -> Optional["Tracer"]:
+        return _active_tracer.get() or cls._global
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        return _active_span.get()
+
+    @classmethod
+    def start_span(cls, name: str, kind: str, activate: bool = True, **attributes):
+        """
+        Context manager timing the enclosed block as a child of the current span. Yields the Span,
+        or None when tracing is off.
+
+        Parameters:
+        - activate: Make the span the current span inside the block, so nested spans become its
+          children. Async generators pass False: their caller's code runs between their yields.
+        """
+        tracer = cls.current()
+        if tracer is None:
+            return _no_span()
+        return tracer._span(name, kind, activate, attributes)
+
+    @contextmanager
+    def _span(self, name: str, kind: str, activate: bool, attributes) -> Iterator[Span]:
+        span = Span(name, kind, _active_span.get(), attributes)
+        for sink in self.sinks:
+            sink.on_start(span)
+        token = _active_span.set(span) if activate else None
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            if token is not None:
+                _active_span.reset(token)
+            span.end_ns = time.time_ns()
+            for sink in self.sinks:
+                sink.on_end(span)
+
+    def install(self):
+        """
+        Makes this tracer active everywhere a tracer isn't set explicitly.
+        """
+        Tracer._global = self
+
+    def uninstall(self):
+        if Tracer._global is self:
+            Tracer._global = None
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+    def __enter__(self) -> "Tracer":
+        self._token = _active_tracer.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _active_tracer.reset(self._token)
+        self._token = None
+
+
+@contextmanager
+def _no_span() -> Iterator[None]:
+    yield None
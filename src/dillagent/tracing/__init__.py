@@ -0,0 +1,3 @@
+from .Span import Span
+from .Tracer import Tracer
+from .sinks import BaseSpanSink, MemorySpanSink, JsonlSpanSink, OpenTelemetrySpanSink
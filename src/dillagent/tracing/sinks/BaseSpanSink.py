@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class BaseSpanSink(ABC):
+    def on_start(self, span):
+        pass
+
+    @abstractmethod
+    def on_end(self, span):
+        pass
+
+    def close(self):
+        pass
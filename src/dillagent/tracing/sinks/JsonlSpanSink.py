@@ -0,0 +1,28 @@
+import json
+import threading
+from .BaseSpanSink import BaseSpanSink
+
+
+class JsonlSpanSink(BaseSpanSink):
+    """
+    Appends every finished span to a file as one JSON object per line. Load the file with
+    `MemorySpanSink.from_jsonl` to analyse it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def on_end(self, span):
+        line = json.dumps(span.to_dict(), separators=(",", ":"), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def flush(self):
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
@@ -0,0 +1,112 @@
+import json
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from ..Span import Span
+from .BaseSpanSink import BaseSpanSink
+
+
+class MemorySpanSink(BaseSpanSink):
+    """
+    Keeps finished spans in memory and analyses them, e.g. the critical path of a run.
+    """
+
+    def __init__(self, max_spans: Optional[int] = 100_000):
+        """
+        Parameters:
+        - max_spans: Number of most recent spans kept, or None to keep all of them.
+        """
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+
+    @classmethod
+    def from_jsonl(cls, path: str) -> "MemorySpanSink":
+        sink = cls(max_spans=None)
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    sink.on_end(Span.from_dict(json.loads(line)))
+        return sink
+
+    def on_end(self, span: Span):
+        self._spans.append(span)
+
+    def spans(self, trace_id: Optional[int] = None) -> List[Span]:
+        if trace_id is None:
+            return list(self._spans)
+        return [span for span in self._spans if span.trace_id == trace_id]
+
+    def roots(self) -> List[Span]:
+        return [span for span in self._spans if span.parent_id is None]
+
+    def clear(self):
+        self._spans.clear()
+
+    def critical_path(self, trace_id: Optional[int] = None) -> List[Tuple[Span, float]]:
+        """
+        Returns the chain of spans that determined the run's total duration, in start order, as
+        (span, seconds) pairs where seconds is the part of the critical path spent in the span
+        itself rather than in one of its critical children. Defaults to the most recent run.
+        """
+        root = self._root(trace_id)
+        children: Dict[int, List[Span]] = defaultdict(list)
+        for span in self.spans(root.trace_id):
+            if span.parent_id is not None and span.end_ns is not None:
+                children[span.parent_id].append(span)
+        return sorted(self._walk(root, children), key=lambda step: step[0].start_ns)
+
+    def _walk(self, span: Span, children: Dict[int, List[Span]]) -> List[Tuple[Span, float]]:
+        # Going backwards from the span's end, the child finishing last is what the span waited
+        # on; before that child started, the next child finishing before it, and so on.
+        path: List[Tuple[Span, float]] = []
+        cursor = span.end_ns
+        own_ns = 0
+        for child in sorted(children.get(span.span_id, ()), key=lambda child: child.end_ns, reverse=True):
+            if child.end_ns > cursor:
+                continue
+            own_ns += cursor - child.end_ns
+            path.extend(self._walk(child, children))
+            cursor = child.start_ns
+        own_ns += max(cursor - span.start_ns, 0)
+        return [(span, own_ns / 1e9)] + path
+
+    def critical_path_report(self, trace_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Summarizes the critical path of a run: its steps and how much of the run's duration each
+        agent (executor span) accounts for, including its LLM and tool calls. The agent with the
+        largest share is reported as the bottleneck.
+        """
+        root = self._root(trace_id)
+        path = self.critical_path(root.trace_id)
+        by_id = {span.span_id: span for span in self.spans(root.trace_id)}
+
+        by_agent: Dict[str, float] = defaultdict(float)
+        for span, seconds in path:
+            agent = self._owning_executor(span, by_id)
+            if agent is not None:
+                by_agent[agent] += seconds
+
+        return {
+            "trace_id": root.trace_id,
+            "name": root.name,
+            "duration": root.duration,
+            "path": [
+                {"name": span.name, "kind": span.kind, "duration": span.duration, "critical_time": seconds}
+                for span, seconds in path
+            ],
+            "by_agent": dict(sorted(by_agent.items(), key=lambda item: item[1], reverse=True)),
+            "bottleneck": max(by_agent, key=by_agent.get) if by_agent else None,
+        }
+
+    def _root(self, trace_id: Optional[int]) -> Span:
+        roots = self.roots()
+        if trace_id is not None:
+            roots = [span for span in roots if span.trace_id == trace_id]
+        if not roots:
+            raise KeyError(f"No finished run found for trace {trace_id}." if trace_id is not None else "No finished run found.")
+        return roots[-1]
+
+    def _owning_executor(self, span: Span, by_id: Dict[int, Span]) -> Optional[str]:
+        while span is not None:
+            if span.kind == "executor":
+                return span.name
+            span = by_id.get(span.parent_id)
+        return None
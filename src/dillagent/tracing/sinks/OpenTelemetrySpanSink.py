@@ -0,0 +1,40 @@
+from typing import Dict
+from .BaseSpanSink import BaseSpanSink
+
+
+class OpenTelemetrySpanSink(BaseSpanSink):
+    """
+    Mirrors spans into OpenTelemetry, keeping their parent/child structure, so they can be
+    exported with any OpenTelemetry SDK exporter. Requires the `opentelemetry-api` package.
+    """
+
+    def __init__(self, tracer=None):
+        """
+        Parameters:
+        - tracer: An OpenTelemetry tracer. Defaults to the global provider's "dillagent" tracer.
+        """
+        from opentelemetry import trace
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("dillagent")
+        self._open_spans: Dict[int, object] = {}
+
+    def on_start(self, span):
+        parent = self._open_spans.get(span.parent_id)
+        context = self._trace.set_span_in_context(parent) if parent is not None else None
+        self._open_spans[span.span_id] = self.tracer.start_span(
+            span.name,
+            context=context,
+            start_time=span.start_ns,
+            attributes={"dillagent.kind": span.kind},
+        )
+
+    def on_end(self, span):
+        otel_span = self._open_spans.pop(span.span_id, None)
+        if otel_span is None:
+            return
+        for key, value in span.attributes.items():
+            if isinstance(value, (str, bool, int, float)):
+                otel_span.set_attribute(f"dillagent.{key}", value)
+        if span.error is not None:
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, span.error))
+        otel_span.end(end_time=span.end_ns)
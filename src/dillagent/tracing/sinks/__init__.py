@@ -0,0 +1,4 @@
+from .BaseSpanSink import BaseSpanSink
+from .MemorySpanSink import MemorySpanSink
+from .JsonlSpanSink import JsonlSpanSink
+from .OpenTelemetrySpanSink import OpenTelemetrySpanSink
@@ -1 +1,38 @@
-from .BaseWorkflowExecutor import BaseWorkflowExecutor
\ No newline at end of file
+from importlib import import_module
+from typing import TYPE_CHECKING
+from .BaseWorkflowExecutor import BaseWorkflowExecutor
+
+if TYPE_CHECKING:
+    from .graphs.clusters import BaseAgentCluster
+    from .graphs.executors import BaseAgentGraphExecutor, NodeOutputCache, PlannerAgentGraphExecutor
+    from .graphs.graphs import BaseAgentGraph, GraphTopology
+    from .signalFlows.executors import BaseSignalFlowExecutor
+    from .signalFlows.signalFlows import BaseSignal, BaseSignalFlow, SignalPayload, SignalPool
+
+# Graphs and signal flows pull in the agents, so they are only imported on first access
+_LAZY = {
+    "BaseAgentCluster": ".graphs.clusters",
+    "BaseAgentGraphExecutor": ".graphs.executors",
+    "NodeOutputCache": ".graphs.executors",
+    "PlannerAgentGraphExecutor": ".graphs.executors",
+    "BaseAgentGraph": ".graphs.graphs",
+    "GraphTopology": ".graphs.graphs",
+    "BaseSignalFlowExecutor": ".signalFlows.executors",
+    "BaseSignal": ".signalFlows.signalFlows",
+    "SignalPayload": ".signalFlows.signalFlows",
+    "BaseSignalFlow": ".signalFlows.signalFlows",
+    "SignalPool": ".signalFlows.signalFlows",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,16 +1,53 @@
 from abc import abstractmethod
-from typing import Dict, Any, Set
+from typing import AsyncIterator, Dict, Any, Iterable, List, Optional, Set, Tuple
 from ....agents.executors.BaseAgentExecutor import BaseAgentExecutor
 from ..graphs.BaseAgentGraph import BaseAgentGraph
 from ...BaseWorkflowExecutor import BaseWorkflowExecutor
+from ....llm.ConversationScope import ConversationScope
+from ....dependencies.policies.error.Deadline import Deadline
+from .NodeOutputCache import NodeOutputCache
+from ....tracing.Tracer import Tracer
 import asyncio
+import copy
+import heapq
+from array import array
+import itertools
+import time
 
 class BaseAgentGraphExecutor(BaseWorkflowExecutor):
-    def __init__(self, graph: BaseAgentGraph):
+    def __init__(self, graph: BaseAgentGraph, max_concurrency: Optional[int] = None, priorities: Optional[Dict[BaseAgentExecutor, int]] = None, deadline: Optional[float] = None, cacheable: Optional[Iterable[BaseAgentExecutor]] = None, node_cache: Optional[NodeOutputCache] = None):
+        """
+        Parameters:
+        - graph: The BaseAgentGraph to execute.
+        - max_concurrency: Maximum number of executors running at once, or None for no limit.
+        - priorities: Optional executor -> priority mapping. When more executors are ready than
+          max_concurrency allows, higher priorities are started first. Defaults to 0.
+        - deadline: Seconds allowed for each run_iteration call. Propagated to every agent's error
+          policy through Deadline, so no call outlives it.
+        - cacheable: Executors whose output may be reused when their inputs and agent configuration
+          are unchanged. Only mark deterministic nodes whose tools have no side effects and whose
+          output doesn't depend on earlier conversation history. Nothing is cached by default.
+        - node_cache: NodeOutputCache holding the outputs. Created when cacheable is given.
+        """
         self.graph = graph
         self.graph.validate_graph()
-        self.execution_layers = graph.get_execution_layers()
         self.state: Dict[BaseAgentExecutor, Dict[str, Any]] = {}
+        self.max_concurrency = max_concurrency
+        self.priorities: Dict[BaseAgentExecutor, int] = dict(priorities or {})
+        self.deadline = deadline
+        self.cacheable: Set[BaseAgentExecutor] = set(cacheable or ())
+        self.node_cache = node_cache if node_cache is not None or not self.cacheable else NodeOutputCache()
+
+    def set_priority(self, executor: BaseAgentExecutor, priority: int):
+        self.priorities[executor] = priority
+
+    def set_cacheable(self, executor: BaseAgentExecutor, cacheable: bool = True):
+        if cacheable:
+            self.cacheable.add(executor)
+            if self.node_cache is None:
+                self.node_cache = NodeOutputCache()
+        else:
+            self.cacheable.discard(executor)
 
     @abstractmethod
     async def run(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -20,20 +57,103 @@ class BaseAgentGraphExecutor(BaseWorkflowExecutor):
         """
         pass
 
-    async def run_iteration(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        executed: Set[BaseAgentExecutor] = set()
+    def _fork(self) -> "BaseAgentGraphExecutor":
+        """
+        Returns a shallow copy sharing the graph and configuration but with its own run state.
+        """
+        clone = copy.copy(self)
+        clone.state = {}
+        return clone
+
+    async def _run_isolated(self, index: int, input_data: Dict[str, Any], semaphore: Optional[asyncio.Semaphore], return_exceptions: bool, run_kwargs: Dict[str, Any]):
+        async def run():
+            # Each request gets its own executor state and LLM conversation histories
+            with ConversationScope():
+                return await self._fork().run(input_data, **run_kwargs)
+
+        try:
+            if semaphore is None:
+                return index, await run()
+            async with semaphore:
+                return index, await run()
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            return index, e
+
+    async def amap(self, inputs: List[Dict[str, Any]], max_concurrency: Optional[int] = None, return_exceptions: bool = False, **run_kwargs) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Runs independent requests through the graph concurrently, yielding (index, result)
+        pairs as they complete. Each request has isolated executor state and conversation
+        histories, so requests cannot see or corrupt each other.
+
+        Parameters:
+        - inputs: One input_data dict per request, as passed to `run`.
+        - max_concurrency: Maximum number of requests in flight, or None for no limit.
+        - return_exceptions: Yield a failed request's exception as its result instead of raising.
+        - run_kwargs: Extra keyword arguments passed to every `run` call.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        tasks = [
+            asyncio.ensure_future(self._run_isolated(i, input_data, semaphore, return_exceptions, run_kwargs))
+            for i, input_data in enumerate(inputs)
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def run_batch(self, inputs: List[Dict[str, Any]], max_concurrency: Optional[int] = None, return_exceptions: bool = False, **run_kwargs) -> List[Any]:
+        """
+        Like `amap`, but waits for every request and returns the results in input order.
+        """
+        results: List[Any] = [None] * len(inputs)
+        async for index, result in self.amap(inputs, max_concurrency, return_exceptions, **run_kwargs):
+            results[index] = result
+        return results
+
+    async def run_iteration(self, input_data: Dict[str, Any], events: Optional[asyncio.Queue] = None) -> Dict[str, Any]:
+        with Deadline(self.deadline), Tracer.start_span(type(self).__name__, "graph"):
+            return await self._run_dataflow(input_data, events)
 
-        for layer in self.execution_layers:
-            tasks = []
-            for executor in layer:
-                upstream_inputs = self._collect_upstream_outputs(executor, input_data)
-                tasks.append(self._run_executor(executor, upstream_inputs))
+    async def _run_dataflow(self, input_data: Dict[str, Any], events: Optional[asyncio.Queue]) -> Dict[str, Any]:
+        # Dataflow scheduling: each executor starts as soon as all of its upstream executors
+        # have produced output, rather than waiting for the whole previous layer to finish.
+        topology = self.graph.get_topology()
+        nodes = topology.nodes
+        remaining_upstream = array('i', topology.in_degrees)
+        ready: List[Tuple[int, int, int]] = []
+        ready_since = array('d', [0.0]) * len(nodes)
+        order = itertools.count()
+        for i in range(len(nodes)):
+            if remaining_upstream[i] == 0:
+                heapq.heappush(ready, (-self.priorities.get(nodes[i], 0), next(order), i))
+                ready_since[i] = time.monotonic()
 
-            results = await asyncio.gather(*tasks)
+        running: Dict[asyncio.Task, int] = {}
+        try:
+            while ready or running:
+                while ready and (self.max_concurrency is None or len(running) < self.max_concurrency):
+                    _, _, i = heapq.heappop(ready)
+                    upstream_inputs = self._collect_upstream_outputs(nodes[i], input_data)
+                    queue_time = time.monotonic() - ready_since[i]
+                    running[asyncio.ensure_future(self._dispatch_executor(nodes[i], upstream_inputs, events, queue_time))] = i
 
-            for executor, output in results:
-                self.state[executor] = output
-                executed.add(executor)
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    i = running.pop(task)
+                    executor, output = task.result()
+                    self.state[executor] = output
+                    for j in topology.downstream(i):
+                        remaining_upstream[j] -= 1
+                        if remaining_upstream[j] == 0:
+                            heapq.heappush(ready, (-self.priorities.get(nodes[j], 0), next(order), j))
+                            ready_since[j] = time.monotonic()
+        finally:
+            for task in running:
+                task.cancel()
 
         return self._collect_final_outputs()
 
@@ -42,6 +162,76 @@ class BaseAgentGraphExecutor(BaseWorkflowExecutor):
         
         return executor, output
 
+    async def _dispatch_executor(self, executor: BaseAgentExecutor, inputs: Dict[str, Any], events: Optional[asyncio.Queue], queue_time: Optional[float] = None):
+        """
+        Parameters:
+        - queue_time: Seconds the executor waited for a concurrency slot after becoming ready,
+          recorded on its tracing span.
+        """
+        with Tracer.start_span(executor.agent.name, "executor") as span:
+            if span is not None and queue_time is not None:
+                span.set(queue_time=queue_time)
+            if executor in self.cacheable and self.node_cache is not None:
+                return await self._run_memoized(executor, inputs, events)
+            if events is None:
+                return await self._run_executor(executor, inputs)
+            return await self._stream_executor(executor, inputs, events)
+
+    async def _run_memoized(self, executor: BaseAgentExecutor, inputs: Dict[str, Any], events: Optional[asyncio.Queue]):
+        key = self.node_cache.key(executor, inputs)
+        output = self.node_cache.get(key)
+        span = Tracer.current_span()
+        if span is not None:
+            span.set(cache_hit=output is not None)
+        if output is not None:
+            if events is not None:
+                await events.put({"agent": executor.agent.name, "type": "output", "output": output, "cached": True})
+            return executor, output
+
+        if events is None:
+            executor, output = await self._run_executor(executor, inputs)
+        else:
+            executor, output = await self._stream_executor(executor, inputs, events)
+        self.node_cache.set(key, output)
+        return executor, output
+
+    async def _stream_executor(self, executor: BaseAgentExecutor, inputs: Dict[str, Any], events: asyncio.Queue):
+        """
+        Runs an executor through its streaming API, forwarding every event to `events`
+        tagged with the agent name.
+        """
+        output = None
+        async for event in executor.astream(inputs):
+            if event["type"] == "output":
+                output = event["output"]
+            await events.put({"agent": executor.agent.name, **event})
+        return executor, output
+
+    async def _stream_from(self, run) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Runs `run(events)` in the background and yields the events it produces until it finishes.
+        """
+        events: asyncio.Queue = asyncio.Queue()
+        done = object()
+        task = asyncio.ensure_future(run(events))
+        task.add_done_callback(lambda _: events.put_nowait(done))
+        try:
+            while True:
+                event = await events.get()
+                if event is done:
+                    break
+                yield event
+            await task
+        finally:
+            task.cancel()
+
+    async def astream_iteration(self, input_data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of run_iteration yielding agent-tagged events as they happen.
+        """
+        async for event in self._stream_from(lambda events: self.run_iteration(input_data, events)):
+            yield event
+
     def _collect_upstream_outputs(self, executor: BaseAgentExecutor, input_data: Dict[str, Any]) -> Dict[str, Any]:
         upstream = self.graph.get_upstream_executors(executor)
         if not upstream:
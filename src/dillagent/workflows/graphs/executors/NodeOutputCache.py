@@ -0,0 +1,91 @@
+import copy
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class NodeOutputCache:
+    """
+    Content-addressed cache of graph node outputs.
+
+    Entries are keyed by a hash of the node's inputs together with its agent configuration
+    (executor and agent type, name, system prompt, tools and LLM settings), so a node whose
+    upstream outputs didn't change is served from the cache, while everything downstream of a
+    change runs again. Several graph executors may share one cache. Input values that aren't
+    JSON are keyed by their type and repr, so objects without a stable repr are never served from
+    the cache.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Parameters:
+        - max_entries: Maximum number of outputs kept before the least recently used is evicted.
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, executor, inputs: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            {"node": self._fingerprint(executor), "inputs": inputs},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=self._encode_other,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _encode_other(value) -> Dict[str, str]:
+        # Tagged with the type, so e.g. a set can't share a key with the string of its repr
+        return {"$type": f"{type(value).__module__}.{type(value).__qualname__}", "repr": repr(value)}
+
+    def _fingerprint(self, executor) -> Dict[str, Any]:
+        agent = executor.agent
+        llm = getattr(agent, "llm", None)
+        config = getattr(llm, "config", None)
+        sys_prompt = getattr(agent, "sys_prompt", None)
+        return {
+            "executor": type(executor).__name__,
+            "tool_keys": [executor.tool_indicator_key, executor.tool_name_key, executor.tool_input_key, executor.tool_output_key],
+            "agent": type(agent).__name__,
+            "name": agent.name,
+            "sys_prompt": getattr(sys_prompt, "prompt_str", None),
+            "tools": [tool.name for tool in getattr(agent, "tools", None) or []],
+            "llm": [
+                type(llm).__name__,
+                getattr(config, "model", None),
+                getattr(config, "path", None),
+                getattr(config, "temperature", None),
+                getattr(config, "max_tokens", None),
+            ],
+        }
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        output = self._entries.get(key)
+        if output is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        # Callers may modify the returned state, the cached copy must stay intact
+        return copy.deepcopy(output)
+
+    def set(self, key: str, output: Dict[str, Any]):
+        self._entries[key] = copy.deepcopy(output)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._entries),
+        }
+
+    def clear(self):
+        self._entries.clear()
@@ -1,22 +1,97 @@
 import asyncio
 import json
-from typing import Dict, Any, List
+import logging
+import uuid
+from typing import AsyncIterator, Dict, Any, Iterable, List, Optional, Set
 from ..graphs.BaseAgentGraph import BaseAgentGraph
 from .BaseAgentGraphExecutor import BaseAgentGraphExecutor
+from .NodeOutputCache import NodeOutputCache
+from ....tracing.Tracer import Tracer
 from ....agents.executors.BaseAgentExecutor import BaseAgentExecutor
+from ....dependencies.policies.error.Deadline import Deadline
+from ....dependencies.checkpoints.BaseCheckpointStore import BaseCheckpointStore
+
+logger = logging.getLogger(__name__)
 
 class PlannerAgentGraphExecutor(BaseAgentGraphExecutor):
-    def __init__(self, graph: BaseAgentGraph, planner_executor: BaseAgentExecutor, logging_enabled: bool = False):
-        self.graph = graph
+    def __init__(self, graph: BaseAgentGraph, planner_executor: BaseAgentExecutor, logging_enabled: bool = False, state_diff: bool = False, compact_json: bool = True, max_output_chars: Optional[int] = None, output_size_caps: Optional[Dict[str, int]] = None, deadline: Optional[float] = None, checkpoint_store: Optional[BaseCheckpointStore] = None, cacheable: Optional[Iterable[BaseAgentExecutor]] = None, node_cache: Optional[NodeOutputCache] = None):
+        """
+        Parameters:
+        - graph: The BaseAgentGraph whose executors the planner chooses from.
+        - planner_executor: Executor wrapping the planner agent.
+        - logging_enabled: Print planner inputs and outputs.
+        - state_diff: Send the planner only executor outputs that changed since it last saw them,
+          and each agent description only once. Relies on the planner LLM keeping its history.
+        - compact_json: Encode planner input without indentation or extra whitespace.
+        - max_output_chars: Default cap on the encoded size of one agent's output. Larger outputs
+          are replaced by a reference that can be resolved with `resolve_output_reference`.
+        - output_size_caps: Per agent name caps overriding max_output_chars.
+        - deadline: Seconds allowed for a whole run, propagated to every agent's error policy.
+        - checkpoint_store: Store the run is checkpointed to after every layer (executor state,
+          planner position and every agent's conversation history), so an interrupted run can be
+          continued with `resume`. Checkpoints are written in the background.
+        - cacheable, node_cache: Reuse outputs of deterministic agents whose planner-given input
+          is unchanged, see BaseAgentGraphExecutor.
+        """
+        super().__init__(graph, deadline=deadline, cacheable=cacheable, node_cache=node_cache)
         self.planner_executor = planner_executor
         self.logging_enabled = logging_enabled
-        self.state: Dict[BaseAgentExecutor, Dict[str, Any]] = {}
-        
+        self.state_diff = state_diff
+        self.compact_json = compact_json
+        self.max_output_chars = max_output_chars
+        self.output_size_caps: Dict[str, int] = dict(output_size_caps or {})
+        self.output_references: Dict[str, Any] = {}
+        self.checkpoint_store = checkpoint_store
+        self.run_id: Optional[str] = None
+        self._state_versions: Dict[BaseAgentExecutor, int] = {}
+        self._planner_seen_versions: Dict[BaseAgentExecutor, int] = {}
+        self._planner_described: Set[BaseAgentExecutor] = set()
+        self._planner_turns = 0
+
+    def _set_state(self, executor: BaseAgentExecutor, output: Dict[str, Any]):
+        self.state[executor] = output
+        self._state_versions[executor] = self._state_versions.get(executor, 0) + 1
+
+    def _reset_state(self):
+        self.state = {}
+        self.output_references = {}
+        self._state_versions = {}
+        self._planner_seen_versions = {}
+        self._planner_described = set()
+        self._planner_turns = 0
+
+    def _fork(self) -> "PlannerAgentGraphExecutor":
+        clone = super()._fork()
+        clone._reset_state()
+        return clone
+
+    def _encode(self, value) -> str:
+        if self.compact_json:
+            return json.dumps(value, separators=(",", ":"), default=str)
+        return json.dumps(value, indent=2, default=str)
+
+    def _cap_output(self, executor: BaseAgentExecutor, output):
+        cap = self.output_size_caps.get(executor.agent.name, self.max_output_chars)
+        if cap is None:
+            return output
+        encoded = self._encode(output)
+        if len(encoded) <= cap:
+            return output
+        ref = f"{executor.agent.name}@{self._state_versions.get(executor, 0)}"
+        self.output_references[ref] = output
+        return {"$ref": ref, "size": len(encoded), "preview": encoded[:cap // 2]}
+
+    def resolve_output_reference(self, ref: str):
+        return self.output_references[ref]
+
     def _prepare_planner_input_for_next_iteration(self, state, layer: List[BaseAgentExecutor], original_query):
+        if self.state_diff:
+            return self._prepare_planner_state_diff(state, layer, original_query)
+
         # Flatten executor state to agent-name: output mapping
         flattened_state = {
             "exectuor_states_from_last_iteration": {
-            executor.agent.name: output
+            executor.agent.name: self._cap_output(executor, output)
             for executor, output in state.items()
             }
         }
@@ -30,66 +105,205 @@ class PlannerAgentGraphExecutor(BaseAgentGraphExecutor):
             **flattened_state
         }
 
-        output = {"PlannerAgent_input": json.dumps(planner_input_dict, indent=2)}
+        output = {"PlannerAgent_input": self._encode(planner_input_dict)}
 
         # Return as properly formatted input
         return output
 
-    async def run(self, input_data: Dict[str, Any], max_iterations=10) -> Dict[str, Any]:
-        self.state = {}
-        self.original_query = input_data.get("PlannerAgent_input", "")
+    def _prepare_planner_state_diff(self, state, layer: List[BaseAgentExecutor], original_query):
+        # Only what changed since the planner's previous turn; earlier turns are in its history
+        updated_states = {}
+        for executor, output in state.items():
+            version = self._state_versions.get(executor, 0)
+            if self._planner_seen_versions.get(executor) != version:
+                updated_states[executor.agent.name] = self._cap_output(executor, output)
+                self._planner_seen_versions[executor] = version
+
+        available_agents = []
+        for ex in layer:
+            if ex in self._planner_described:
+                available_agents.append(ex.agent.name)
+            else:
+                available_agents.append(f'{ex.agent.name}: {ex.agent.describe()}')
+                self._planner_described.add(ex)
+
+        planner_input_dict = {"available_agents": available_agents}
+        if updated_states:
+            planner_input_dict["updated_executor_states"] = updated_states
+        # The query is only needed on the first turn of a run
+        if not self._planner_turns:
+            planner_input_dict = {"original_query": original_query, **planner_input_dict}
+        self._planner_turns += 1
+
+        return {"PlannerAgent_input": self._encode(planner_input_dict)}
+
+    async def run(self, input_data: Dict[str, Any], max_iterations=10, events: Optional[asyncio.Queue] = None, run_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Parameters:
+        - input_data: {"PlannerAgent_input": query}.
+        - max_iterations: Maximum number of passes over the graph.
+        - run_id: Id the run is checkpointed under. Generated when a checkpoint_store is set and
+          none is given; available as `self.run_id`.
+        """
+        with Deadline(self.deadline), Tracer.start_span(type(self).__name__, "graph") as span:
+            self._reset_state()
+            self.run_id = run_id or (uuid.uuid4().hex if self.checkpoint_store is not None else None)
+            self.original_query = input_data.get("PlannerAgent_input", "")
+            if span is not None:
+                span.set(run_id=self.run_id)
+            return await self._run_passes(0, 0, max_iterations, events)
+
+    async def resume(self, run_id: str, max_iterations=10, events: Optional[asyncio.Queue] = None) -> Dict[str, Any]:
+        """
+        Continues a checkpointed run after its last completed layer, restoring executor state and
+        agent histories, so finished agents are not run again. A completed run returns its outputs.
+        Raises KeyError if the store has no checkpoint for run_id.
+        """
+        if self.checkpoint_store is None:
+            raise ValueError("resume requires a checkpoint_store.")
+        checkpoint = await self.checkpoint_store.load(run_id)
+        if checkpoint is None:
+            raise KeyError(f"No checkpoint found for run '{run_id}'.")
+
+        with Deadline(self.deadline), Tracer.start_span(type(self).__name__, "graph", run_id=run_id, resumed=True):
+            self._restore_checkpoint(run_id, checkpoint)
+            if checkpoint["completed"]:
+                return self._collect_final_outputs()
+            return await self._run_passes(checkpoint["iteration"], checkpoint["next_layer"], max_iterations, events)
+
+    async def _run_passes(self, iteration: int, start_layer: int, max_iterations, events: Optional[asyncio.Queue]) -> Dict[str, Any]:
         planner_key = f"{self.planner_executor.agent.name}_input"
         planner_input = {planner_key: self.original_query}
-        iteration = 0
 
-        while True:
-            if max_iterations is not None and iteration >= max_iterations:
-                break
-            
-            terminated = await self._run_one_full_pass(planner_input)
-            if terminated:
-                break
+        failed = True
+        try:
+            while True:
+                if max_iterations is not None and iteration >= max_iterations:
+                    break
+
+                terminated = await self._run_one_full_pass(planner_input, events, iteration, start_layer)
+                start_layer = 0
+                if terminated:
+                    break
+
+                # Prepare planner input for next iteration
+                iteration += 1
+
+            self._checkpoint(iteration, 0, completed=True)
+            failed = False
+        finally:
+            if self.checkpoint_store is not None and self.run_id is not None:
+                try:
+                    await self.checkpoint_store.flush(self.run_id)
+                except Exception:
+                    if not failed:
+                        raise
+                    # Don't hide the error that stopped the run
+                    logger.exception("Failed to write the checkpoint of run '%s'.", self.run_id)
+
+        return self._collect_final_outputs()
+
+    def _executors_by_name(self) -> Dict[str, BaseAgentExecutor]:
+        executors = {ex.agent.name: ex for ex in self.graph.get_all_executors()}
+        executors[self.planner_executor.agent.name] = self.planner_executor
+        return executors
+
+    def _checkpoint(self, iteration: int, next_layer: int, completed: bool = False):
+        if self.checkpoint_store is None or self.run_id is None:
+            return
+        histories = {}
+        for name, ex in self._executors_by_name().items():
+            llm = getattr(ex.agent, "llm", None)
+            if llm is not None:
+                histories[name] = list(llm.messages)
+        # Only new containers: the store serializes the checkpoint later, in a background thread
+        self.checkpoint_store.save_nowait(self.run_id, {
+            "completed": completed,
+            "original_query": self.original_query,
+            "iteration": iteration,
+            "next_layer": next_layer,
+            "layers": [sorted(ex.agent.name for ex in layer) for layer in self.graph.get_execution_layers(include_output_executors=True)],
+            "state": {ex.agent.name: output for ex, output in self.state.items()},
+            "state_versions": {ex.agent.name: version for ex, version in self._state_versions.items()},
+            "planner_seen_versions": {ex.agent.name: version for ex, version in self._planner_seen_versions.items()},
+            "planner_described": sorted(ex.agent.name for ex in self._planner_described),
+            "planner_turns": self._planner_turns,
+            "output_references": dict(self.output_references),
+            "histories": histories,
+        })
+
+    def _restore_checkpoint(self, run_id: str, checkpoint: Dict[str, Any]):
+        layers = [sorted(ex.agent.name for ex in layer) for layer in self.graph.get_execution_layers(include_output_executors=True)]
+        if checkpoint["layers"] != layers:
+            raise ValueError(f"Run '{run_id}' was checkpointed with a different graph structure.")
+
+        executors = self._executors_by_name()
+        self._reset_state()
+        self.run_id = run_id
+        self.original_query = checkpoint["original_query"]
+        self.state = {executors[name]: output for name, output in checkpoint["state"].items()}
+        self._state_versions = {executors[name]: version for name, version in checkpoint["state_versions"].items()}
+        self._planner_seen_versions = {executors[name]: version for name, version in checkpoint["planner_seen_versions"].items()}
+        self._planner_described = {executors[name] for name in checkpoint["planner_described"]}
+        self._planner_turns = checkpoint["planner_turns"]
+        self.output_references = checkpoint["output_references"]
+        for name, history in checkpoint["histories"].items():
+            executors[name].agent.llm.messages = history
 
-            # Prepare planner input for next iteration
+    async def astream(self, input_data: Dict[str, Any], max_iterations=10) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Runs the graph like run, yielding partial outputs as they are produced. Every event is
+        tagged with the name of the agent that produced it (the planner included), e.g.
+        {"agent": "WeatherAgent", "type": "token", "delta": "..."}.
+        """
+        async for event in self._stream_from(lambda events: self.run(input_data, max_iterations, events)):
+            yield event
 
-    async def _run_one_full_pass(self, planner_input: Dict[str, Any]) -> bool:
+    async def _run_one_full_pass(self, planner_input: Dict[str, Any], events: Optional[asyncio.Queue] = None, iteration: int = 0, start_layer: int = 0) -> bool:
         execution_layers = self.graph.get_execution_layers(include_output_executors=True)
-        for layer in execution_layers:
-            # Prepare Input to planner
-            planner_input = self._prepare_planner_input_for_next_iteration(
-                    self.state, 
-                    layer,
-                    self.original_query
-            )
-            if self.logging_enabled: print(planner_input)
-            # Ask planner who to run
-            _, planner_output = await self._run_executor(self.planner_executor, planner_input)
-
-            if self.logging_enabled: print(planner_output)
-
-            if planner_output.get("terminate", False) and len(planner_output.get("next_executors", [])) == 0:
+        for layer_index in range(start_layer, len(execution_layers)):
+            with Tracer.start_span(f"layer {layer_index}", "layer", iteration=iteration, layer=layer_index):
+                terminated = await self._run_layer(execution_layers[layer_index], events)
+            if terminated:
                 return True
 
-            selected_names = planner_output.get("next_executors", [])
-            if self.logging_enabled: print(selected_names) 
-            selected_executors = [
-                ex for ex in layer
-                if ex.agent.name in selected_names and ex != self.planner_executor
-            ]
-            if selected_executors:
-                tasks = []
-                for ex in selected_executors:
-                    # Get the specific input for this agent from the planner's output
-                    agent_input_key = f"{ex.agent.name}_input"
-                    agent_input = planner_output.get(agent_input_key, "")
-                    
-                    tasks.append(self._run_executor(ex, {agent_input_key: agent_input}))
+            self._checkpoint(iteration, layer_index + 1)
+
+        return False
+
+    async def _run_layer(self, layer, events: Optional[asyncio.Queue]) -> bool:
+        # Prepare Input to planner
+        planner_input = self._prepare_planner_input_for_next_iteration(
+                self.state, 
+                layer,
+                self.original_query
+        )
+        if self.logging_enabled: print(planner_input)
+        # Ask planner who to run
+        _, planner_output = await self._dispatch_executor(self.planner_executor, planner_input, events)
+
+        if self.logging_enabled: print(planner_output)
+
+        if planner_output.get("terminate", False) and len(planner_output.get("next_executors", [])) == 0:
+            return True
+
+        selected_names = planner_output.get("next_executors", [])
+        if self.logging_enabled: print(selected_names) 
+        selected_executors = [
+            ex for ex in layer
+            if ex.agent.name in selected_names and ex != self.planner_executor
+        ]
+        if selected_executors:
+            tasks = []
+            for ex in selected_executors:
+                # Get the specific input for this agent from the planner's output
+                agent_input_key = f"{ex.agent.name}_input"
+                agent_input = planner_output.get(agent_input_key, "")
                 
-                results = await asyncio.gather(*tasks)
-                for ex, output in results:
-                    self.state[ex] = output
+                tasks.append(self._dispatch_executor(ex, {agent_input_key: agent_input}, events))
             
-            if planner_output.get("terminate", False):
-                return True
-
-        return False
\ No newline at end of file
+            results = await asyncio.gather(*tasks)
+            for ex, output in results:
+                self._set_state(ex, output)
+        
+        return bool(planner_output.get("terminate", False))
\ No newline at end of file
@@ -1,2 +1,3 @@
 from .BaseAgentGraphExecutor import BaseAgentGraphExecutor
 from .PlannerAgentGraphExecutor import PlannerAgentGraphExecutor
+from .NodeOutputCache import NodeOutputCache
@@ -1,39 +1,96 @@
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import List, Set
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 from ....agents.executors.BaseAgentExecutor import BaseAgentExecutor
+from .GraphTopology import GraphTopology
 
 class BaseAgentGraph(ABC):
+    """
+    Directed graph of agent executors.
+
+    An edge is stored at most once: adding an edge that already exists does nothing. Removing
+    an edge takes constant time but may reorder the remaining edges of its two executors.
+    """
+
     def __init__(self):
-        self.edges = defaultdict(list)           # executor -> downstream executors
-        self.reverse_edges = defaultdict(list)   # executor -> upstream executors
+        # Mutate through add_edge/remove_edge; after changing these lists directly, call
+        # invalidate_topology so the memoized topology is rebuilt
+        self.edges: Dict[BaseAgentExecutor, List[BaseAgentExecutor]] = defaultdict(list)           # executor -> downstream executors
+        self.reverse_edges: Dict[BaseAgentExecutor, List[BaseAgentExecutor]] = defaultdict(list)   # executor -> upstream executors
         self.executors: Set[BaseAgentExecutor] = set()
+        # (from, to) -> positions of the edge in edges[from] and reverse_edges[to]
+        self._edge_positions: Dict[Tuple[BaseAgentExecutor, BaseAgentExecutor], Tuple[int, int]] = {}
+        # Bumped on every structural change; the memoized topology is rebuilt lazily when stale
+        self.version = 0
+        self._topology: Optional[GraphTopology] = None
 
     def add_executor(self, executor: BaseAgentExecutor):
-        self.executors.add(executor)
+        if executor not in self.executors:
+            self.executors.add(executor)
+            self.version += 1
 
     def add_edge(self, from_executor: BaseAgentExecutor, to_executor: BaseAgentExecutor):
-        self.edges[from_executor].append(to_executor)
-        self.reverse_edges[to_executor].append(from_executor)
+        if (from_executor, to_executor) in self._edge_positions:
+            return
+        downstream = self.edges[from_executor]
+        upstream = self.reverse_edges[to_executor]
+        self._edge_positions[from_executor, to_executor] = (len(downstream), len(upstream))
+        downstream.append(to_executor)
+        upstream.append(from_executor)
         self.executors.update({from_executor, to_executor})
+        self.version += 1
 
     def remove_edge(self, from_executor: BaseAgentExecutor, to_executor: BaseAgentExecutor):
-        if to_executor in self.edges[from_executor]:
-            self.edges[from_executor].remove(to_executor)
-        if from_executor in self.reverse_edges[to_executor]:
-            self.reverse_edges[to_executor].remove(from_executor)
+        positions = self._edge_positions.pop((from_executor, to_executor), None)
+        if positions is None:
+            return
+        down_position, up_position = positions
+
+        # Move the last edge into the freed slot instead of shifting the rest of the list
+        downstream = self.edges[from_executor]
+        last = downstream.pop()
+        if down_position < len(downstream):
+            downstream[down_position] = last
+            self._edge_positions[from_executor, last] = (down_position, self._edge_positions[from_executor, last][1])
+
+        upstream = self.reverse_edges[to_executor]
+        last = upstream.pop()
+        if up_position < len(upstream):
+            upstream[up_position] = last
+            self._edge_positions[last, to_executor] = (self._edge_positions[last, to_executor][0], up_position)
+        self.version += 1
+
+    def invalidate_topology(self):
+        self._edge_positions = {}
+        for from_executor, downstream in self.edges.items():
+            for down_position, to_executor in enumerate(downstream):
+                self._edge_positions[from_executor, to_executor] = (down_position, self.reverse_edges[to_executor].index(from_executor))
+        self.version += 1
+
+    def get_topology(self) -> GraphTopology:
+        if self._topology is None or self._topology.version != self.version:
+            self._topology = GraphTopology(self.version, self.executors, self.edges, self.reverse_edges)
+        return self._topology
 
     def get_input_executors(self) -> List[BaseAgentExecutor]:
-        return [ex for ex in self.executors if not self.reverse_edges[ex]]
+        return list(self.get_topology().input_executors)
+
+    def get_output_executors(self) -> List[BaseAgentExecutor]:
+        return list(self.get_topology().output_executors)
 
     def get_all_executors(self) -> List[BaseAgentExecutor]:
         return list(self.executors)
 
     def get_downstream_executors(self, executor: BaseAgentExecutor) -> List[BaseAgentExecutor]:
-        return self.edges.get(executor, [])
+        return list(self.edges.get(executor, ()))
 
     def get_upstream_executors(self, executor: BaseAgentExecutor) -> List[BaseAgentExecutor]:
-        return self.reverse_edges.get(executor, [])
+        return list(self.reverse_edges.get(executor, ()))
+
+    def is_reachable(self, from_executor: BaseAgentExecutor, to_executor: BaseAgentExecutor) -> bool:
+        topology = self.get_topology()
+        reach = topology.reachability()
+        return bool(reach[topology.index[from_executor]] >> topology.index[to_executor] & 1)
 
     def validate_graph(self):
         try:
@@ -41,40 +98,20 @@ class BaseAgentGraph(ABC):
         except ValueError as e:
             raise ValueError(f"Graph validation failed: {e}")
 
-        for executor in self.executors:
-            if not self.edges[executor] and not self.reverse_edges[executor]:
-                raise ValueError(f"Graph validation failed: Executor {executor} is isolated (no edges).")
-
-    def get_execution_layers(self, include_output_executors: bool = True) -> List[Set[BaseAgentExecutor]]:
-        # Kahn’s algorithm for topological sorting in layers
-        in_degree = {ex: 0 for ex in self.executors}
-        for downstreams in self.edges.values():
-            for downstream in downstreams:
-                in_degree[downstream] += 1
-
-        ready = [ex for ex, deg in in_degree.items() if deg == 0]
-        layers = []
-
-        while ready:
-            current_layer = set(ready)
-            layers.append(current_layer)
-            next_ready = []
-
-            for executor in current_layer:
-                for downstream in self.edges.get(executor, []):
-                    in_degree[downstream] -= 1
-                    if in_degree[downstream] == 0:
-                        next_ready.append(downstream)
-
-            ready = next_ready
-
-        if any(deg > 0 for deg in in_degree.values()):
+        isolated = self.get_topology().isolated_executors
+        if isolated:
+            raise ValueError(f"Graph validation failed: Executor {isolated[0]} is isolated (no edges).")
+
+    def get_execution_layers(self, include_output_executors: bool = True) -> List[FrozenSet[BaseAgentExecutor]]:
+        """
+        Returns the executors grouped into layers that can run concurrently, in dependency order.
+        Each layer is a frozenset rather than a list, because layers are shared with the memoized
+        topology.
+        """
+        topology = self.get_topology()
+        if topology.has_cycle:
             raise ValueError("Cycle detected in graph. Cannot perform topological sort.")
 
-        if not include_output_executors:
-            output_executors = set(self.get_output_executors())
-            layers[-1] = layers[-1] - output_executors
-            if not layers[-1]:
-                layers.pop()
-
-        return layers
+        if include_output_executors:
+            return list(topology.layers)
+        return list(topology.layers_without_outputs())
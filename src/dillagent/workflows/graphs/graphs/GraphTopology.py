@@ -0,0 +1,96 @@
+from array import array
+from typing import Dict, FrozenSet, List, Optional, Sequence
+
+
+class GraphTopology:
+    """
+    Immutable snapshot of a BaseAgentGraph's structure, built once per graph version.
+
+    Executors are numbered 0..n-1 and adjacency is stored in CSR form: the downstream
+    indices of node i are `down_targets[down_offsets[i]:down_offsets[i + 1]]` (same for upstream).
+    """
+
+    def __init__(self, version: int, nodes: Sequence, edges: Dict, reverse_edges: Dict):
+        self.version = version
+        self.nodes = list(nodes)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self.down_offsets, self.down_targets = self._build_csr(edges)
+        self.up_offsets, self.up_targets = self._build_csr(reverse_edges)
+        self.in_degrees = array('i', (self.up_offsets[i + 1] - self.up_offsets[i] for i in range(len(self.nodes))))
+        self.out_degrees = array('i', (self.down_offsets[i + 1] - self.down_offsets[i] for i in range(len(self.nodes))))
+
+        self.input_executors = [node for i, node in enumerate(self.nodes) if self.in_degrees[i] == 0]
+        self.output_executors = [node for i, node in enumerate(self.nodes) if self.out_degrees[i] == 0]
+        self.isolated_executors = [
+            node for i, node in enumerate(self.nodes) if self.in_degrees[i] == 0 and self.out_degrees[i] == 0
+        ]
+
+        self.layer_of = array('i', [-1] * len(self.nodes))
+        self.layers: List[FrozenSet] = []
+        self.has_cycle = False
+        self._compute_layers()
+        self._reachability: Optional[List[int]] = None
+        self._layers_without_outputs: Optional[List[FrozenSet]] = None
+
+    def _build_csr(self, adjacency: Dict):
+        offsets = array('i', [0])
+        targets = array('i')
+        for node in self.nodes:
+            for neighbour in adjacency.get(node, ()):
+                targets.append(self.index[neighbour])
+            offsets.append(len(targets))
+        return offsets, targets
+
+    def downstream(self, i: int) -> array:
+        return self.down_targets[self.down_offsets[i]:self.down_offsets[i + 1]]
+
+    def upstream(self, i: int) -> array:
+        return self.up_targets[self.up_offsets[i]:self.up_offsets[i + 1]]
+
+    def _compute_layers(self):
+        # Kahn’s algorithm for topological sorting in layers
+        in_degree = array('i', self.in_degrees)
+        ready = [i for i in range(len(self.nodes)) if in_degree[i] == 0]
+        depth = 0
+        placed = 0
+        while ready:
+            next_ready = []
+            for i in ready:
+                self.layer_of[i] = depth
+                for j in self.downstream(i):
+                    in_degree[j] -= 1
+                    if in_degree[j] == 0:
+                        next_ready.append(j)
+            self.layers.append(frozenset(self.nodes[i] for i in ready))
+            placed += len(ready)
+            ready = next_ready
+            depth += 1
+        self.has_cycle = placed != len(self.nodes)
+
+    def layers_without_outputs(self) -> List[FrozenSet]:
+        if self._layers_without_outputs is None:
+            layers = list(self.layers)
+            if layers:
+                layers[-1] = layers[-1] - frozenset(self.output_executors)
+                if not layers[-1]:
+                    layers.pop()
+            self._layers_without_outputs = layers
+        return self._layers_without_outputs
+
+    def reachability(self) -> List[int]:
+        """
+        Per node bitset (as an int) of every node reachable from it, itself included.
+        Computed on first use.
+        """
+        if self._reachability is None:
+            if self.has_cycle:
+                raise ValueError("Cycle detected in graph. Cannot compute reachability.")
+            reach = [0] * len(self.nodes)
+            order = sorted(range(len(self.nodes)), key=lambda i: self.layer_of[i], reverse=True)
+            for i in order:
+                bits = 1 << i
+                for j in self.downstream(i):
+                    bits |= reach[j]
+                reach[i] = bits
+            self._reachability = reach
+        return self._reachability
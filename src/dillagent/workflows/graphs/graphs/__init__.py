@@ -1 +1,2 @@
 from .BaseAgentGraph import BaseAgentGraph
+from .GraphTopology import GraphTopology
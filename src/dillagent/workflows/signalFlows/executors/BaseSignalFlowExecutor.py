@@ -1,28 +1,119 @@
 import asyncio
-from typing import List
+import itertools
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Optional
 from ..signalFlows.BaseSignalFlow import BaseSignalFlow
 from ..signalFlows.BaseSignal import BaseSignal
 
 class BaseSignalFlowExecutor:
-    def __init__(self):
+    def __init__(self, num_workers: int = 4, max_queue_size: int = 1000):
+        """
+        Parameters:
+        - num_workers: Number of worker tasks draining the signal queue concurrently.
+        - max_queue_size: Capacity of the signal queue. `publish` waits while the queue is full,
+          which applies backpressure to external publishers. 0 means unbounded. Signals emitted
+          by flows are never blocked (workers waiting on each other could deadlock), so they
+          spill into an unbounded overflow buffer when the queue is full; the bound only holds
+          back `publish` callers. Signals published before `run` wait in the queue, so at most
+          this many can be published before the run starts.
+        """
         self.agents: List[BaseSignalFlow] = []
-        self.queue: asyncio.Queue[BaseSignal] = asyncio.Queue()
+        self.num_workers = num_workers
+        self.queue: asyncio.Queue[BaseSignal] = asyncio.Queue(maxsize=max_queue_size)
+        self.subscriptions: Dict[str, List[BaseSignalFlow]] = defaultdict(list)
+        # Flows overriding should_trigger can't be indexed by type and are checked per signal
+        self._dynamic_flows: List[BaseSignalFlow] = []
+        # Signals emitted by flows while the queue is full. Workers never block on a full queue,
+        # otherwise they could deadlock waiting on each other.
+        self._overflow: Deque[BaseSignal] = deque()
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._error: Optional[BaseException] = None
 
     def register(self, signal_flow: BaseSignalFlow):
         self.agents.append(signal_flow)
+        if type(signal_flow).should_trigger is not BaseSignalFlow.should_trigger:
+            self._dynamic_flows.append(signal_flow)
+            return
+        # A type listed twice still delivers each signal to the flow once
+        for signal_type in dict.fromkeys(signal_flow.subscribed_signal_types):
+            self.subscriptions[signal_type].append(signal_flow)
 
     async def publish(self, signal: BaseSignal):
+        self._in_flight += 1
+        self._idle.clear()
         await self.queue.put(signal)
 
-    async def run(self, initial_signals: List[BaseSignal]):
-        for signal in initial_signals:
-            await self.publish(signal)
+    def _publish_nowait(self, signal: BaseSignal):
+        self._in_flight += 1
+        try:
+            self.queue.put_nowait(signal)
+        except asyncio.QueueFull:
+            self._overflow.append(signal)
 
+    def _take_queued(self) -> List[BaseSignal]:
+        queued = []
         while not self.queue.empty():
+            queued.append(self.queue.get_nowait())
+        queued.extend(self._overflow)
+        self._overflow.clear()
+        return queued
+
+    async def run(self, initial_signals: List[BaseSignal]):
+        """
+        Handles `initial_signals`, and any signal published since the last run, until no signal
+        is left. A run that fails discards the signals it hadn't handled yet.
+        """
+        # Start from a clean slate, since the queue and event bind to the loop they were first
+        # used on. Signals published before this run are carried over into the new queue.
+        pending = self._take_queued()
+        self._error = None
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self.queue = asyncio.Queue(maxsize=self.queue.maxsize)
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.num_workers)]
+        try:
+            for signal in itertools.chain(pending, initial_signals):
+                await self.publish(signal)
+            # Done once nothing is queued or being handled, not merely when the queue is empty
+            if self._in_flight:
+                await self._idle.wait()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if self._error is not None:
+            self._take_queued()
+            raise self._error
+
+    def _get_flows(self, signal: BaseSignal) -> List[BaseSignalFlow]:
+        flows = self.subscriptions.get(signal.type, [])
+        if self._dynamic_flows:
+            flows = flows + [flow for flow in self._dynamic_flows if flow.should_trigger(signal)]
+        return flows
+
+    async def _worker(self):
+        while True:
             signal = await self.queue.get()
+            # A slot just freed up, so move one overflowed signal into the queue
+            if self._overflow:
+                self.queue.put_nowait(self._overflow.popleft())
 
-            for flow in self.agents:
-                if flow.should_trigger(signal):
-                    new_signals = await flow.handle_signal(signal)
+            try:
+                results = await asyncio.gather(*(flow.handle_signal(signal) for flow in self._get_flows(signal)))
+                for new_signals in results:
                     for s in new_signals:
-                        await self.publish(s)
+                        self._publish_nowait(s)
+                # Every subscribed flow is done with it, so a pooled signal can be reused
+                signal.release()
+            except Exception as e:
+                if self._error is None:
+                    self._error = e
+                self._idle.set()
+                return
+            finally:
+                self._in_flight -= 1
+
+            if self._in_flight == 0:
+                self._idle.set()
@@ -1,21 +1,62 @@
-import uuid
+import itertools
 import time
+import uuid
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, ClassVar, Dict, Mapping, Optional
+from .SignalPayload import SignalPayload
+
+if TYPE_CHECKING:
+    from .SignalPool import SignalPool
+
+# Ids are a per-process prefix and a counter: unique like the uuid4 ids they replace, but cheaper
+_id_prefix = uuid.uuid4().hex
+_id_counter = itertools.count(1)
+
+
+def next_signal_id() -> str:
+    return f"{_id_prefix}-{next(_id_counter)}"
+
 
-@dataclass
+def freeze_payload(payload: Optional[Mapping]) -> SignalPayload:
+    """
+    Returns `payload` as a SignalPayload, copying it unless it already is one.
+    """
+    if isinstance(payload, SignalPayload):
+        return payload
+    return SignalPayload(payload or {})
+
+
+@dataclass(frozen=True, slots=True)
 class BaseSignal:
+    """
+    Signal passed between signal flows.
+
+    Signals are frozen: their fields can't be reassigned, use `dataclasses.replace` to derive a
+    new signal. The payload is a SignalPayload, a dict shared by every subscribed flow; modifying
+    it in place is deprecated.
+    """
+
     id: str
     type: str
     payload: dict
     source: Optional[str] = None
     timestamp: float = field(default_factory=time.time)
+    _pool: Optional["SignalPool"] = field(default=None, init=False, repr=False, compare=False)
+    _pooled: bool = field(default=False, init=False, repr=False, compare=False)
+
+    # signal type -> pool recycling signals of that type, see SignalPool.register
+    _pools: ClassVar[Dict[str, "SignalPool"]] = {}
 
     @staticmethod
-    def spawn(type: str, payload: dict, source: Optional[str] = None) -> "BaseSignal":
-        return BaseSignal(
-            id=str(uuid.uuid4()),
-            type=type,
-            payload=payload,
-            source=source,
-        )
+    def spawn(type: str, payload: Mapping, source: Optional[str] = None) -> "BaseSignal":
+        pool = BaseSignal._pools.get(type) if BaseSignal._pools else None
+        if pool is not None:
+            return pool.acquire(type, payload, source)
+        return BaseSignal(next_signal_id(), type, freeze_payload(payload), source)
+
+    def release(self):
+        """
+        Returns a pooled signal to its pool once every flow has handled it. No-op otherwise.
+        """
+        if self._pool is not None:
+            self._pool.release(self)
@@ -0,0 +1,51 @@
+import warnings
+
+
+class SignalPayload(dict):
+    """
+    Payload of a BaseSignal. Every flow subscribed to a signal gets the same payload object, so
+    it is meant to be read-only: modifying it in place is deprecated and will raise TypeError in
+    a future release. Copy it with `dict(payload)` to make changes.
+    """
+
+    __slots__ = ()
+
+    def _warn(self):
+        warnings.warn(
+            "Modifying a signal payload is deprecated and will raise TypeError in a future release; "
+            "copy it with dict(payload) instead.",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+
+    def __setitem__(self, key, value):
+        self._warn()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._warn()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._warn()
+        return super().__ior__(other)
+
+    def clear(self):
+        self._warn()
+        super().clear()
+
+    def pop(self, *args):
+        self._warn()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._warn()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._warn()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self._warn()
+        super().update(*args, **kwargs)
@@ -0,0 +1,65 @@
+import time
+from typing import List, Mapping, Optional
+from .BaseSignal import BaseSignal, freeze_payload, next_signal_id
+
+_set = object.__setattr__
+
+
+class SignalPool:
+    """
+    Free list of BaseSignal objects for high-rate signal types.
+
+    Once registered for a type, `BaseSignal.spawn` takes signals of that type from the pool and
+    BaseSignalFlowExecutor hands them back after every subscribed flow has handled them; a reused
+    signal gets a new id and timestamp. Only pool types whose flows don't keep the signal object
+    after `handle_signal` returns: a released signal keeps its fields until it is reused.
+    Payloads may be kept, they are never reused.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Parameters:
+        - max_size: Maximum number of idle signals kept for reuse.
+        """
+        self.max_size = max_size
+        self._free: List[BaseSignal] = []
+        self.created = 0
+        self.reused = 0
+
+    def register(self, *signal_types: str) -> "SignalPool":
+        for signal_type in signal_types:
+            BaseSignal._pools[signal_type] = self
+        return self
+
+    def unregister(self, *signal_types: str):
+        for signal_type in signal_types:
+            if BaseSignal._pools.get(signal_type) is self:
+                del BaseSignal._pools[signal_type]
+
+    def acquire(self, type: str, payload: Mapping, source: Optional[str] = None) -> BaseSignal:
+        if not self._free:
+            self.created += 1
+            signal = BaseSignal(next_signal_id(), type, freeze_payload(payload), source)
+            _set(signal, "_pool", self)
+            return signal
+
+        self.reused += 1
+        signal = self._free.pop()
+        # BaseSignal is frozen for its users; the pool is the only writer
+        _set(signal, "id", next_signal_id())
+        _set(signal, "type", type)
+        _set(signal, "payload", freeze_payload(payload))
+        _set(signal, "source", source)
+        _set(signal, "timestamp", time.time())
+        _set(signal, "_pooled", False)
+        return signal
+
+    def release(self, signal: BaseSignal):
+        if signal._pool is not self or signal._pooled:
+            return
+        _set(signal, "_pooled", True)
+        if len(self._free) < self.max_size:
+            self._free.append(signal)
+
+    def stats(self) -> dict:
+        return {"created": self.created, "reused": self.reused, "idle": len(self._free)}
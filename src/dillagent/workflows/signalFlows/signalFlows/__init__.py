@@ -1,2 +1,4 @@
 from .BaseSignal import BaseSignal
-from .BaseSignalFlow import BaseSignalFlow
\ No newline at end of file
+from .SignalPayload import SignalPayload
+from .BaseSignalFlow import BaseSignalFlow
+from .SignalPool import SignalPool
@@ -0,0 +1,93 @@
+import asyncio
+import pytest
+from dillagent.agents.executors import BaseAgentExecutor
+from dillagent.llm import LLM, LLMConfig
+from dillagent.workflows.graphs.graphs import BaseAgentGraph
+
+
+class StubLLM(LLM):
+    """
+    Stand-in backend behaving like the provider backends: prompt, compaction, call, usage, reply.
+    Replies are numbered by the history length, so different histories get different replies,
+    unless scripted `replies` are given; these are returned (or raised, if exceptions) in turn.
+    """
+
+    def __init__(self, config=None, delays=None, replies=None, **kwargs):
+        super().__init__(config or LLMConfig(), **kwargs)
+        # prompt -> seconds the call takes
+        self.delays = delays or {}
+        self.replies = list(replies) if replies is not None else None
+        self.calls = 0
+
+    async def run(self, prompt):
+        return await self._call_api(prompt)
+
+    async def _call_api(self, prompt):
+        self.calls += 1
+        self.add_messages([{"role": "user", "content": prompt}])
+        await self._compact_messages()
+        await asyncio.sleep(self.delays.get(prompt, 0))
+        if self.replies is not None:
+            response = self.replies.pop(0)
+            if isinstance(response, Exception):
+                raise response
+        else:
+            response = f"reply {len(self.messages)}: {prompt}"
+        self._record_usage(len(prompt), 1)
+        self.add_messages([{"role": "assistant", "content": response}])
+        return response
+
+    def add_messages(self, messages):
+        self.messages.extend(messages)
+
+    def add_sys_prompt(self, sys_prompt):
+        self.messages.append({"role": "system", "content": sys_prompt})
+
+
+class Graph(BaseAgentGraph):
+    pass
+
+
+class Agent:
+    def __init__(self, name):
+        self.name = name
+
+
+class RecordingExecutor(BaseAgentExecutor):
+    """
+    Graph node logging when it starts and ends to a log shared by all nodes.
+    """
+
+    def __init__(self, name, log, delay=0.0):
+        super().__init__(Agent(name))
+        self.log = log
+        self.delay = delay
+
+    async def run(self, inputs):
+        self.log.append(("start", self.agent.name))
+        await asyncio.sleep(self.delay)
+        self.log.append(("end", self.agent.name))
+        return {"from": self.agent.name}
+
+    def __repr__(self):
+        return self.agent.name
+
+
+@pytest.fixture
+def stub_llm():
+    return StubLLM
+
+
+@pytest.fixture
+def graph():
+    return Graph()
+
+
+@pytest.fixture
+def make_executors():
+    def make(names, log=None, delays=None):
+        log = [] if log is None else log
+        delays = delays or {}
+        return {name: RecordingExecutor(name, log, delays.get(name, 0.0)) for name in names}
+
+    return make
@@ -0,0 +1,44 @@
+def test_edges_keep_their_list_types(graph, make_executors):
+    ex = make_executors("ABC")
+    graph.add_edge(ex["A"], ex["B"])
+    graph.add_edge(ex["A"], ex["B"])
+    graph.add_edge(ex["A"], ex["C"])
+    assert graph.edges[ex["A"]] == [ex["B"], ex["C"]]
+    assert graph.reverse_edges[ex["B"]] == [ex["A"]]
+    graph.remove_edge(ex["A"], ex["C"])
+    assert graph.get_downstream_executors(ex["A"]) == [ex["B"]]
+
+
+def test_topology_is_rebuilt_after_changes(graph, make_executors):
+    ex = make_executors("ABC")
+    graph.add_edge(ex["A"], ex["B"])
+    graph.add_edge(ex["B"], ex["C"])
+    assert [sorted(map(repr, layer)) for layer in graph.get_execution_layers()] == [["A"], ["B"], ["C"]]
+
+    graph.edges[ex["A"]].append(ex["C"])
+    graph.reverse_edges[ex["C"]].append(ex["A"])
+    graph.invalidate_topology()
+    assert graph.is_reachable(ex["A"], ex["C"])
+    graph.remove_edge(ex["B"], ex["C"])
+    assert [sorted(map(repr, layer)) for layer in graph.get_execution_layers()] == [["A"], ["B", "C"]]
+
+
+def test_removing_edges_keeps_both_directions_consistent(graph, make_executors):
+    ex = make_executors("ABCDE")
+    for target in "BCDE":
+        graph.add_edge(ex["A"], ex[target])
+    for source in "BCD":
+        graph.add_edge(ex[source], ex["E"])
+
+    graph.remove_edge(ex["A"], ex["B"])
+    graph.remove_edge(ex["B"], ex["E"])
+    graph.remove_edge(ex["A"], ex["B"])
+    assert sorted(map(repr, graph.edges[ex["A"]])) == ["C", "D", "E"]
+    assert sorted(map(repr, graph.reverse_edges[ex["E"]])) == ["A", "C", "D"]
+
+    # Every remaining edge can still be removed
+    for target in "CDE":
+        graph.remove_edge(ex["A"], ex[target])
+    for source in "CD":
+        graph.remove_edge(ex[source], ex["E"])
+    assert not any(graph.edges.values()) and not any(graph.reverse_edges.values())
@@ -0,0 +1,56 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from dillagent.llm import AnthropicLLM, LLMConfig
+
+
+class FakeMessages:
+    def __init__(self):
+        self.requests = []
+
+    async def create(self, **request):
+        self.requests.append(request)
+        usage = SimpleNamespace(input_tokens=10, output_tokens=2, cache_read_input_tokens=6)
+        return SimpleNamespace(content=[SimpleNamespace(type="text", text="hi")], usage=usage)
+
+
+def make_llm(**kwargs):
+    llm = AnthropicLLM(LLMConfig(model="m"), **kwargs)
+    llm.add_sys_prompt("system")
+    messages = FakeMessages()
+    llm._get_client = lambda: SimpleNamespace(messages=messages)
+    return llm, messages
+
+
+def test_prompt_caching_requires_a_recent_sdk(monkeypatch):
+    monkeypatch.setattr(AnthropicLLM, "MIN_PROMPT_CACHING_SDK", (99, 0))
+    with pytest.raises(ValueError):
+        AnthropicLLM(LLMConfig(model="m"), prompt_caching=True)
+
+
+def test_prompt_caching_marks_the_system_prompt_and_latest_message(monkeypatch):
+    monkeypatch.setattr(AnthropicLLM, "MIN_PROMPT_CACHING_SDK", (0, 0))
+    llm, messages = make_llm(prompt_caching=True)
+
+    async def main():
+        await llm.run("first")
+        await llm.run("second")
+
+    asyncio.run(main())
+    cache_control = {"type": "ephemeral"}
+    assert messages.requests[1]["system"] == [{"type": "text", "text": "system", "cache_control": cache_control}]
+    assert messages.requests[1]["messages"] == [
+        {"role": "user", "content": "first"},
+        {"role": "assistant", "content": "hi"},
+        {"role": "user", "content": [{"type": "text", "text": "second", "cache_control": cache_control}]},
+    ]
+    # Breakpoints are only added to the request, not to the kept history
+    assert llm.messages[-2] == {"role": "user", "content": "second"}
+    assert llm.last_usage["prompt_tokens"] == 16
+
+
+def test_requests_are_plain_without_prompt_caching():
+    llm, messages = make_llm()
+    asyncio.run(llm.run("first"))
+    assert messages.requests[0]["system"] == "system"
+    assert messages.requests[0]["messages"] == [{"role": "user", "content": "first"}]
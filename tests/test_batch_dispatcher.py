@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+from dillagent.llm import BatchDispatcher, LLMConfig
+
+
+class FakeLLM:
+    def __init__(self, temperature):
+        self.config = LLMConfig(model="m", temperature=temperature)
+
+
+def test_requests_with_different_sampling_settings_are_batched_separately():
+    dispatcher = BatchDispatcher(max_batch_size=8, max_wait=0.01, mode='completions')
+    sent = []
+
+    async def send(llm, histories):
+        sent.append((llm.config.temperature, len(histories)))
+        return [("ok", None, None)] * len(histories)
+
+    dispatcher._send_completions = send
+
+    async def main():
+        llms = [FakeLLM(0), FakeLLM(0), FakeLLM(1)]
+        return await asyncio.gather(*(dispatcher.submit(llm, [{"role": "user", "content": "hi"}]) for llm in llms))
+
+    assert asyncio.run(main()) == [("ok", None, None)] * 3
+    assert sorted(sent) == [(0, 2), (1, 1)]
+    assert dispatcher.batches_sent == 2
+
+
+def test_aclose_sends_collecting_batches_and_waits_for_them():
+    dispatcher = BatchDispatcher(max_batch_size=8, max_wait=60, mode='completions')
+    sent = []
+
+    async def send(llm, histories):
+        await asyncio.sleep(0.01)
+        sent.append(len(histories))
+        return [("ok", None, None)] * len(histories)
+
+    dispatcher._send_completions = send
+
+    async def main():
+        llm = FakeLLM(0)
+        requests = [asyncio.ensure_future(dispatcher.submit(llm, [{"role": "user", "content": "hi"}])) for _ in range(3)]
+        await asyncio.sleep(0)
+        await dispatcher.aclose()
+        assert sent == [3]
+        assert not dispatcher._sending
+        return await asyncio.gather(*requests)
+
+    assert asyncio.run(main()) == [("ok", None, None)] * 3
+
+
+def test_only_openai_backends_accept_a_dispatcher():
+    from dillagent.llm import AnthropicLLM
+
+    with pytest.raises(ValueError):
+        AnthropicLLM(LLMConfig(model="m", batch_dispatcher=BatchDispatcher()))
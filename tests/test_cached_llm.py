@@ -0,0 +1,106 @@
+import asyncio
+import time
+from dillagent.dependencies.memory.SlidingWindowMemory import SlidingWindowMemory
+from dillagent.llm import CachedLLM, ConversationScope, LLMConfig, ResponseCache
+
+
+def test_repeated_requests_hit_the_cache(stub_llm):
+    cache = ResponseCache()
+    llm = stub_llm(LLMConfig(model="m"))
+
+    async def main():
+        first = await CachedLLM(llm, cache).run("hello")
+        llm.messages.clear()
+        return first, await CachedLLM(llm, cache).run("hello")
+
+    first, second = asyncio.run(main())
+    assert first == second
+    assert llm.calls == 1
+
+
+def test_endpoints_serving_the_same_model_dont_share_entries(stub_llm):
+    cache = ResponseCache()
+    a = stub_llm(LLMConfig(model="m", path="http://a/v1"))
+    b = stub_llm(LLMConfig(model="m", path="http://b/v1"))
+
+    async def main():
+        return await CachedLLM(a, cache).run("hello"), await CachedLLM(b, cache).run("hello")
+
+    asyncio.run(main())
+    assert a.calls == b.calls == 1
+
+
+def test_concurrent_identical_requests_are_sent_once(stub_llm):
+    cache = ResponseCache()
+    llm = stub_llm(delays={"hello": 0.02})
+
+    async def conversation():
+        with ConversationScope():
+            response = await CachedLLM(llm, cache).run("hello")
+            return response, [m["content"] for m in llm.messages]
+
+    async def main():
+        return await asyncio.gather(conversation(), conversation(), conversation())
+
+    results = asyncio.run(main())
+    assert results == [("reply 1: hello", ["hello", "reply 1: hello"])] * 3
+    assert llm.calls == 1
+    assert cache.stats()["coalesced"] == 2
+    assert not cache.in_flight
+
+
+def test_waiters_of_a_failed_request_make_their_own(stub_llm):
+    cache = ResponseCache()
+    llm = stub_llm(delays={"hello": 0.02})
+    run = llm.run
+
+    async def fail_first(prompt):
+        if llm.calls == 0:
+            llm.calls += 1
+            await asyncio.sleep(0.02)
+            raise ConnectionError("dropped")
+        return await run(prompt)
+
+    llm.run = fail_first
+
+    async def conversation():
+        with ConversationScope():
+            return await CachedLLM(llm, cache).run("hello")
+
+    async def main():
+        return await asyncio.gather(conversation(), conversation(), return_exceptions=True)
+
+    failed, succeeded = asyncio.run(main())
+    assert isinstance(failed, ConnectionError)
+    assert succeeded == "reply 1: hello"
+    assert llm.calls == 2
+
+
+def test_hits_compact_the_history_like_real_calls(stub_llm):
+    cache = ResponseCache()
+    llm = stub_llm(memory=SlidingWindowMemory(2))
+    cached = CachedLLM(llm, cache)
+
+    async def main():
+        for prompt in "abc":
+            await cached.run(prompt)
+        llm.messages.clear()
+        return [await cached.run(prompt) for prompt in "abc"]
+
+    replies = asyncio.run(main())
+    # Every replayed request has the history of the recorded one, so all of them hit
+    assert llm.calls == 3
+    assert replies == ["reply 1: a", "reply 1: b", "reply 1: c"]
+
+
+def test_expired_rows_are_deleted_when_read(tmp_path):
+    path = str(tmp_path / "cache.db")
+    writer = ResponseCache(ttl=0.01, path=path)
+    asyncio.run(writer.set("key", "response", False))
+    writer.close()
+
+    reader = ResponseCache(ttl=0.01, path=path)
+    time.sleep(0.02)
+    assert asyncio.run(reader.get("key")) is None
+    assert reader._db.execute("SELECT COUNT(*) FROM responses").fetchone() == (0,)
+    reader.close()
@@ -0,0 +1,52 @@
+import asyncio
+import pytest
+from dillagent.dependencies.checkpoints import FileCheckpointStore, SQLiteCheckpointStore
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "file":
+        return FileCheckpointStore(str(tmp_path / "checkpoints"))
+    return SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"))
+
+
+def test_round_trip(store):
+    checkpoint = {"iteration": 2, "state": {"Agent": {"answer": [1, 2.5, None, True]}}}
+
+    async def main():
+        store.save_nowait("run1", checkpoint)
+        pending = await store.load("run1")
+        await store.flush()
+        return pending, await store.load("run1"), await store.list_runs()
+
+    pending, loaded, runs = asyncio.run(main())
+    assert pending == loaded == checkpoint
+    assert runs == ["run1"]
+
+
+def test_values_that_arent_json_are_stored_as_strings(store):
+    async def main():
+        await store.save("run1", {"state": {"Agent": {1, 2}}})
+        return await store.load("run1")
+
+    assert asyncio.run(main()) == {"state": {"Agent": "{1, 2}"}}
+
+
+def test_write_errors_are_raised_by_the_next_flush(store):
+    def failing_write(run_id, data):
+        raise OSError("disk full")
+
+    write, store._write = store._write, failing_write
+
+    async def main():
+        store.save_nowait("run1", {"iteration": 1})
+        await asyncio.wait(list(store._writers.values()))
+        # The failed writer is replaced by a new one; its error must not be lost
+        store._write = write
+        store.save_nowait("run1", {"iteration": 2})
+        with pytest.raises(OSError, match="disk full"):
+            await store.flush()
+        await store.flush()
+        return await store.load("run1")
+
+    assert asyncio.run(main()) == {"iteration": 2}
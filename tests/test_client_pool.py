@@ -0,0 +1,40 @@
+import asyncio
+from dillagent.llm import ClientPool
+
+
+def test_clients_are_kept_per_event_loop():
+    pool = ClientPool()
+
+    async def get():
+        first = pool.get_http_client("http://localhost:1234/v1", "key")
+        assert pool.get_http_client("http://localhost:1234/v1", "key") is first
+        return first
+
+    first = asyncio.run(get())
+    second = asyncio.run(get())
+    assert first is not second
+    # The first loop is closed, so its client was dropped when the second one was created
+    assert list(pool._http_clients.values()) == [second]
+
+
+def test_sdk_clients_follow_their_http_client():
+    pool = ClientPool()
+
+    async def get():
+        return pool.get_client("test", "http://localhost:1234/v1", "key", lambda http_client: ("sdk", http_client))
+
+    sdk, http_client = asyncio.run(get())
+    other_sdk, other_http_client = asyncio.run(get())
+    assert other_http_client is not http_client
+
+
+def test_aclose_closes_the_running_loops_clients():
+    pool = ClientPool()
+
+    async def main():
+        client = pool.get_http_client("http://localhost:1234/v1", "key")
+        await pool.aclose()
+        assert client.is_closed
+        assert not pool._http_clients
+
+    asyncio.run(main())
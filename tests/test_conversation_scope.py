@@ -0,0 +1,41 @@
+import asyncio
+from dillagent.llm import ConversationScope
+
+
+def test_concurrent_conversations_have_their_own_history_and_usage(stub_llm):
+    llm = stub_llm(delays={"long": 0.01})
+    llm.add_sys_prompt("system")
+
+    async def conversation(prompt):
+        with ConversationScope():
+            await llm.run(prompt)
+            # The other conversation's call finishes in between
+            await asyncio.sleep(0.02)
+            return llm.last_usage["prompt_tokens"], [m["content"] for m in llm.messages]
+
+    async def main():
+        return await asyncio.gather(conversation("long"), conversation("x"))
+
+    assert asyncio.run(main()) == [
+        (4, ["system", "long", "reply 2: long"]),
+        (1, ["system", "x", "reply 2: x"]),
+    ]
+    assert llm.messages == [{"role": "system", "content": "system"}]
+    assert llm.last_usage["prompt_tokens"] == 0
+    assert llm.total_usage["prompt_tokens"] == 5
+
+
+def test_commit_publishes_history_and_usage(stub_llm):
+    llm = stub_llm(delays={"long": 0.01})
+
+    async def main():
+        with ConversationScope() as outer:
+            with ConversationScope() as inner:
+                await llm.run("hello")
+            inner.commit()
+            assert llm.last_usage["prompt_tokens"] == 5
+        outer.commit()
+
+    asyncio.run(main())
+    assert llm.last_usage["prompt_tokens"] == 5
+    assert len(llm.messages) == 2
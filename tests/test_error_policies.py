@@ -0,0 +1,151 @@
+import asyncio
+import time
+import pytest
+from dillagent.dependencies.policies.error import BaseErrorPolicy, Deadline, RetryPolicy
+
+
+class Flaky:
+    """
+    Fails `failures` times with `error`, then returns "ok".
+    """
+
+    def __init__(self, failures, error=ConnectionError):
+        self.failures = failures
+        self.error = error
+        self.attempts = 0
+
+    async def __call__(self):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise self.error(f"attempt {self.attempts}")
+        return "ok"
+
+
+def recorded_delays(policy):
+    delays = []
+    delay = policy._delay
+
+    def record(attempt):
+        delays.append(delay(attempt))
+        return delays[-1]
+
+    policy._delay = record
+    return delays
+
+
+def test_retries_until_success_with_exponential_backoff():
+    policy = RetryPolicy(max_retries=3, base_delay=0.01, jitter=0)
+    delays = recorded_delays(policy)
+    call = Flaky(2)
+
+    assert asyncio.run(policy.execute(call)) == "ok"
+    assert call.attempts == 3
+    assert delays == [0.01, 0.02]
+
+
+def test_gives_up_after_max_retries():
+    policy = RetryPolicy(max_retries=2, base_delay=0.001, jitter=0)
+    call = Flaky(10)
+
+    with pytest.raises(ConnectionError, match="attempt 3"):
+        asyncio.run(policy.execute(call))
+    assert call.attempts == 3
+
+
+def test_only_retry_on_errors_are_retried():
+    policy = RetryPolicy(max_retries=3, base_delay=0.001, retry_on=(ConnectionError,))
+    call = Flaky(1, error=ValueError)
+
+    with pytest.raises(ValueError):
+        asyncio.run(policy.execute(call))
+    assert call.attempts == 1
+
+
+def test_delays_are_capped_and_jittered():
+    policy = RetryPolicy(base_delay=1, max_delay=4, jitter=0.5)
+    for attempt in range(6):
+        delay = policy._delay(attempt)
+        cap = min(4, 2 ** attempt)
+        assert cap / 2 <= delay <= cap
+
+
+def test_attempt_timeouts_are_retried():
+    policy = RetryPolicy(max_retries=1, base_delay=0.001, timeout=0.02)
+    attempts = 0
+
+    async def call():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            await asyncio.sleep(1)
+        return "ok"
+
+    assert asyncio.run(policy.execute(call)) == "ok"
+    assert attempts == 2
+
+
+def test_fallback_is_used_when_the_policy_gives_up():
+    policy = RetryPolicy(max_retries=1, base_delay=0.001)
+    call = Flaky(10)
+
+    async def fallback():
+        return "fallback"
+
+    assert asyncio.run(policy.execute(call, fallback)) == "fallback"
+    assert call.attempts == 2
+
+
+def test_fallback_is_skipped_once_the_deadline_passed():
+    policy = BaseErrorPolicy()
+
+    async def slow():
+        await asyncio.sleep(1)
+
+    async def fallback():
+        return "fallback"
+
+    async def main():
+        with Deadline(0.02):
+            return await policy.execute(slow, fallback)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(main())
+
+
+def test_deadline_bounds_calls_and_retry_sleeps():
+    policy = RetryPolicy(max_retries=5, base_delay=0.05, jitter=0)
+    call = Flaky(10)
+
+    async def main():
+        with Deadline(0.08):
+            await policy.execute(call)
+
+    started = time.monotonic()
+    with pytest.raises(ConnectionError):
+        asyncio.run(main())
+    # The retry whose delay would overrun the deadline isn't attempted
+    assert call.attempts == 2
+    assert time.monotonic() - started < 0.08
+
+
+def test_nested_deadlines_only_shorten_and_reach_spawned_tasks():
+    async def remaining_in_task():
+        return Deadline.remaining()
+
+    async def main():
+        assert Deadline.remaining() is None
+        with Deadline(10):
+            with Deadline(60):
+                assert Deadline.remaining() <= 10
+            with Deadline(0.5):
+                remaining = await asyncio.ensure_future(remaining_in_task())
+                assert 0 < remaining <= 0.5
+            assert 0.5 < Deadline.remaining() <= 10
+        assert Deadline.remaining() is None
+
+    asyncio.run(main())
+
+
+def test_no_deadline_is_a_no_op():
+    with Deadline(None):
+        assert Deadline.remaining() is None
@@ -0,0 +1,72 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from dillagent.agents.executors import BaseAgentExecutor
+from dillagent.workflows.graphs.executors import BaseAgentGraphExecutor
+
+
+class Executor(BaseAgentGraphExecutor):
+    async def run(self, input_data):
+        return await self.run_iteration(input_data)
+
+
+def test_dataflow_starts_nodes_as_soon_as_their_inputs_are_ready(graph, make_executors):
+    # A -> B -> D and C -> D; C is slow, so B must not wait for C's layer to finish
+    log = []
+    ex = make_executors("ABCD", log, {"C": 0.05})
+    graph.add_edge(ex["A"], ex["B"])
+    graph.add_edge(ex["B"], ex["D"])
+    graph.add_edge(ex["C"], ex["D"])
+
+    outputs = asyncio.run(Executor(graph).run({}))
+    assert outputs == {"D": {"from": "D"}}
+    assert log.index(("end", "B")) < log.index(("end", "C"))
+    assert log.index(("start", "D")) > log.index(("end", "C"))
+
+
+def test_priorities_order_ready_executors_under_a_concurrency_limit(graph, make_executors):
+    log = []
+    ex = make_executors("ABCD", log)
+    for name in "ABC":
+        graph.add_edge(ex[name], ex["D"])
+
+    executor = Executor(graph, max_concurrency=1, priorities={ex["C"]: 2, ex["B"]: 1})
+    asyncio.run(executor.run({}))
+    starts = [name for event, name in log if event == "start"]
+    assert starts == ["C", "B", "A", "D"]
+
+
+class LLMExecutor(BaseAgentExecutor):
+    """
+    Graph node prompting its LLM with its input and returning what the LLM saw.
+    """
+
+    def __init__(self, name, llm):
+        super().__init__(SimpleNamespace(name=name))
+        self.llm = llm
+
+    async def run(self, inputs):
+        prompt = json.dumps(inputs, sort_keys=True)
+        await self.llm.run(prompt)
+        # Lets the other requests' calls land in between
+        await asyncio.sleep(0.01)
+        return {"history": [m["content"] for m in self.llm.messages], "prompt_tokens": self.llm.last_usage["prompt_tokens"]}
+
+
+def test_batched_requests_keep_separate_histories_and_usage(graph, stub_llm):
+    a_llm, b_llm = stub_llm(delays={'{"q":"slow"}': 0.02}), stub_llm()
+    a, b = LLMExecutor("A", a_llm), LLMExecutor("B", b_llm)
+    graph.add_edge(a, b)
+    executor = Executor(graph)
+
+    inputs = [{"q": "slow"}, {"q": "x"}]
+    results = asyncio.run(executor.run_batch(inputs))
+    for input_data, result in zip(inputs, results):
+        a_prompt = json.dumps(input_data, sort_keys=True)
+        a_state = {"history": [a_prompt, f"reply 1: {a_prompt}"], "prompt_tokens": len(a_prompt)}
+        b_prompt = json.dumps({"A_input": a_state}, sort_keys=True)
+        assert result == {"B": {"history": [b_prompt, f"reply 1: {b_prompt}"], "prompt_tokens": len(b_prompt)}}
+    # The shared LLMs and executor are left untouched
+    assert a_llm.messages == b_llm.messages == []
+    assert a_llm.calls == b_llm.calls == 2
+    assert executor.state == {}
@@ -0,0 +1,53 @@
+import asyncio
+from dillagent.dependencies.policies.error import HedgedRequestPolicy
+from dillagent.tracing import Tracer
+from dillagent.tracing.sinks import MemorySpanSink
+
+
+def slow_first_call(first_delay=1.0):
+    calls = []
+
+    async def call():
+        index = len(calls)
+        calls.append(index)
+        try:
+            await asyncio.sleep(first_delay if index == 0 else 0.01)
+        except asyncio.CancelledError:
+            calls[index] = "cancelled"
+            raise
+        return f"call {index}"
+
+    return call, calls
+
+
+def test_hedge_wins_and_the_slow_attempt_is_cancelled():
+    policy = HedgedRequestPolicy(hedge_after=0.01, max_retries=0)
+    call, calls = slow_first_call()
+
+    result = asyncio.run(policy.execute(call))
+    assert result == "call 1"
+    assert calls == ["cancelled", 1]
+    assert policy.hedges_started == 1
+    assert policy.hedges_won == 1
+
+
+def test_fast_call_is_not_hedged():
+    policy = HedgedRequestPolicy(hedge_after=0.5, max_retries=0)
+    call, calls = slow_first_call(first_delay=0)
+
+    assert asyncio.run(policy.execute(call)) == "call 0"
+    assert policy.hedges_started == 0
+
+
+def test_hedges_are_counted_on_the_current_span():
+    sink = MemorySpanSink()
+    policy = HedgedRequestPolicy(hedge_after=0.01, max_retries=0)
+    call, _ = slow_first_call()
+
+    async def main():
+        with Tracer([sink]):
+            with Tracer.start_span("request", "llm"):
+                return await policy.execute(call)
+
+    assert asyncio.run(main()) == "call 1"
+    assert sink.spans()[0].attributes["hedges"] == 1
@@ -0,0 +1,54 @@
+import json
+import pytest
+from dillagent.dependencies.parsers.intermediate import JsonParser
+
+OUTPUT = {
+    "thought": "Braces { and } and commas, \"quoted\" too",
+    "action": "Search",
+    "action_input": {"query": "cats", "tags": ["a", {"b": [1, 2]}]},
+    "done": False,
+}
+
+
+def stream(text, chunk_size):
+    parser = JsonParser().create_stream_parser()
+    events = []
+    for i in range(0, len(text), chunk_size):
+        events.append(parser.feed(text[i:i + chunk_size]))
+    return parser, events
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+def test_fields_match_a_full_parse(chunk_size):
+    text = "Sure, here you go:\n" + json.dumps(OUTPUT, indent=2) + "\nHope that helps."
+    parser, events = stream(text, chunk_size)
+
+    emitted = {}
+    for fields in events:
+        emitted.update(fields)
+    assert emitted == OUTPUT
+    assert parser.complete
+    assert parser.close() == OUTPUT == JsonParser().parse_values(text)
+
+
+def test_fields_are_emitted_as_soon_as_they_are_complete():
+    parser = JsonParser().create_stream_parser()
+    assert parser.feed('{"action": "Sea') == {}
+    assert parser.feed('rch", "action_input": {"q"') == {"action": "Search"}
+    assert parser.feed(': 1}}') == {"action_input": {"q": 1}}
+    assert parser.complete
+
+
+def test_malformed_members_fall_back_to_the_full_parse():
+    parser = JsonParser().create_stream_parser()
+    parser.feed('{"action": Search, "action_input": "x"}')
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_incomplete_output_is_parsed_on_close():
+    parser = JsonParser().create_stream_parser()
+    parser.feed('{"action": "Search"')
+    assert not parser.complete
+    with pytest.raises(ValueError):
+        parser.close()
@@ -0,0 +1,32 @@
+import json
+import subprocess
+import sys
+import pytest
+
+PROBE = """
+import json, sys
+import {module}
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+@pytest.mark.parametrize("module", ["dillagent.llm", "dillagent.agents", "dillagent.workflows"])
+def test_packages_defer_heavy_imports(module):
+    result = subprocess.run([sys.executable, "-c", PROBE.format(module=module)], capture_output=True, text=True, check=True, env={"PYTHONPATH": ":".join(sys.path)})
+    loaded = set(json.loads(result.stdout))
+    assert not loaded & {"openai", "anthropic", "httpx", "multiprocessing", "pydantic"}
+
+
+def test_lazy_names_resolve_to_classes():
+    import dillagent.agents
+    import dillagent.llm
+    import dillagent.workflows
+    from dillagent.agents.executors import ReActAgentExecutor
+    from dillagent.workflows.signalFlows.signalFlows import SignalPool
+
+    assert dillagent.agents.ReActAgentExecutor is ReActAgentExecutor
+    assert dillagent.workflows.SignalPool is SignalPool
+    assert isinstance(dillagent.llm.CustomLLM, type)
+    assert "StarterAgent" in dir(dillagent.agents)
+    with pytest.raises(AttributeError):
+        dillagent.workflows.Missing
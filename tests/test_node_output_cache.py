@@ -0,0 +1,62 @@
+import asyncio
+from dillagent.workflows.graphs.executors import BaseAgentGraphExecutor, NodeOutputCache
+
+
+class Executor(BaseAgentGraphExecutor):
+    async def run(self, input_data):
+        return await self.run_iteration(input_data)
+
+
+def starts(log):
+    return [name for event, name in log if event == "start"]
+
+
+def test_unchanged_nodes_are_served_from_the_cache(graph, make_executors):
+    log = []
+    ex = make_executors("AB", log)
+    graph.add_edge(ex["A"], ex["B"])
+    executor = Executor(graph, cacheable=[ex["A"], ex["B"]])
+
+    first = asyncio.run(executor.run({"query": "cats"}))
+    assert asyncio.run(executor.run({"query": "cats"})) == first
+    assert starts(log) == ["A", "B"]
+
+    # A's input changed, but its output and so B's input didn't
+    asyncio.run(executor.run({"query": "dogs"}))
+    assert starts(log) == ["A", "B", "A"]
+    assert executor.node_cache.stats()["hits"] == 3
+
+
+def test_only_cacheable_nodes_are_memoized(graph, make_executors):
+    log = []
+    ex = make_executors("AB", log)
+    graph.add_edge(ex["A"], ex["B"])
+    executor = Executor(graph, cacheable=[ex["A"]])
+
+    for _ in range(2):
+        asyncio.run(executor.run({"query": "cats"}))
+    assert starts(log) == ["A", "B", "B"]
+
+
+def test_keys_tell_apart_values_json_can_confuse(make_executors):
+    cache = NodeOutputCache()
+    ex = make_executors("AB")
+    keys = {
+        cache.key(ex["A"], {"x": {1, 2}}),
+        cache.key(ex["A"], {"x": "{1, 2}"}),
+        cache.key(ex["A"], {"x": 1}),
+        cache.key(ex["A"], {"x": "1"}),
+        cache.key(ex["B"], {"x": 1}),
+    }
+    assert len(keys) == 5
+    assert cache.key(ex["A"], {"x": 1, "y": 2}) == cache.key(ex["A"], {"y": 2, "x": 1})
+
+
+def test_cached_outputs_are_copies(make_executors):
+    cache = NodeOutputCache()
+    key = cache.key(make_executors("A")["A"], {})
+    output = {"items": [1]}
+    cache.set(key, output)
+    output["items"].append(2)
+    cache.get(key)["items"].append(3)
+    assert cache.get(key) == {"items": [1]}
@@ -0,0 +1,52 @@
+import asyncio
+from types import SimpleNamespace
+from dillagent.llm import LLMConfig, OpenAILLM
+
+
+class FakeCompletions:
+    def __init__(self, reply):
+        self.reply = reply
+        self.requests = []
+
+    async def create(self, model, messages, stream=False):
+        self.requests.append(list(messages))
+        if stream:
+            return self._stream()
+        message = SimpleNamespace(content=self.reply)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+    async def _stream(self):
+        for delta in (self.reply[:3], self.reply[3:]):
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+
+def make_llm(reply):
+    llm = OpenAILLM(LLMConfig(model="m"))
+    completions = FakeCompletions(reply)
+    llm._get_client = lambda: SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return llm, completions
+
+
+def test_replies_are_kept_in_history():
+    llm, completions = make_llm("hello there")
+
+    async def main():
+        await llm.run("first")
+        await llm.run("second")
+
+    asyncio.run(main())
+    assert completions.requests[1] == [
+        {"role": "user", "content": "first"},
+        {"role": "assistant", "content": "hello there"},
+        {"role": "user", "content": "second"},
+    ]
+
+
+def test_streamed_replies_are_kept_in_history():
+    llm, _ = make_llm("hello there")
+
+    async def main():
+        return [delta async for delta in llm.astream("first")]
+
+    assert asyncio.run(main()) == ["hel", "lo there"]
+    assert llm.messages[-1] == {"role": "assistant", "content": "hello there"}
@@ -0,0 +1,51 @@
+import json
+from dillagent.agents.executors import BaseAgentExecutor
+from dillagent.workflows.graphs.executors import PlannerAgentGraphExecutor
+
+
+class DescribedAgent:
+    def __init__(self, name):
+        self.name = name
+
+    def describe(self):
+        return f"{self.name} does things."
+
+
+def make_planner(graph, **kwargs):
+    weather, news = BaseAgentExecutor(DescribedAgent("Weather")), BaseAgentExecutor(DescribedAgent("News"))
+    graph.add_edge(weather, news)
+    return PlannerAgentGraphExecutor(graph, BaseAgentExecutor(DescribedAgent("PlannerAgent")), **kwargs), weather, news
+
+
+def planner_turn(planner, layer):
+    return planner._prepare_planner_input_for_next_iteration(planner.state, layer, "Plan my day")["PlannerAgent_input"]
+
+
+def test_state_diff_only_sends_what_changed(graph):
+    planner, weather, news = make_planner(graph, state_diff=True)
+    planner._reset_state()
+
+    first = json.loads(planner_turn(planner, [weather, news]))
+    assert first == {"original_query": "Plan my day", "available_agents": ["Weather: Weather does things.", "News: News does things."]}
+
+    planner._set_state(weather, {"forecast": "sun"})
+    second = json.loads(planner_turn(planner, [weather, news]))
+    assert second == {"available_agents": ["Weather", "News"], "updated_executor_states": {"Weather": {"forecast": "sun"}}}
+
+    planner._set_state(news, {"headline": "none"})
+    third = json.loads(planner_turn(planner, [weather]))
+    assert third == {"available_agents": ["Weather"], "updated_executor_states": {"News": {"headline": "none"}}}
+
+
+def test_compact_json_drops_whitespace(graph):
+    planner, weather, news = make_planner(graph)
+    planner._reset_state()
+    planner._set_state(weather, {"forecast": "sun"})
+    compact = planner_turn(planner, [news])
+
+    planner.compact_json = False
+    indented = planner_turn(planner, [news])
+
+    assert json.loads(compact) == json.loads(indented)
+    assert compact == json.dumps(json.loads(compact), separators=(",", ":"))
+    assert "\n  " in indented
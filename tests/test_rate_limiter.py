@@ -0,0 +1,86 @@
+import asyncio
+import pytest
+from dillagent.llm import RateLimiter
+
+
+def test_cancelled_calls_release_their_slots():
+    limiter = RateLimiter(max_concurrency=2)
+
+    async def main():
+        for _ in range(2):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(limiter.run(lambda: asyncio.sleep(10)), timeout=0.01)
+        assert limiter.in_flight == 0
+
+        async def call():
+            return "ok"
+
+        return await asyncio.wait_for(limiter.run(call), timeout=1)
+
+    assert asyncio.run(main()) == "ok"
+
+
+def test_cancelled_while_waiting_for_a_slot():
+    limiter = RateLimiter(max_concurrency=1)
+
+    async def main():
+        blocker = asyncio.ensure_future(limiter.run(lambda: asyncio.sleep(0.05)))
+        await asyncio.sleep(0)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.run(lambda: asyncio.sleep(0)), timeout=0.01)
+        await blocker
+        assert limiter.in_flight == 0
+        assert not limiter._waiters
+
+    asyncio.run(main())
+
+
+def test_cancelled_while_waiting_for_the_request_budget():
+    limiter = RateLimiter(requests_per_minute=1, max_concurrency=1)
+
+    async def main():
+        await limiter.run(lambda: asyncio.sleep(0))
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.run(lambda: asyncio.sleep(0)), timeout=0.01)
+        assert limiter.in_flight == 0
+
+    asyncio.run(main())
+
+
+def test_limiter_is_usable_from_successive_event_loops():
+    limiter = RateLimiter(max_concurrency=1)
+
+    async def main():
+        results = await asyncio.gather(*(limiter.run(lambda: asyncio.sleep(0.001, "ok")) for _ in range(3)))
+        assert results == ["ok"] * 3
+
+    asyncio.run(main())
+    asyncio.run(main())
+    assert limiter.in_flight == 0
+
+
+def test_concurrency_limit_is_enforced():
+    limiter = RateLimiter(max_concurrency=2)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        peak = max(peak, limiter.in_flight)
+        await asyncio.sleep(0.001)
+
+    async def main():
+        await asyncio.gather(*(limiter.run(call) for _ in range(10)))
+
+    asyncio.run(main())
+    assert peak == 2
+
+
+def test_shared_rejects_different_limits():
+    key = ("test", "shared-limits")
+    try:
+        limiter = RateLimiter.shared(key, requests_per_minute=60)
+        assert RateLimiter.shared(key, requests_per_minute=60) is limiter
+        with pytest.raises(ValueError):
+            RateLimiter.shared(key, requests_per_minute=120)
+    finally:
+        RateLimiter._shared.pop(key, None)
@@ -0,0 +1,60 @@
+import asyncio
+import json
+from dillagent.agents.agents import StarterAgent
+from dillagent.agents.executors import ReActAgentExecutor
+from dillagent.dependencies.parsers.intermediate.JsonParser import JsonParser
+from dillagent.dependencies.prompts import MultiInputToolsSysPrompt
+from dillagent.models import DescribedModel, Field
+from dillagent.tools import tool
+
+
+class SearchSchema(DescribedModel):
+    query: str = Field(..., description="What to search for.")
+
+
+@tool(name="Search", description="Searches.", schema=SearchSchema, mode='inline')
+def search(query: str):
+    return f"results for {query}"
+
+
+def make_agent(llm):
+    sys_prompt = MultiInputToolsSysPrompt("Answer questions.", parallel_actions=True, actions_key="calls")
+    return StarterAgent(llm, [search], JsonParser(), sys_prompt, "A question.", name="Agent")
+
+
+def search_turn(*queries):
+    return json.dumps({"calls": [{"action": "Search", "action_input": {"query": query}} for query in queries]})
+
+
+FINAL_TURN = json.dumps({"action": "Final Answer", "action_input": "cats and dogs"})
+
+
+def test_prompt_uses_the_executor_keys(stub_llm):
+    agent = make_agent(stub_llm())
+    assert '"calls": [' in agent.sys_prompt.prompt_str
+    assert '"actions"' not in agent.sys_prompt.prompt_str
+
+
+def test_observations_are_sent_back_until_the_final_answer(stub_llm):
+    llm = stub_llm(replies=[search_turn("cats", "dogs"), FINAL_TURN])
+    executor = ReActAgentExecutor(make_agent(llm), actions_key="calls", tool_output_key="observation")
+
+    output = asyncio.run(executor.run({"Agent_input": "What pets are there?"}))
+    assert output == {
+        "observation": ["results for cats", "results for dogs"],
+        "action": "Final Answer",
+        "action_input": "cats and dogs",
+    }
+    assert llm.calls == 2
+    observation = llm.messages[3]["content"]
+    assert observation.startswith("Observation: ")
+    assert [result["observation"] for result in json.loads(observation[len("Observation: "):])] == ["results for cats", "results for dogs"]
+
+
+def test_the_loop_stops_at_max_steps(stub_llm):
+    llm = stub_llm(replies=[search_turn("cats")] * 3)
+    executor = ReActAgentExecutor(make_agent(llm), actions_key="calls", max_steps=2)
+
+    output = asyncio.run(executor.run({"Agent_input": "What pets are there?"}))
+    assert output["stop_reason"] == "max_steps"
+    assert llm.calls == 2
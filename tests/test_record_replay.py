@@ -0,0 +1,49 @@
+import asyncio
+import pytest
+from dillagent.dependencies.memory.SlidingWindowMemory import SlidingWindowMemory
+from dillagent.llm import RecordingLLM, RecordingStore, ReplayLLM
+
+
+PROMPTS = [f"question {i}" for i in range(6)]
+
+
+def record(llm_class, store, memory=None):
+    llm = RecordingLLM(llm_class(memory=memory), store)
+    llm.add_sys_prompt("You are a test.")
+
+    async def main():
+        return [await llm.run(prompt) for prompt in PROMPTS]
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("memory", [None, SlidingWindowMemory(3)])
+def test_round_trip(tmp_path, stub_llm, memory):
+    store = RecordingStore(str(tmp_path / "recordings.db"))
+    recorded = record(stub_llm, store, memory)
+
+    replay = ReplayLLM(store, memory=memory)
+    replay.add_sys_prompt("You are a test.")
+
+    async def main():
+        return [await replay.run(prompt) for prompt in PROMPTS]
+
+    assert asyncio.run(main()) == recorded
+    assert replay.misses == 0
+    store.close()
+
+
+def test_miss_leaves_history_untouched(tmp_path, stub_llm):
+    store = RecordingStore(str(tmp_path / "recordings.db"))
+    recorded = record(stub_llm, store)
+
+    replay = ReplayLLM(store)
+    replay.add_sys_prompt("You are a test.")
+
+    async def main():
+        with pytest.raises(KeyError):
+            await replay.run("not recorded")
+        return await replay.run(PROMPTS[0])
+
+    assert asyncio.run(main()) == recorded[0]
+    store.close()
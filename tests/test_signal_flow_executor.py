@@ -0,0 +1,148 @@
+import asyncio
+import json
+import time
+import pytest
+from dillagent.workflows.signalFlows.executors import BaseSignalFlowExecutor
+from dillagent.workflows.signalFlows.signalFlows import BaseSignal, BaseSignalFlow, SignalPool
+
+
+class EchoExecutor:
+    def __init__(self, fail_on=None):
+        self.calls = 0
+        self.fail_on = fail_on
+
+    async def run(self, inputs):
+        self.calls += 1
+        if self.fail_on is not None and inputs.get("value") == self.fail_on:
+            raise RuntimeError("flow failed")
+        return dict(inputs)
+
+
+def test_rerun_after_a_flow_error():
+    executor = EchoExecutor(fail_on="bad")
+    signal_executor = BaseSignalFlowExecutor(num_workers=2)
+    signal_executor.register(BaseSignalFlow("Echo", executor, ["start"]))
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            await signal_executor.run([BaseSignal.spawn("start", {"value": "bad"})])
+        await asyncio.wait_for(signal_executor.run([BaseSignal.spawn("start", {"value": "good"})]), timeout=1)
+
+    asyncio.run(main())
+    assert executor.calls == 2
+
+
+def test_successive_event_loops():
+    executor = EchoExecutor()
+    signal_executor = BaseSignalFlowExecutor(num_workers=2, max_queue_size=1)
+    signal_executor.register(BaseSignalFlow("Echo", executor, ["start"]))
+    signals = lambda: [BaseSignal.spawn("start", {"value": i}) for i in range(3)]
+
+    asyncio.run(signal_executor.run(signals()))
+    asyncio.run(signal_executor.run(signals()))
+    assert executor.calls == 6
+
+
+def test_duplicate_subscription_handles_each_signal_once():
+    executor = EchoExecutor()
+    signal_executor = BaseSignalFlowExecutor()
+    signal_executor.register(BaseSignalFlow("Echo", executor, ["start", "start"]))
+
+    asyncio.run(signal_executor.run([BaseSignal.spawn("start", {"value": 1})]))
+    assert executor.calls == 1
+
+
+def test_outputs_trigger_downstream_flows():
+    received = []
+
+    class Collector(BaseSignalFlow):
+        async def handle_signal(self, signal):
+            received.append((signal.source, dict(signal.payload)))
+            return []
+
+    signal_executor = BaseSignalFlowExecutor()
+    signal_executor.register(BaseSignalFlow("A", EchoExecutor(), ["start"]))
+    signal_executor.register(BaseSignalFlow("B", EchoExecutor(), ["start"]))
+    signal_executor.register(Collector("C", None, ["A.output", "B.output"]))
+
+    asyncio.run(signal_executor.run([BaseSignal.spawn("start", {"value": 1})]))
+    assert sorted(received) == [("A", {"value": 1}), ("B", {"value": 1})]
+
+
+def test_signals_keep_their_field_types():
+    before = time.time()
+    signal = BaseSignal.spawn("start", {"value": 1})
+    assert isinstance(signal.id, str) and signal.id != BaseSignal.spawn("start", {}).id
+    assert before <= signal.timestamp <= time.time()
+    assert isinstance(signal.payload, dict)
+    assert json.loads(json.dumps(signal.payload)) == {"value": 1}
+
+
+def test_signals_are_frozen_and_payload_changes_are_deprecated():
+    original = {"value": 1}
+    signal = BaseSignal.spawn("start", original)
+    with pytest.raises(AttributeError):
+        signal.type = "other"
+    with pytest.warns(DeprecationWarning):
+        signal.payload["value"] = 2
+    with pytest.warns(DeprecationWarning):
+        signal.payload.update(other=3)
+    assert original == {"value": 1}
+    copy = dict(signal.payload)
+    copy["value"] = 4
+    assert signal.payload == {"value": 2, "other": 3}
+
+
+def test_pool_acquire_and_release():
+    pool = SignalPool(max_size=1)
+    first = pool.acquire("start", {"value": 1})
+    second = pool.acquire("start", {"value": 2})
+    assert pool.stats() == {"created": 2, "reused": 0, "idle": 0}
+
+    first.release()
+    first.release()
+    second.release()
+    # Released signals stay readable until they are reused; the pool keeps at most max_size
+    assert first.payload == {"value": 1}
+    assert pool.stats() == {"created": 2, "reused": 0, "idle": 1}
+
+    first_id = first.id
+    reused = pool.acquire("other", {"value": 3}, source="A")
+    assert reused is first
+    assert (reused.type, reused.payload, reused.source) == ("other", {"value": 3}, "A")
+    assert reused.id != first_id
+    assert pool.stats() == {"created": 2, "reused": 1, "idle": 0}
+
+    # Signals that weren't taken from this pool are ignored
+    pool.release(BaseSignal.spawn("start", {}))
+    assert pool.stats()["idle"] == 0
+
+
+def test_pooled_signals_are_recycled():
+    pool = SignalPool().register("A.output")
+    try:
+        signal_executor = BaseSignalFlowExecutor()
+        signal_executor.register(BaseSignalFlow("A", EchoExecutor(), ["start"]))
+        for _ in range(3):
+            asyncio.run(signal_executor.run([BaseSignal.spawn("start", {"value": 1})]))
+        assert pool.stats() == {"created": 1, "reused": 2, "idle": 1}
+    finally:
+        pool.unregister("A.output")
+
+
+def test_signals_published_before_run_are_handled():
+    executor = EchoExecutor()
+    signal_executor = BaseSignalFlowExecutor()
+    signal_executor.register(BaseSignalFlow("Echo", executor, ["start"]))
+
+    async def main():
+        await signal_executor.publish(BaseSignal.spawn("start", {"value": 1}))
+        await signal_executor.run([BaseSignal.spawn("start", {"value": 2})])
+
+    asyncio.run(main())
+    assert executor.calls == 2
+
+    # Also across event loops, e.g. a signal published from a previous one
+    asyncio.run(signal_executor.publish(BaseSignal.spawn("start", {"value": 3})))
+    asyncio.run(signal_executor.run([]))
+    assert executor.calls == 3
@@ -0,0 +1,82 @@
+import asyncio
+import json
+from dillagent.agents.agents import StarterAgent
+from dillagent.agents.executors import BaseAgentExecutor
+from dillagent.dependencies.parsers.intermediate.JsonParser import JsonParser
+from dillagent.dependencies.policies.error import RetryPolicy
+from dillagent.dependencies.prompts import MultiInputToolsSysPrompt
+from dillagent.models import DescribedModel, Field
+from dillagent.tools import tool
+
+
+class SearchSchema(DescribedModel):
+    query: str = Field(..., description="What to search for.")
+
+
+searches = []
+
+
+@tool(name="Search", description="Searches.", schema=SearchSchema, mode='inline')
+def search(query: str):
+    searches.append(query)
+    return f"results for {query}"
+
+
+def make_agent(llm, **kwargs):
+    return StarterAgent(llm, [search], JsonParser(), MultiInputToolsSysPrompt("Answer questions."), "A question.", name="Agent", **kwargs)
+
+
+def search_turn(query):
+    return json.dumps({"use_tool": True, "action": "Search", "action_input": {"query": query}})
+
+
+async def collect(stream):
+    return [event async for event in stream]
+
+
+def test_astream_retries_under_the_error_policy(stub_llm):
+    llm = stub_llm(replies=[ConnectionError("down"), search_turn("cats")])
+    agent = make_agent(llm, error_policy=RetryPolicy(max_retries=1, base_delay=0, jitter=0))
+
+    events = asyncio.run(collect(agent.astream(prompt="What pets are there?")))
+    assert events[-1] == {"type": "output", "output": json.loads(search_turn("cats"))}
+    assert llm.calls == 2
+    # Only the successful attempt is kept in the history
+    assert [message["role"] for message in llm.messages] == ["system", "user", "assistant"]
+
+
+def test_astream_falls_back_once_the_policy_gives_up(stub_llm):
+    llm = stub_llm(replies=[ConnectionError("down")])
+    fallback = stub_llm(replies=[search_turn("dogs")])
+    agent = make_agent(llm, error_policy=RetryPolicy(max_retries=0), fallback_llm=fallback)
+
+    events = asyncio.run(collect(agent.astream(prompt="What pets are there?")))
+    assert events[-1]["output"]["action_input"] == {"query": "dogs"}
+    assert fallback.calls == 1
+
+
+def test_tools_wait_for_the_parsed_output_by_default(stub_llm):
+    searches.clear()
+    executor = BaseAgentExecutor(make_agent(stub_llm(replies=[search_turn("cats")])), tool_indicator_key="use_tool", tool_output_key="observation")
+
+    events = asyncio.run(collect(executor.astream({"Agent_input": "What pets are there?"})))
+    assert events[-2] == {"type": "observation", "observation": "results for cats"}
+    assert events[-1]["output"]["observation"] == "results for cats"
+    assert searches == ["cats"]
+
+
+def test_early_dispatch_is_redone_when_the_output_differs(stub_llm):
+    searches.clear()
+    executor = BaseAgentExecutor(make_agent(stub_llm()), tool_indicator_key="use_tool", tool_output_key="observation", early_tool_dispatch=True)
+
+    async def events():
+        yield {"type": "field", "name": "use_tool", "value": True}
+        yield {"type": "field", "name": "action", "value": "Search"}
+        yield {"type": "field", "name": "action_input", "value": {"query": "cats"}}
+        await asyncio.sleep(0)
+        yield {"type": "output", "output": json.loads(search_turn("dogs"))}
+
+    executor.agent.astream = lambda **kwargs: events()
+    output = asyncio.run(collect(executor.astream({})))[-1]["output"]
+    assert output["observation"] == "results for dogs"
+    assert searches[-1] == "dogs"
@@ -0,0 +1,20 @@
+import pytest
+from dillagent.dependencies.memory.TokenCounter import TokenCounter
+
+
+def test_estimate_without_tokenizer():
+    counter = TokenCounter(message_overhead=4)
+    assert counter.count("") == 0
+    assert counter.count("abcdefgh") == 2
+    assert counter.count_messages([{"role": "user", "content": "abcde"}]) == 2 + 4
+
+
+def test_counts_with_a_tokenizer():
+    tokenizers = pytest.importorskip("tokenizers")
+    from tokenizers.models import WordLevel
+    from tokenizers.pre_tokenizers import Whitespace
+
+    tokenizer = tokenizers.Tokenizer(WordLevel({"hello": 0, "world": 1, "[UNK]": 2}, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = Whitespace()
+    counter = TokenCounter(tokenizer, message_overhead=0)
+    assert counter.count("hello world again") == 3
@@ -0,0 +1,40 @@
+import asyncio
+import pytest
+from dillagent.models import DescribedModel, Field
+from dillagent.tools import tool
+
+
+class SearchSchema(DescribedModel):
+    query: str = Field(..., description="What to search for.")
+    limit: int = Field(3, description="Number of results.")
+
+
+@tool(name="Search", description="Searches.", schema=SearchSchema, mode='inline')
+def search(query: str, limit: int = 3):
+    return f"{limit} results for {query}"
+
+
+def test_validated_values_are_passed():
+    args, kwargs = search.validate_input({"query": "cats", "limit": "5"})
+    assert args == ()
+    assert kwargs == {"query": "cats", "limit": 5}
+    assert asyncio.run(search.arun(*args, **kwargs)) == "5 results for cats"
+
+
+def test_defaults_are_filled_in():
+    assert search.validate_input({"query": "cats"}) == ((), {"query": "cats", "limit": 3})
+
+
+def test_unknown_arguments_are_rejected():
+    with pytest.raises(ValueError, match="unknown arguments"):
+        search.validate_input({"query": "cats", "sort": "date"})
+
+
+def test_invalid_values_are_rejected():
+    with pytest.raises(ValueError):
+        search.validate_input({"query": "cats", "limit": "many"})
+
+
+def test_single_value_requires_a_single_field():
+    with pytest.raises(ValueError):
+        search.validate_input("cats")
@@ -0,0 +1,28 @@
+import asyncio
+from dillagent.dependencies.policies.execution import ToolExecutionPolicy
+
+
+def test_concurrency_limit_across_event_loops():
+    policy = ToolExecutionPolicy(mode='inline', max_concurrency=1)
+    running = 0
+    peak = 0
+
+    async def work():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return "done"
+
+    async def main():
+        return await asyncio.gather(*(policy.run(work) for _ in range(3)))
+
+    assert asyncio.run(main()) == ["done"] * 3
+    assert asyncio.run(main()) == ["done"] * 3
+    assert peak == 1
+
+
+def test_sync_functions_run_in_threads():
+    policy = ToolExecutionPolicy(mode='thread')
+    assert asyncio.run(policy.run(lambda x: x * 2, 21)) == 42